@@ -65,6 +65,11 @@ class Config:
     DIVES_PER_PAGE: int = 25  # Pagination du journal
     DEFAULT_TANK_VOLUME_L: float = 12.0  # Volume bouteille par défaut
 
+    # ===== EXPORT PDF =====
+    PDF_VECTOR_PROFILE: bool = True  # Profil dessiné en vectoriel (sans matplotlib)
+    PDF_VECTOR_MAX_POINTS: int = 20000  # Au-delà, rendu matplotlib (PNG)
+    PDF_MAP_TILES: bool = True  # Fond OpenStreetMap (réseau), sinon carte vectorielle
+
     # ===== TAGS STANDARDS =====
     STANDARD_TAGS: list = field(default_factory=lambda: [
         "Épave", "Grotte", "Tombant", "Nuit", "Dérivante",
@@ -2,7 +2,8 @@
 Module de gestion de la base de données SQLite pour le journal de plongée.
 
 Architecture : Métriques agrégées + références aux fichiers originaux
-Tables : sites, buddies, tags, dives, dive_tags
+Tables : sites, buddies, tags, dives, dive_tags, cached_dive_data,
+dive_media, species, dive_species (+ index plein texte species_fts)
 """
 
 import sqlite3
@@ -16,15 +17,87 @@ logger = get_logger(__name__)
 
 DB_PATH = config.DB_PATH
 
-
-def get_connection() -> sqlite3.Connection:
+# Index des requêtes de species_recognition sur species / dive_species
+SPECIES_INDEXES = (
+    # get_dive_species : filtre par plongée, tri par date de détection
+    "CREATE INDEX IF NOT EXISTS idx_dive_species_dive_date ON dive_species(dive_id, detection_date DESC)",
+    # get_media_species(_bulk) : filtre par média, tri par confiance puis date
+    "CREATE INDEX IF NOT EXISTS idx_dive_species_media ON dive_species(media_id, confidence_score DESC, detection_date DESC)",
+    # get_species_stats : répartition par source de détection (parcours de l'index seul,
+    # sans tri temporaire ; le regroupement par espèce utilise idx_dive_species_species_id)
+    "CREATE INDEX IF NOT EXISTS idx_dive_species_detected_by ON dive_species(detected_by)",
+    # get_species_by_name : égalité sur les noms communs (le nom scientifique est déjà UNIQUE)
+    "CREATE INDEX IF NOT EXISTS idx_species_common_fr ON species(common_name_fr)",
+    "CREATE INDEX IF NOT EXISTS idx_species_common_en ON species(common_name_en)",
+    # Filtres par catégorie (catalogue, comptage)
+    "CREATE INDEX IF NOT EXISTS idx_species_category ON species(category, scientific_name)",
+)
+
+# Index plein texte des noms (contenu externe : table species, synchronisée par triggers)
+SPECIES_FTS_SCHEMA = (
+    """CREATE VIRTUAL TABLE IF NOT EXISTS species_fts USING fts5(
+        scientific_name, common_name_fr, common_name_en,
+        content='species', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS species_fts_insert AFTER INSERT ON species BEGIN
+        INSERT INTO species_fts(rowid, scientific_name, common_name_fr, common_name_en)
+        VALUES (new.id, new.scientific_name, new.common_name_fr, new.common_name_en);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS species_fts_delete AFTER DELETE ON species BEGIN
+        INSERT INTO species_fts(species_fts, rowid, scientific_name, common_name_fr, common_name_en)
+        VALUES ('delete', old.id, old.scientific_name, old.common_name_fr, old.common_name_en);
+    END""",
+    # Seules les modifications de noms touchent l'index (pas celles du compteur d'observations)
+    "DROP TRIGGER IF EXISTS species_fts_update",
+    """CREATE TRIGGER IF NOT EXISTS species_fts_update_names
+    AFTER UPDATE OF scientific_name, common_name_fr, common_name_en ON species BEGIN
+        INSERT INTO species_fts(species_fts, rowid, scientific_name, common_name_fr, common_name_en)
+        VALUES ('delete', old.id, old.scientific_name, old.common_name_fr, old.common_name_en);
+        INSERT INTO species_fts(rowid, scientific_name, common_name_fr, common_name_en)
+        VALUES (new.id, new.scientific_name, new.common_name_fr, new.common_name_en);
+    END""",
+)
+
+# Compteur d'observations dénormalisé (species.observation_count), tenu à jour par
+# triggers : le classement des espèces les plus observées se lit sur un index
+SPECIES_COUNTER_SCHEMA = (
+    """CREATE TRIGGER IF NOT EXISTS species_observations_insert AFTER INSERT ON dive_species BEGIN
+        UPDATE species SET observation_count = observation_count + 1 WHERE id = new.species_id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS species_observations_delete AFTER DELETE ON dive_species BEGIN
+        UPDATE species SET observation_count = observation_count - 1 WHERE id = old.species_id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS species_observations_update AFTER UPDATE OF species_id ON dive_species BEGIN
+        UPDATE species SET observation_count = observation_count - 1 WHERE id = old.species_id;
+        UPDATE species SET observation_count = observation_count + 1 WHERE id = new.species_id;
+    END""",
+    "CREATE INDEX IF NOT EXISTS idx_species_observations ON species(observation_count DESC)",
+)
+
+
+def get_connection(check_same_thread: bool = True) -> sqlite3.Connection:
     """
     Crée et retourne une connexion à la base de données.
     Active les foreign keys (important pour l'intégrité).
+
+    Journal WAL (mémorisé dans le fichier) : les lectures ne bloquent plus les
+    écritures. synchronous = NORMAL : un commit n'attend plus de fsync ; une
+    coupure de courant peut perdre les dernières transactions, jamais corrompre
+    la base.
+
+    Args:
+        check_same_thread: Interdire l'usage (y compris la fermeture) de la
+            connexion hors du thread qui l'a ouverte
+
+    Returns:
+        Connexion SQLite
     """
     try:
-        conn = sqlite3.connect(DB_PATH)
+        conn = sqlite3.connect(DB_PATH, check_same_thread=check_same_thread)
         conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
         logger.debug(f"Connexion établie à la base de données : {DB_PATH}")
         return conn
     except sqlite3.Error as e:
@@ -36,11 +109,15 @@ def init_database() -> None:
     """
     Initialise la base de données avec toutes les tables nécessaires.
 
-    À appeler UNE SEULE FOIS au premier lancement.
-    Utilise IF NOT EXISTS pour éviter d'écraser des données existantes.
+    Utilise IF NOT EXISTS pour éviter d'écraser des données existantes :
+    appelée à chaque démarrage, elle met aussi à niveau une base existante
+    (colonnes, index, triggers ajoutés depuis sa création). Tout se fait dans
+    une transaction en écriture ouverte dès le début, si bien que deux
+    processus qui démarrent ensemble s'initialisent l'un après l'autre.
     """
     conn = get_connection()
     cursor = conn.cursor()
+    cursor.execute("BEGIN IMMEDIATE")
 
     # Table 1 : Sites de plongée
     cursor.execute("""
@@ -126,6 +203,65 @@ def init_database() -> None:
         )
     """)
 
+    # Table 7 : Médias (photos/vidéos) associés aux plongées
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS dive_media (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            dive_id INTEGER NOT NULL,
+            type TEXT NOT NULL CHECK(type IN ('photo', 'video')),
+            filename TEXT NOT NULL,
+            filepath TEXT NOT NULL,
+            thumbnail_path TEXT,
+            file_size_bytes INTEGER,
+            mime_type TEXT,
+            width INTEGER,
+            height INTEGER,
+            duration_seconds REAL,
+            upload_date TEXT NOT NULL,
+            description TEXT,
+            tags TEXT,
+            FOREIGN KEY (dive_id) REFERENCES dives(id) ON DELETE CASCADE
+        )
+    """)
+
+    # Table 8 : Catalogue d'espèces marines
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS species (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            scientific_name TEXT NOT NULL UNIQUE,
+            common_name_fr TEXT,
+            common_name_en TEXT,
+            category TEXT CHECK(category IN ('poisson', 'corail', 'mollusque',
+                'crustacé', 'échinoderme', 'mammifère', 'reptile', 'autre')),
+            description TEXT,
+            conservation_status TEXT,
+            habitat TEXT,
+            depth_range TEXT,
+            image_url TEXT,
+            created_date TEXT NOT NULL,
+            observation_count INTEGER NOT NULL DEFAULT 0
+        )
+    """)
+
+    # Table 9 : Liaison plongées-espèces (many-to-many)
+    cursor.execute("""
+        CREATE TABLE IF NOT EXISTS dive_species (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            dive_id INTEGER NOT NULL,
+            species_id INTEGER NOT NULL,
+            media_id INTEGER,
+            confidence_score REAL CHECK(confidence_score >= 0 AND confidence_score <= 1),
+            quantity INTEGER DEFAULT 1,
+            notes TEXT,
+            detected_by TEXT CHECK(detected_by IN ('ai', 'manual', 'verified')),
+            detection_date TEXT NOT NULL,
+            FOREIGN KEY (dive_id) REFERENCES dives(id) ON DELETE CASCADE,
+            FOREIGN KEY (species_id) REFERENCES species(id) ON DELETE CASCADE,
+            FOREIGN KEY (media_id) REFERENCES dive_media(id) ON DELETE SET NULL,
+            UNIQUE(dive_id, species_id, media_id)
+        )
+    """)
+
     # ===== INDEX POUR AMÉLIORER LES PERFORMANCES (Phase 2) =====
 
     # Index sur dives.date pour accélérer les tris et filtres par date
@@ -152,11 +288,78 @@ def init_database() -> None:
         ON dives(date DESC, site_id)
     """)
 
+    # Index des médias et des espèces
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_dive_media_dive_id ON dive_media(dive_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_dive_species_dive_id ON dive_species(dive_id)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_dive_species_species_id ON dive_species(species_id)")
+    for sql in SPECIES_INDEXES:
+        cursor.execute(sql)
+
+    _init_species_counter(cursor)
+    _init_species_fts(cursor)
+
     conn.commit()
     conn.close()
     logger.info("✅ Base de données initialisée avec succès (tables + index + cache)")
 
 
+def _init_species_counter(cursor: sqlite3.Cursor) -> None:
+    """
+    Met en place species.observation_count et les triggers qui le tiennent à jour.
+
+    Sur une base créée avant le compteur, la colonne est ajoutée puis
+    remplie à partir de dive_species (dans la transaction d'init_database).
+
+    Args:
+        cursor: Curseur de la transaction d'initialisation
+    """
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(species)")}
+    if 'observation_count' not in columns:
+        cursor.execute("ALTER TABLE species ADD COLUMN observation_count INTEGER NOT NULL DEFAULT 0")
+
+    counter_missing = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'species_observations_insert'"
+    ).fetchone() is None
+    if counter_missing:
+        # Compter les observations existantes avant que les triggers prennent le relais
+        cursor.execute("""
+            UPDATE species SET observation_count = (
+                SELECT COUNT(*) FROM dive_species WHERE dive_species.species_id = species.id
+            )
+        """)
+
+    for sql in SPECIES_COUNTER_SCHEMA:
+        cursor.execute(sql)
+
+
+def _init_species_fts(cursor: sqlite3.Cursor) -> None:
+    """
+    Crée l'index plein texte des noms d'espèces (species_fts) et ses triggers.
+
+    FTS5 peut manquer dans la bibliothèque SQLite : l'échec est alors
+    seulement journalisé (la recherche d'espèces repasse par LIKE).
+
+    Args:
+        cursor: Curseur de la transaction d'initialisation
+    """
+    created = cursor.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'species_fts'"
+    ).fetchone() is None
+
+    cursor.execute("SAVEPOINT species_fts")
+    try:
+        for sql in SPECIES_FTS_SCHEMA:
+            cursor.execute(sql)
+        if created:
+            # Indexer le catalogue existant
+            cursor.execute("INSERT INTO species_fts(species_fts) VALUES ('rebuild')")
+        cursor.execute("RELEASE species_fts")
+    except sqlite3.OperationalError as e:
+        cursor.execute("ROLLBACK TO species_fts")
+        cursor.execute("RELEASE species_fts")
+        logger.warning(f"Recherche plein texte indisponible (FTS5), recherche par LIKE : {e}")
+
+
 def _insert_or_get_entity(
     cursor: sqlite3.Cursor,
     table: str,
@@ -755,6 +958,7 @@ def get_all_sites_with_stats() -> List[Dict[str, Any]]:
     """
     try:
         conn = get_connection()
+        conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
 
         query = """
@@ -779,13 +983,7 @@ def get_all_sites_with_stats() -> List[Dict[str, Any]]:
         """
 
         cursor.execute(query)
-        columns = [description[0] for description in cursor.description]
-        rows = cursor.fetchall()
-
-        sites = []
-        for row in rows:
-            site_dict = dict(zip(columns, row))
-            sites.append(site_dict)
+        sites = [dict(row) for row in cursor]
 
         conn.close()
         logger.debug(f"Récupération de {len(sites)} sites avec statistiques")
@@ -1002,6 +1200,5 @@ def get_all_settings() -> Dict[str, str]:
         return {}
 
 
-# Initialiser la base au premier import (seulement si elle n'existe pas)
-if not DB_PATH.exists():
-    init_database()
+# Initialiser (ou mettre à niveau) la base au premier import
+init_database()
@@ -231,6 +231,7 @@ def get_dive_media(dive_id: int) -> List[Dict[str, Any]]:
         Liste de dictionnaires contenant les informations des médias
     """
     conn = get_connection()
+    conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
     cursor.execute("""
@@ -242,12 +243,8 @@ def get_dive_media(dive_id: int) -> List[Dict[str, Any]]:
         ORDER BY upload_date DESC
     """, (dive_id,))
 
-    columns = [desc[0] for desc in cursor.description]
-    media_list = []
-
-    for row in cursor.fetchall():
-        media_dict = dict(zip(columns, row))
-        media_list.append(media_dict)
+    # sqlite3.Row : conversion en dictionnaire faite en C, sans zip par ligne
+    media_list = [dict(row) for row in cursor]
 
     conn.close()
     return media_list
@@ -265,6 +262,7 @@ def get_all_media(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         Liste de dictionnaires contenant les informations des médias
     """
     conn = get_connection()
+    conn.row_factory = sqlite3.Row
     cursor = conn.cursor()
 
     cursor.execute("""
@@ -278,12 +276,8 @@ def get_all_media(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         LIMIT ? OFFSET ?
     """, (limit, offset))
 
-    columns = [desc[0] for desc in cursor.description]
-    media_list = []
-
-    for row in cursor.fetchall():
-        media_dict = dict(zip(columns, row))
-        media_list.append(media_dict)
+    # sqlite3.Row : conversion en dictionnaire faite en C, sans zip par ligne
+    media_list = [dict(row) for row in cursor]
 
     conn.close()
     return media_list
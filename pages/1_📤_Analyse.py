@@ -1,11 +1,11 @@
 import streamlit as st
 import parser as dive_parser
 import pandas as pd
-import visualizer
+import visualizer_cache
 import analyzer
 import database
 from pathlib import Path
-from validation import validate_uploaded_file, sanitize_filename
+from validation import validate_uploaded_file, sanitize_filename, file_fingerprint
 from config import config
 from logger import get_logger
 
@@ -20,6 +20,19 @@ if st.sidebar.button("🏠 Accueil", use_container_width=True):
 st.sidebar.divider()
 
 
+@st.cache_data(max_entries=16, show_spinner=False)
+def parse_uploaded_file(file_name: str, fingerprint: str, _uploaded_file) -> pd.DataFrame:
+    """
+    Parse un fichier uploadé, avec mise en cache entre les reruns de la page.
+
+    Le cache est indexé par (nom, empreinte du contenu) : un fichier n'est parsé
+    qu'une fois, y compris s'il est uploadé à nouveau, au lieu d'être re-parsé à
+    chaque interaction avec un widget. L'objet fichier lui-même (préfixé par _)
+    n'est pas haché par Streamlit.
+    """
+    return dive_parser.parse_dive_file(_uploaded_file)
+
+
 def render_reset_button() -> None:
     """Affiche un bouton pour réinitialiser l'upload."""
     if st.button("🔄 Analyser une autre plongée", use_container_width=True):
@@ -58,7 +71,7 @@ if uploaded_file is not None:
     # Parser le fichier
     with st.spinner("🔄 Parsing du fichier..."):
         try:
-            df = dive_parser.parse_dive_file(uploaded_file)
+            df = parse_uploaded_file(uploaded_file.name, file_fingerprint(uploaded_file), uploaded_file)
 
             if df.empty:
                 st.error("❌ Erreur : Aucune donnée extraite du fichier")
@@ -100,13 +113,13 @@ if uploaded_file is not None:
 
                 # Graphique
                 try:
-                    fig = visualizer.plot_depth_profile(df)
+                    fig = visualizer_cache.depth_profile_figure(df)
                     st.plotly_chart(fig, use_container_width=True)
                 except Exception as e:
                     st.error(f"❌ Erreur lors de la création du graphique : {str(e)}")
 
                 # Bandeau sécurité SOUS le graphique (version compacte native)
-                speeds = visualizer.calculate_ascent_speed(df)
+                speeds = visualizer_cache.ascent_speeds(df)
                 max_speed = speeds.max()
                 if max_speed < 10.0:
                     st.success(f"🟢 **Plongée sécuritaire** — Vitesse remontée max : {max_speed:.1f} m/min")
@@ -389,7 +402,7 @@ if uploaded_file is not None:
                             # Calculer métriques techniques
                             bottom_time = analyzer.calculate_bottom_time(df)
                             sac_result = analyzer.calculate_sac(df)
-                            speeds = visualizer.calculate_ascent_speed(df)
+                            speeds = visualizer_cache.ascent_speeds(df)
 
                             # Construire le dictionnaire de données
                             dive_data = {
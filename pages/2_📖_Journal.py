@@ -2,6 +2,7 @@ import streamlit as st
 import database
 import media_manager
 import species_recognition
+import visualizer_cache
 import pandas as pd
 from pathlib import Path
 from config import config
@@ -310,7 +311,6 @@ else:
                     try:
                         # Importer les modules nécessaires
                         import parser as dive_parser
-                        import visualizer
                         import analyzer
 
                         # === PHASE 2 : Essayer de charger depuis le cache d'abord ===
@@ -352,11 +352,11 @@ else:
 
                         if not df.empty:
                             # Afficher le graphique
-                            fig = visualizer.plot_depth_profile(df)
+                            fig = visualizer_cache.depth_profile_figure(df)
                             st.plotly_chart(fig, use_container_width=True)
 
                             # Bandeau sécurité
-                            speeds = visualizer.calculate_ascent_speed(df)
+                            speeds = visualizer_cache.ascent_speeds(df)
                             max_speed = speeds.max()
                             if max_speed < 10.0:
                                 st.success(f"🟢 **Plongée sécuritaire** — Vitesse remontée max : {max_speed:.1f} m/min")
@@ -368,7 +368,7 @@ else:
                             col1, col2, col3 = st.columns(3)
 
                             with col1:
-                                paliers = visualizer.detect_safety_stops(df)
+                                paliers = visualizer_cache.safety_stops(df)
                                 st.metric("🛑 Paliers Détectés", len(paliers))
 
                             with col2:
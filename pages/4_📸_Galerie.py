@@ -307,27 +307,17 @@ with tab_gallery:
                                             with st.spinner("Analyse IA en cours..."):
                                                 filepath = Path(media['filepath'])
                                                 if filepath.exists():
-                                                    detected_species = species_recognition.analyze_image_with_ai(filepath)
+                                                    # Catalogue et associations enregistrés en une transaction
+                                                    detected_species = species_recognition.process_image_and_add_species(
+                                                        image_path=filepath,
+                                                        dive_id=media['dive_id'],
+                                                        media_id=media['id'],
+                                                        auto_add=True,
+                                                        confidence_threshold=0.0
+                                                    )
 
                                                     if detected_species:
-                                                        added_count = 0
-                                                        for sp in detected_species:
-                                                            species_id = species_recognition.add_or_get_species(
-                                                                scientific_name=sp.get('scientific_name'),
-                                                                common_name_fr=sp.get('common_name_fr'),
-                                                                common_name_en=sp.get('common_name_en'),
-                                                                category=sp.get('category')
-                                                            )
-
-                                                            if species_id:
-                                                                if species_recognition.add_species_to_dive(
-                                                                    dive_id=media['dive_id'],
-                                                                    species_id=species_id,
-                                                                    media_id=media['id'],
-                                                                    confidence_score=sp.get('confidence', 0.5),
-                                                                    detected_by='ai'
-                                                                ):
-                                                                    added_count += 1
+                                                        added_count = sum(1 for sp in detected_species if sp['added'])
 
                                                         st.success(f"✅ {added_count} espèce(s) ajoutée(s) !")
                                                         st.rerun()
@@ -593,6 +583,7 @@ with tab_upload:
 
                 uploaded_count = 0
                 ai_detections = []
+                ai_images = []  # (fichier temporaire, media_id) des photos à analyser
 
                 for idx, uploaded_file in enumerate(uploaded_files):
                     status_text.text(f"Upload de {uploaded_file.name}...")
@@ -616,17 +607,11 @@ with tab_upload:
                     if media_id:
                         uploaded_count += 1
 
-                        # Analyse IA si activée et c'est une photo
+                        # Analyse IA si activée et c'est une photo (toutes en parallèle après l'upload)
                         if enable_ai_analysis and temp_path.suffix.lower() in ['.jpg', '.jpeg', '.png']:
-                            status_text.text(f"🤖 Analyse IA de {uploaded_file.name}...")
-                            detections = species_recognition.process_image_and_add_species(
-                                image_path=temp_path,
-                                dive_id=selected_dive_id,
-                                media_id=media_id,
-                                auto_add=True,
-                                confidence_threshold=0.7
-                            )
-                            ai_detections.extend(detections)
+                            ai_images.append((temp_path, media_id))
+                            progress_bar.progress((idx + 1) / len(uploaded_files))
+                            continue
 
                     # Nettoyer le fichier temporaire
                     if temp_path.exists():
@@ -634,6 +619,23 @@ with tab_upload:
 
                     progress_bar.progress((idx + 1) / len(uploaded_files))
 
+                if ai_images:
+                    status_text.text(f"🤖 Analyse IA de {len(ai_images)} photo(s)...")
+                    batch_detections = species_recognition.process_images_batch(
+                        image_paths=[path for path, _ in ai_images],
+                        dive_id=selected_dive_id,
+                        media_ids=[media_id for _, media_id in ai_images],
+                        auto_add=True,
+                        confidence_threshold=0.7
+                    )
+                    for detections in batch_detections:
+                        ai_detections.extend(detections)
+
+                    # Nettoyer les fichiers temporaires analysés
+                    for path, _ in ai_images:
+                        if path.exists():
+                            path.unlink()
+
                 status_text.empty()
                 progress_bar.empty()
 
@@ -1,5 +1,6 @@
 import streamlit as st
 import database
+import species_recognition
 from logger import get_logger
 
 logger = get_logger(__name__)
@@ -79,6 +80,7 @@ with st.form("api_key_form"):
             if api_key_input.startswith("sk-ant-"):
                 # Sauvegarder la clé
                 database.save_setting("anthropic_api_key", api_key_input)
+                species_recognition.invalidate_settings_cache()
                 st.success("✅ Clé API sauvegardée avec succès !")
                 logger.info("Clé API Claude configurée")
                 st.rerun()
@@ -89,6 +91,7 @@ with st.form("api_key_form"):
 
     if delete_button:
         database.delete_setting("anthropic_api_key")
+        species_recognition.invalidate_settings_cache()
         st.success("✅ Clé API supprimée")
         logger.info("Clé API Claude supprimée")
         st.rerun()
@@ -128,6 +131,7 @@ selected_model_key = st.selectbox(
 if selected_model_key != current_model:
     if st.button("💾 Sauvegarder le modèle", type="primary"):
         database.save_setting("ai_model", selected_model_key)
+        species_recognition.invalidate_settings_cache()
         st.success(f"✅ Modèle changé vers : {MODEL_OPTIONS[selected_model_key]}")
         logger.info(f"Modèle IA changé vers : {selected_model_key}")
         st.rerun()
@@ -194,6 +198,7 @@ with st.expander("🛠️ Maintenance"):
     if st.button("🔄 Réinitialiser tous les paramètres", type="secondary"):
         if st.session_state.get('confirm_reset'):
             database.delete_setting("anthropic_api_key")
+            species_recognition.invalidate_settings_cache()
             st.success("✅ Paramètres réinitialisés")
             st.session_state.confirm_reset = False
             st.rerun()
@@ -3,11 +3,27 @@ Page Catalogue d'Espèces - Gestion complète de la base de données des espèce
 """
 
 import streamlit as st
+import pandas as pd
 import species_recognition
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+# Catégories d'espèces (ordre d'affichage des listes déroulantes)
+CATEGORIES = ('poisson', 'corail', 'mollusque', 'crustacé',
+              'échinoderme', 'mammifère', 'reptile', 'autre')
+CATEGORY_INDEX = {category: idx for idx, category in enumerate(CATEGORIES)}
+
+# Colonnes affichées dans le tableau de la liste (clé SQL -> libellé)
+TABLE_COLUMNS = {
+    'scientific_name': "Nom scientifique",
+    'common_name_fr': "Nom français",
+    'category': "Catégorie",
+    'conservation_status': "Statut",
+    'habitat': "Habitat",
+    'depth_range': "Profondeur"
+}
+
 # Configuration page
 st.set_page_config(
     page_title="Catalogue d'Espèces",
@@ -20,10 +36,65 @@ if st.sidebar.button("🏠 Accueil", use_container_width=True):
     st.switch_page("app.py")
 st.sidebar.divider()
 
+
+@st.cache_data(ttl=60)
+def _cached_stats():
+    """Statistiques du catalogue, partagées entre les reruns de la page."""
+    return species_recognition.get_species_stats()
+
+
+@st.cache_data(ttl=60)
+def _cached_species_page(search_query, category, limit, offset):
+    """Une page d'espèces (recherche ou liste complète) pour un filtre donné."""
+    if search_query:
+        return species_recognition.search_species(search_query, category=category,
+                                                  limit=limit, offset=offset)
+    return species_recognition.get_all_species(limit=limit, offset=offset, category=category)
+
+
+@st.cache_data(ttl=60)
+def _cached_species_count(search_query, category):
+    """Nombre total d'espèces pour un filtre donné (pagination)."""
+    return species_recognition.count_species(category=category, search_query=search_query)
+
+
+def _invalidate_caches():
+    """Vide les caches après une modification du catalogue."""
+    _cached_stats.clear()
+    _cached_species_page.clear()
+    _cached_species_count.clear()
+
+
+@st.dialog("Confirmer la suppression")
+def confirm_delete_dialog(species):
+    """Fenêtre de confirmation, construite uniquement quand une suppression est demandée."""
+    st.warning(f"⚠️ Êtes-vous sûr de vouloir supprimer **{species['scientific_name']}** ? "
+               "Toutes les observations associées seront également supprimées.")
+
+    conf_col1, conf_col2 = st.columns(2)
+    with conf_col1:
+        if st.button("✅ Confirmer la suppression", type="primary", use_container_width=True):
+            if species_recognition.delete_species(species['id']):
+                _invalidate_caches()
+                # Réinitialiser la sélection du tableau (la ligne n'existe plus)
+                st.session_state.pop('species_table', None)
+                st.toast(f"✅ {species['scientific_name']} supprimé !")
+                st.rerun()
+            else:
+                st.error("❌ Erreur lors de la suppression")
+    with conf_col2:
+        if st.button("❌ Annuler", use_container_width=True):
+            st.rerun()
+
+
 st.title("🐠 Catalogue des Espèces Marines")
 
 # Statistiques globales
-stats = species_recognition.get_species_stats()
+stats = _cached_stats()
+
+# Nombre d'observations par espèce, indexé par nom scientifique
+obs_by_name = {sp['scientific_name']: sp.get('observation_count', 0)
+               for sp in stats.get('top_species', [])}
 
 col1, col2, col3, col4 = st.columns(4)
 with col1:
@@ -59,8 +130,7 @@ with tab_list:
     with col2:
         filter_category = st.selectbox(
             "Catégorie",
-            ["Toutes"] + ['poisson', 'corail', 'mollusque', 'crustacé',
-                          'échinoderme', 'mammifère', 'reptile', 'autre'],
+            ("Toutes",) + CATEGORIES,
             key="filter_category"
         )
 
@@ -74,100 +144,87 @@ with tab_list:
             key="items_per_page"
         )
 
-    # Récupérer les espèces
-    if search_query and len(search_query) >= 2:
-        # Mode recherche
-        category_filter = None if filter_category == "Toutes" else filter_category
-        all_species = species_recognition.search_species(search_query, category=category_filter, limit=100)
-    else:
-        # Mode liste complète
-        category_filter = None if filter_category == "Toutes" else filter_category
-        all_species = species_recognition.get_all_species(limit=1000, category=category_filter)
+    # Récupérer les espèces (mode recherche à partir de 2 caractères, sinon liste complète)
+    category_filter = None if filter_category == "Toutes" else filter_category
+    active_query = search_query if search_query and len(search_query) >= 2 else None
+    total_items = _cached_species_count(active_query, category_filter)
 
-    if not all_species:
+    if total_items == 0:
         st.info("📭 Aucune espèce trouvée.")
     else:
-        # Pagination
-        total_items = len(all_species)
+        # Pagination côté SQL : seule la page affichée est récupérée
         total_pages = (total_items - 1) // items_per_page + 1
 
         if 'species_page' not in st.session_state:
             st.session_state.species_page = 1
+        st.session_state.species_page = min(st.session_state.species_page, total_pages)
 
         st.caption(f"**{total_items} espèce(s) trouvée(s)**")
 
         # Afficher les espèces de la page actuelle
-        start_idx = (st.session_state.species_page - 1) * items_per_page
-        end_idx = min(start_idx + items_per_page, total_items)
-        page_species = all_species[start_idx:end_idx]
+        offset = (st.session_state.species_page - 1) * items_per_page
+        page_species = _cached_species_page(active_query, category_filter, items_per_page, offset)
+
+        # Tableau compact de la page : un seul composant, les détails ne sont
+        # construits que pour l'espèce sélectionnée
+        df_page = pd.DataFrame(page_species, columns=list(TABLE_COLUMNS))
+        event = st.dataframe(
+            df_page,
+            hide_index=True,
+            use_container_width=True,
+            column_config=TABLE_COLUMNS,
+            on_select="rerun",
+            selection_mode="single-row",
+            key="species_table"
+        )
 
-        # Affichage en tableau avec actions
-        for species in page_species:
-            with st.expander(f"🐠 **{species['common_name_fr'] or species['scientific_name']}** ({species['scientific_name']})"):
+        selected_rows = [row for row in event.selection.rows if row < len(page_species)]
+        species = page_species[selected_rows[0]] if selected_rows else None
 
-                # Informations de l'espèce
-                col1, col2 = st.columns(2)
+        if species is None:
+            st.caption("Sélectionnez une espèce dans le tableau pour afficher ses détails.")
+        else:
+            st.markdown(f"#### 🐠 {species['common_name_fr'] or species['scientific_name']} "
+                        f"({species['scientific_name']})")
 
-                with col1:
-                    st.markdown(f"**Nom scientifique:** {species['scientific_name']}")
-                    st.markdown(f"**Nom français:** {species['common_name_fr'] or 'Non renseigné'}")
-                    st.markdown(f"**Nom anglais:** {species['common_name_en'] or 'Non renseigné'}")
-                    st.markdown(f"**Catégorie:** {species['category']}")
+            # Informations de l'espèce
+            col1, col2 = st.columns(2)
 
-                with col2:
-                    st.markdown(f"**Statut conservation:** {species['conservation_status'] or 'Non renseigné'}")
-                    st.markdown(f"**Habitat:** {species['habitat'] or 'Non renseigné'}")
-                    st.markdown(f"**Profondeur:** {species['depth_range'] or 'Non renseigné'}")
+            with col1:
+                st.markdown(f"**Nom scientifique:** {species['scientific_name']}")
+                st.markdown(f"**Nom français:** {species['common_name_fr'] or 'Non renseigné'}")
+                st.markdown(f"**Nom anglais:** {species['common_name_en'] or 'Non renseigné'}")
+                st.markdown(f"**Catégorie:** {species['category']}")
 
-                if species['description']:
-                    st.markdown(f"**Description:**\n{species['description']}")
+            with col2:
+                st.markdown(f"**Statut conservation:** {species['conservation_status'] or 'Non renseigné'}")
+                st.markdown(f"**Habitat:** {species['habitat'] or 'Non renseigné'}")
+                st.markdown(f"**Profondeur:** {species['depth_range'] or 'Non renseigné'}")
 
-                st.markdown("---")
+            if species['description']:
+                st.markdown(f"**Description:**\n{species['description']}")
 
-                # Boutons d'action
-                action_col1, action_col2, action_col3 = st.columns(3)
+            st.markdown("---")
 
-                with action_col1:
-                    if st.button("✏️ Modifier", key=f"edit_{species['id']}", use_container_width=True):
-                        st.session_state['editing_species_id'] = species['id']
-                        st.rerun()
+            # Boutons d'action
+            action_col1, action_col2, action_col3 = st.columns(3)
 
-                with action_col2:
-                    # Compter les observations
-                    obs_count = sum(1 for sp in stats.get('top_species', [])
-                                  if sp['scientific_name'] == species['scientific_name'])
-                    st.button(f"👁️ {obs_count} observation(s)",
-                            key=f"obs_{species['id']}",
-                            disabled=True,
-                            use_container_width=True)
-
-                with action_col3:
-                    if st.button("🗑️ Supprimer", key=f"del_{species['id']}", type="secondary", use_container_width=True):
-                        st.session_state[f'confirm_delete_{species["id"]}'] = True
-
-                # Confirmation de suppression
-                if st.session_state.get(f'confirm_delete_{species["id"]}', False):
-                    st.warning(f"⚠️ Êtes-vous sûr de vouloir supprimer **{species['scientific_name']}** ? "
-                             "Toutes les observations associées seront également supprimées.")
-
-                    conf_col1, conf_col2 = st.columns(2)
-                    with conf_col1:
-                        if st.button("✅ Confirmer la suppression",
-                                   key=f"confirm_del_{species['id']}",
-                                   type="primary",
-                                   use_container_width=True):
-                            if species_recognition.delete_species(species['id']):
-                                st.success(f"✅ {species['scientific_name']} supprimé !")
-                                st.session_state[f'confirm_delete_{species["id"]}'] = False
-                                st.rerun()
-                            else:
-                                st.error("❌ Erreur lors de la suppression")
-                    with conf_col2:
-                        if st.button("❌ Annuler",
-                                   key=f"cancel_del_{species['id']}",
-                                   use_container_width=True):
-                            st.session_state[f'confirm_delete_{species["id"]}'] = False
-                            st.rerun()
+            with action_col1:
+                if st.button("✏️ Modifier", key=f"edit_{species['id']}", use_container_width=True):
+                    st.session_state['editing_species_id'] = species['id']
+                    st.rerun()
+
+            with action_col2:
+                # Compter les observations
+                obs_count = obs_by_name.get(species['scientific_name'], 0)
+                st.button(f"👁️ {obs_count} observation(s)",
+                        key=f"obs_{species['id']}",
+                        disabled=True,
+                        use_container_width=True)
+
+            with action_col3:
+                if st.button("🗑️ Supprimer", key=f"del_{species['id']}", type="secondary", use_container_width=True):
+                    confirm_delete_dialog(species)
 
         # Formulaire d'édition (modal)
         if 'editing_species_id' in st.session_state:
@@ -187,10 +244,8 @@ with tab_list:
                         edit_en = st.text_input("Nom anglais", value=species_data['common_name_en'] or '')
                         edit_cat = st.selectbox(
                             "Catégorie *",
-                            ['poisson', 'corail', 'mollusque', 'crustacé',
-                             'échinoderme', 'mammifère', 'reptile', 'autre'],
-                            index=['poisson', 'corail', 'mollusque', 'crustacé',
-                                   'échinoderme', 'mammifère', 'reptile', 'autre'].index(species_data['category'])
+                            CATEGORIES,
+                            index=CATEGORY_INDEX.get(species_data['category'], 0)
                         )
 
                     with col2:
@@ -222,6 +277,7 @@ with tab_list:
                             depth_range=edit_depth,
                             image_url=edit_url
                         ):
+                            _invalidate_caches()
                             st.success("✅ Espèce mise à jour !")
                             del st.session_state['editing_species_id']
                             st.rerun()
@@ -261,8 +317,7 @@ with tab_add:
             new_en = st.text_input("Nom anglais", key="add_en")
             new_cat = st.selectbox(
                 "Catégorie *",
-                ['poisson', 'corail', 'mollusque', 'crustacé',
-                 'échinoderme', 'mammifère', 'reptile', 'autre'],
+                CATEGORIES,
                 key="add_cat"
             )
 
@@ -297,6 +352,7 @@ with tab_add:
                 )
 
                 if species_id:
+                    _invalidate_caches()
                     st.success(f"✅ Espèce **{new_sci}** ajoutée avec succès ! (ID: {species_id})")
                     logger.info(f"Nouvelle espèce ajoutée : {new_sci} (ID={species_id})")
                 else:
@@ -311,7 +367,6 @@ with tab_stats:
     if stats['category_stats']:
         st.markdown("#### 📂 Répartition par catégorie")
 
-        import pandas as pd
         df_categories = pd.DataFrame([
             {'Catégorie': cat.capitalize(), 'Nombre': count}
             for cat, count in stats['category_stats'].items()
@@ -5,18 +5,143 @@ Ce module définit une architecture extensible pour parser différents formats
 de fichiers de plongée (FIT, XML, UDDF, DL7) vers un DataFrame pandas unifié.
 """
 
+import os
 import pandas as pd
 import numpy as np
-from pathlib import Path
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from fitparse import FitFile
-from io import BytesIO
+from io import BytesIO, IOBase
 import xml.etree.ElementTree as ET
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union, BinaryIO
 from logger import get_logger
 
 logger = get_logger(__name__)
 
+# Colonnes du DataFrame standardisé produit par tous les parsers
+PROFILE_COLUMNS = (
+    'temps_secondes',
+    'profondeur_metres',
+    'temperature_celsius',
+    'pression_bouteille_bar'
+)
+
+# Types compacts : le temps tient en int32 (24 h = 86 400 s) et les mesures
+# (profondeur, température, pression) n'ont pas besoin de la précision float64
+PROFILE_DTYPES = {
+    'temps_secondes': np.int32,
+    'profondeur_metres': np.float32,
+    'temperature_celsius': np.float32,
+    'pression_bouteille_bar': np.float32
+}
+
+
+@lru_cache(maxsize=256)
+def _local_tag(tag: str) -> str:
+    """
+    Retourne le nom local d'une balise XML, sans son namespace.
+
+    Un fichier ne contient qu'une poignée de balises distinctes répétées sur
+    chaque waypoint : le résultat est mis en cache pour éviter un découpage de
+    chaîne par élément.
+    """
+    return tag.rsplit('}', 1)[-1]
+
+
+def _empty_profile() -> pd.DataFrame:
+    """Retourne un DataFrame vide avec les colonnes et types standardisés."""
+    return pd.DataFrame({
+        column: np.empty(0, dtype=dtype) for column, dtype in PROFILE_DTYPES.items()
+    })
+
+
+def _downcast_profile(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Convertit les colonnes du profil vers les types compacts de PROFILE_DTYPES.
+
+    Les mesures passent en float32. Le temps n'est converti en int32 que s'il ne
+    contient que des secondes entières, pour ne rien perdre sur les formats
+    génériques à secondes fractionnaires. Sans effet si les types sont déjà bons.
+    """
+    for column, dtype in PROFILE_DTYPES.items():
+        if column not in df.columns or df[column].dtype == dtype:
+            continue
+
+        values = df[column].to_numpy()
+        if np.issubdtype(dtype, np.integer):
+            if not (np.isfinite(values).all() and np.array_equal(values, np.trunc(values))):
+                continue
+
+        df[column] = values.astype(dtype)
+
+    return df
+
+
+def _sort_by_time(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Trie le profil par temps uniquement s'il n'est pas déjà chronologique.
+
+    La vérification de monotonie est une simple passe O(N), alors que le tri
+    coûte O(N log N) plus une copie complète du DataFrame.
+    """
+    if df['temps_secondes'].is_monotonic_increasing:
+        return df
+    return df.sort_values('temps_secondes', kind='mergesort').reset_index(drop=True)
+
+
+def _finalize_points(timestamps_ns: np.ndarray, depth, temp, press) -> pd.DataFrame:
+    """
+    Assemble les colonnes brutes d'un profil en DataFrame standardisé.
+
+    Le temps écoulé depuis le premier point est calculé en une seule opération
+    NumPy sur les timestamps entiers (nanosecondes), sans boucle Python.
+
+    Args:
+        timestamps_ns: Timestamps absolus en nanosecondes (int64)
+        depth: Profondeurs en mètres
+        temp: Températures en °C
+        press: Pressions bouteille en bar
+
+    Returns:
+        DataFrame avec colonnes : temps_secondes, profondeur_metres,
+        temperature_celsius, pression_bouteille_bar
+    """
+    if timestamps_ns.size:
+        temps_secondes = (timestamps_ns - timestamps_ns[0]) // 1_000_000_000
+    else:
+        temps_secondes = timestamps_ns
+
+    return pd.DataFrame({
+        'temps_secondes': temps_secondes.astype(np.int32, copy=False),
+        'profondeur_metres': np.asarray(depth, dtype=np.float32),
+        'temperature_celsius': np.asarray(temp, dtype=np.float32),
+        'pression_bouteille_bar': np.asarray(press, dtype=np.float32)
+    })
+
+
+class _BorrowedStream:
+    """
+    Enveloppe en lecture d'un flux appartenant à l'appelant.
+
+    FitFile ferme le fichier qu'on lui donne à sa destruction : cette enveloppe
+    ignore close() pour que le fichier uploadé reste utilisable après le parsing.
+    """
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        return self._stream.read(size)
+
+    def seek(self, offset: int, whence: int = 0) -> int:
+        return self._stream.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self._stream.tell()
+
+    def close(self) -> None:
+        pass
+
 
 class BaseDiveParser(ABC):
     """
@@ -30,14 +155,27 @@ class BaseDiveParser(ABC):
     - pression_bouteille_bar : float (pression restante dans la bouteille)
     """
 
-    def __init__(self, file_content: bytes):
+    def __init__(self, source: Union[bytes, BinaryIO]):
         """
         Initialise le parser avec le contenu du fichier.
 
         Args:
-            file_content: Contenu brut du fichier en bytes
+            source: Contenu brut du fichier en bytes, ou flux binaire seekable
+                (ex : UploadedFile Streamlit) lu directement sans copie préalable
+        """
+        self.source = source
+
+    def _open_stream(self) -> BinaryIO:
+        """
+        Retourne un flux binaire positionné au début du fichier.
+
+        Un flux fourni par l'appelant est relu en place (pas de copie en mémoire)
+        et n'est jamais fermé par le parser.
         """
-        self.file_content = file_content
+        if isinstance(self.source, (bytes, bytearray)):
+            return BytesIO(self.source)
+        self.source.seek(0)
+        return _BorrowedStream(self.source)
 
     @abstractmethod
     def parse(self) -> pd.DataFrame:
@@ -62,12 +200,14 @@ class FitParser(BaseDiveParser):
             DataFrame avec les données de plongée parsées, trié par temps
         """
         try:
-            # Créer un objet FitFile depuis le contenu bytes
-            fitfile = FitFile(BytesIO(self.file_content))
+            # Créer un objet FitFile lisant directement le flux du fichier
+            fitfile = FitFile(self._open_stream())
 
-            # Liste pour stocker les points de données
-            data_points = []
-            first_timestamp = None
+            # Colonnes accumulées au fil des records
+            timestamps = []
+            profondeurs = []
+            temperatures = []
+            pressions = []
 
             # Parcourir tous les messages de type 'record' (points de mesure)
             for record in fitfile.get_messages('record'):
@@ -81,66 +221,39 @@ class FitParser(BaseDiveParser):
                 if 'timestamp' not in record_data:
                     continue
 
-                # Initialiser le premier timestamp pour calculer le temps relatif
-                if first_timestamp is None:
-                    first_timestamp = record_data['timestamp']
+                timestamps.append(record_data['timestamp'])
 
-                # Calculer le temps écoulé en secondes depuis le début de la plongée
-                time_delta = (record_data['timestamp'] - first_timestamp).total_seconds()
-
-                # Extraire les données (avec valeurs par défaut si absent)
+                # Extraire les données brutes (None ou absentes -> NaN) : la conversion
+                # en float32 est faite en une fois par NumPy dans _finalize_points
                 # La profondeur peut être sous différents noms selon le modèle
-                depth = record_data.get('depth', np.nan)
-                if depth is not None and not isinstance(depth, float):
-                    depth = float(depth)
+                profondeurs.append(record_data.get('depth'))
 
                 # Température
-                temperature = record_data.get('temperature', np.nan)
-                if temperature is not None and not isinstance(temperature, float):
-                    temperature = float(temperature)
+                temperatures.append(record_data.get('temperature'))
 
                 # Pression bouteille (peut varier selon le modèle Garmin)
                 # Chercher différents noms possibles
-                tank_pressure = record_data.get('tank_pressure',
-                               record_data.get('pressure',
-                               record_data.get('cylinder_pressure', np.nan)))
-                if tank_pressure is not None and not isinstance(tank_pressure, float):
-                    tank_pressure = float(tank_pressure)
-
-                # Ajouter le point de données
-                data_points.append({
-                    'temps_secondes': int(time_delta),
-                    'profondeur_metres': depth,
-                    'temperature_celsius': temperature,
-                    'pression_bouteille_bar': tank_pressure
-                })
-
-            # Créer le DataFrame
-            df = pd.DataFrame(data_points)
+                pressions.append(record_data.get('tank_pressure',
+                                 record_data.get('pressure',
+                                 record_data.get('cylinder_pressure'))))
+
+            # Créer le DataFrame (temps relatifs calculés en une passe vectorisée)
+            timestamps_ns = np.array(timestamps, dtype='datetime64[ns]').view(np.int64)
+            df = _finalize_points(timestamps_ns, profondeurs, temperatures, pressions)
 
             # S'assurer que le DataFrame a les bonnes colonnes même s'il est vide
             if df.empty:
-                df = pd.DataFrame(columns=[
-                    'temps_secondes',
-                    'profondeur_metres',
-                    'temperature_celsius',
-                    'pression_bouteille_bar'
-                ])
+                df = _empty_profile()
             else:
-                # Trier par temps
-                df = df.sort_values('temps_secondes').reset_index(drop=True)
+                # Trier par temps (les records sont normalement déjà chronologiques)
+                df = _sort_by_time(df)
 
             return df
 
         except Exception as e:
             # En cas d'erreur, logger et retourner DataFrame vide
             logger.error(f"Erreur lors du parsing FIT : {e}", exc_info=True)
-            return pd.DataFrame(columns=[
-                'temps_secondes',
-                'profondeur_metres',
-                'temperature_celsius',
-                'pression_bouteille_bar'
-            ])
+            return _empty_profile()
 
 
 class XmlParser(BaseDiveParser):
@@ -175,12 +288,12 @@ class XmlParser(BaseDiveParser):
             logger.info("Parsing fichier XML générique...")
 
             # Parser le XML
-            root = ET.fromstring(self.file_content)
+            root = ET.parse(self._open_stream()).getroot()
 
             # Essayer d'abord de parser comme UDDF (cas le plus courant)
             if self._is_uddf(root):
                 logger.info("Fichier XML détecté comme UDDF, utilisation du parser UDDF")
-                uddf_parser = UddfParser(self.file_content)
+                uddf_parser = UddfParser(self.source)
                 return uddf_parser.parse()
 
             # Sinon, chercher les waypoints/samples génériques
@@ -188,38 +301,31 @@ class XmlParser(BaseDiveParser):
 
             if not data_points:
                 logger.warning("Aucune donnée trouvée dans le fichier XML")
-                return pd.DataFrame(columns=[
-                    'temps_secondes',
-                    'profondeur_metres',
-                    'temperature_celsius',
-                    'pression_bouteille_bar'
-                ])
-
-            # Créer le DataFrame
-            df = pd.DataFrame(data_points)
+                return _empty_profile()
+
+            # Créer le DataFrame colonne par colonne (évite l'inspection ligne à ligne
+            # qu'impose une liste de dictionnaires). Le temps reste en float : les
+            # formats génériques peuvent contenir des secondes fractionnaires.
+            df = pd.DataFrame({
+                column: np.array(
+                    [point[column] for point in data_points],
+                    dtype=np.float64 if column == 'temps_secondes' else PROFILE_DTYPES[column]
+                )
+                for column in PROFILE_COLUMNS
+            })
 
             # Trier par temps
-            df = df.sort_values('temps_secondes').reset_index(drop=True)
+            df = _sort_by_time(df)
 
             logger.info(f"XML parsé avec succès : {len(df)} points de données")
             return df
 
         except ET.ParseError as e:
             logger.error(f"Erreur de parsing XML : {e}", exc_info=True)
-            return pd.DataFrame(columns=[
-                'temps_secondes',
-                'profondeur_metres',
-                'temperature_celsius',
-                'pression_bouteille_bar'
-            ])
+            return _empty_profile()
         except Exception as e:
             logger.error(f"Erreur lors du parsing XML : {e}", exc_info=True)
-            return pd.DataFrame(columns=[
-                'temps_secondes',
-                'profondeur_metres',
-                'temperature_celsius',
-                'pression_bouteille_bar'
-            ])
+            return _empty_profile()
 
     def _is_uddf(self, root: ET.Element) -> bool:
         """Détecte si le XML est au format UDDF."""
@@ -331,6 +437,9 @@ class XmlParser(BaseDiveParser):
 class UddfParser(BaseDiveParser):
     """Parser pour les fichiers UDDF (Universal Dive Data Format)."""
 
+    # Balises lues dans chaque waypoint (noms locaux, sans namespace)
+    WAYPOINT_TAGS = ('divetime', 'depth', 'temperature', 'tankpressure', 'pressure')
+
     def parse(self) -> pd.DataFrame:
         """
         Parse un fichier UDDF et extrait les données de plongée.
@@ -357,88 +466,67 @@ class UddfParser(BaseDiveParser):
             DataFrame avec les données de plongée parsées, trié par temps
         """
         try:
-            # Parser le XML depuis le contenu bytes
-            root = ET.fromstring(self.file_content)
-
-            # Liste pour stocker les points de données
-            data_points = []
-
-            # Trouver tous les waypoints (points de mesure) dans le fichier
-            # Le './/{*}waypoint' recherche récursivement tous les éléments waypoint en ignorant les namespaces
-            waypoints = root.findall('.//{*}waypoint')
-
-            for waypoint in waypoints:
-                # Extraire le temps de plongée (divetime en secondes)
-                divetime_elem = waypoint.find('{*}divetime')
-                if divetime_elem is not None and divetime_elem.text:
-                    temps_secondes = float(divetime_elem.text)
-                else:
-                    # Si pas de temps, on ne peut pas utiliser ce point
+            # Textes bruts accumulés au fil du parsing, convertis en tableaux NumPy à la fin
+            temps = []
+            profondeurs = []
+            temperatures = []
+            pressions = []
+
+            # Parsing en flux : chaque waypoint est traité dès sa balise fermante,
+            # puis vidé pour ne pas garder tout l'arbre XML en mémoire
+            for _, waypoint in ET.iterparse(self._open_stream()):
+                if _local_tag(waypoint.tag) != 'waypoint':
                     continue
 
-                # Extraire la profondeur (depth en mètres)
-                depth_elem = waypoint.find('{*}depth')
-                profondeur_metres = float(depth_elem.text) if depth_elem is not None and depth_elem.text else np.nan
-
-                # Extraire la température (temperature en Kelvin dans UDDF, conversion en Celsius)
-                temp_elem = waypoint.find('{*}temperature')
-                if temp_elem is not None and temp_elem.text:
-                    temp_kelvin = float(temp_elem.text)
-                    # Conversion Kelvin → Celsius
-                    temperature_celsius = temp_kelvin - 273.15
-                else:
-                    temperature_celsius = np.nan
-
-                # Extraire la pression de la bouteille (tankpressure en bar)
-                # Certains fichiers peuvent utiliser d'autres noms
-                pressure_elem = waypoint.find('{*}tankpressure')
-                if pressure_elem is None:
-                    pressure_elem = waypoint.find('{*}pressure')
-                pression_bouteille_bar = float(pressure_elem.text) if pressure_elem is not None and pressure_elem.text else np.nan
-
-                # Ajouter le point de données
-                data_points.append({
-                    'temps_secondes': int(temps_secondes),
-                    'profondeur_metres': profondeur_metres,
-                    'temperature_celsius': temperature_celsius,
-                    'pression_bouteille_bar': pression_bouteille_bar
-                })
-
-            # Créer le DataFrame
-            df = pd.DataFrame(data_points)
+                # Un seul parcours des enfants directs au lieu de quatre .find()
+                values = dict.fromkeys(self.WAYPOINT_TAGS)
+                for child in waypoint:
+                    tag = _local_tag(child.tag)
+                    if tag in values and child.text:
+                        values[tag] = child.text
+                waypoint.clear()
+
+                # Si pas de temps (divetime), on ne peut pas utiliser ce point
+                if values['divetime'] is None:
+                    continue
+
+                # Les textes sont conservés tels quels (None si absent) et convertis
+                # en bloc par NumPy après la boucle
+                temps.append(values['divetime'])
+                profondeurs.append(values['depth'])
+                temperatures.append(values['temperature'])
+                # Certains fichiers utilisent 'pressure' au lieu de 'tankpressure'
+                pressions.append(values['tankpressure'] or values['pressure'])
+
+            # Créer le DataFrame directement depuis les colonnes :
+            # - divetime en secondes (tronqué à l'entier)
+            # - depth en mètres
+            # - temperature en Kelvin dans UDDF, conversion en Celsius
+            # - tankpressure en bar
+            df = pd.DataFrame({
+                'temps_secondes': np.asarray(temps, dtype=np.float64).astype(np.int32),
+                'profondeur_metres': np.asarray(profondeurs, dtype=np.float32),
+                'temperature_celsius': (np.asarray(temperatures, dtype=np.float64) - 273.15).astype(np.float32),
+                'pression_bouteille_bar': np.asarray(pressions, dtype=np.float32)
+            })
 
             # S'assurer que le DataFrame a les bonnes colonnes même s'il est vide
             if df.empty:
-                df = pd.DataFrame(columns=[
-                    'temps_secondes',
-                    'profondeur_metres',
-                    'temperature_celsius',
-                    'pression_bouteille_bar'
-                ])
+                df = _empty_profile()
             else:
-                # Trier par temps
-                df = df.sort_values('temps_secondes').reset_index(drop=True)
+                # Trier par temps (les records sont normalement déjà chronologiques)
+                df = _sort_by_time(df)
 
             return df
 
         except ET.ParseError as e:
             # Erreur de parsing XML
             logger.error(f"Erreur de parsing XML UDDF : {e}", exc_info=True)
-            return pd.DataFrame(columns=[
-                'temps_secondes',
-                'profondeur_metres',
-                'temperature_celsius',
-                'pression_bouteille_bar'
-            ])
+            return _empty_profile()
         except Exception as e:
             # Autres erreurs
             logger.error(f"Erreur lors du parsing UDDF : {e}", exc_info=True)
-            return pd.DataFrame(columns=[
-                'temps_secondes',
-                'profondeur_metres',
-                'temperature_celsius',
-                'pression_bouteille_bar'
-            ])
+            return _empty_profile()
 
 
 class Dl7Parser(BaseDiveParser):
@@ -451,12 +539,16 @@ class Dl7Parser(BaseDiveParser):
         TODO: Implémenter parsing DL7
         """
         # Retourne DataFrame vide avec la structure attendue
-        return pd.DataFrame(columns=[
-            'temps_secondes',
-            'profondeur_metres',
-            'temperature_celsius',
-            'pression_bouteille_bar'
-        ])
+        return _empty_profile()
+
+
+# Parser à utiliser pour chaque extension de fichier supportée
+PARSERS = {
+    '.fit': FitParser,
+    '.xml': XmlParser,
+    '.uddf': UddfParser,
+    '.dl7': Dl7Parser
+}
 
 
 def parse_dive_file(uploaded_file) -> pd.DataFrame:
@@ -464,7 +556,9 @@ def parse_dive_file(uploaded_file) -> pd.DataFrame:
     Détecte le format du fichier et utilise le parser approprié.
 
     Args:
-        uploaded_file: Fichier uploadé via Streamlit (avec attributs .name et .read())
+        uploaded_file: Fichier uploadé via Streamlit (avec attributs .name et .read()),
+            ou chemin d'un fichier sur disque (str / Path).
+            Un flux seekable est transmis tel quel au parser, sinon son contenu est lu.
 
     Returns:
         DataFrame avec les données de plongée parsées
@@ -472,32 +566,36 @@ def parse_dive_file(uploaded_file) -> pd.DataFrame:
     Raises:
         ValueError: Si le format de fichier n'est pas supporté
     """
-    # Récupérer l'extension du fichier
-    file_extension = Path(uploaded_file.name).suffix.lower()
-
-    logger.info(f"Parsing du fichier {uploaded_file.name} (extension: {file_extension})")
-
-    # Lire le contenu du fichier
-    file_content = uploaded_file.read()
-
-    # Sélectionner le parser approprié selon l'extension
-    if file_extension == '.fit':
-        parser = FitParser(file_content)
-    elif file_extension == '.xml':
-        parser = XmlParser(file_content)
-    elif file_extension == '.uddf':
-        parser = UddfParser(file_content)
-    elif file_extension == '.dl7':
-        parser = Dl7Parser(file_content)
-    else:
+    is_path = isinstance(uploaded_file, (str, os.PathLike))
+    file_name = os.path.basename(uploaded_file) if is_path else uploaded_file.name
+
+    # Récupérer l'extension du fichier et le parser associé (validé avant toute lecture)
+    file_extension = os.path.splitext(file_name)[1].lower()
+    parser_class = PARSERS.get(file_extension)
+
+    if parser_class is None:
         logger.error(f"Format de fichier non supporté : {file_extension}")
         raise ValueError(f"Format de fichier non supporté : {file_extension}")
 
-    # Parser et retourner le DataFrame
-    df = parser.parse()
+    logger.info(f"Parsing du fichier {file_name} (extension: {file_extension})")
+
+    # Parser et retourner le DataFrame (types compacts quel que soit le parser)
+    if is_path:
+        # Fichier sur disque : lu en flux par le parser, sans copie en mémoire
+        with open(uploaded_file, 'rb') as file_handle:
+            df = _downcast_profile(parser_class(file_handle).parse())
+    else:
+        # Les UploadedFile Streamlit sont des flux seekables : les parsers les lisent
+        # directement, ce qui évite une copie complète du fichier en mémoire
+        if isinstance(uploaded_file, IOBase) and uploaded_file.seekable():
+            source = uploaded_file
+        else:
+            source = uploaded_file.read()
+
+        df = _downcast_profile(parser_class(source).parse())
 
     if df.empty:
-        logger.warning(f"Parsing de {uploaded_file.name} n'a renvoyé aucune donnée")
+        logger.warning(f"Parsing de {file_name} n'a renvoyé aucune donnée")
     else:
         logger.info(f"Parsing réussi : {len(df)} points de données extraits")
 
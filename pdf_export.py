@@ -9,26 +9,34 @@ Génère des rapports PDF complets incluant :
 """
 
 import io
+import os
+import hashlib
+import math
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
 from datetime import datetime
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
-from reportlab.lib.units import cm, mm
+from reportlab.lib.units import cm, mm, inch
 from reportlab.pdfgen import canvas
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.platypus import Paragraph, Table, TableStyle
 from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
+from reportlab.lib.utils import ImageReader
+from reportlab.pdfbase.pdfmetrics import stringWidth
 from PIL import Image as PILImage
-import matplotlib
-matplotlib.use('Agg')  # Backend non-interactif pour génération PDF
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import requests
-from urllib.parse import quote
-import contextily as ctx
-from pyproj import Transformer
+from xml.sax.saxutils import escape
+
+# matplotlib, contextily et pyproj ne sont importés qu'au premier rendu PNG
+# (profil très long ou carte à tuiles) : importer ce module reste léger
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+    from matplotlib.figure import Figure
 
 import database
 import media_manager
@@ -47,11 +55,95 @@ MARGIN_RIGHT = 2 * cm
 MARGIN_TOP = 2 * cm
 MARGIN_BOTTOM = 2 * cm
 CONTENT_WIDTH = PAGE_WIDTH - MARGIN_LEFT - MARGIN_RIGHT
+PDF_WRITE_BUFFER = 1024 * 1024  # Taille du tampon d'écriture (1 Mio)
+
+# Marge intérieure des cellules du tableau de statistiques
+TABLE_PADDING = 6
+
+# Profil : couleurs par classe de vitesse de remontée et proportions du graphique
+PROFILE_PALETTE = (config.COLOR_SAFE, config.COLOR_WARNING, config.COLOR_DANGER)
+PROFILE_ASPECT_RATIO = 5 / 12
+
+# Carte : proportions de la carte vectorielle (identiques à la figure 8 x 4.5)
+MAP_ASPECT_RATIO = 4.5 / 8
+
+# Liste des espèces : emojis par catégorie et libellés du mode de détection
+SPECIES_EMOJIS = {
+    'poisson': '🐟',
+    'corail': '🪸',
+    'mollusque': '🐚',
+    'crustacé': '🦀',
+    'échinoderme': '⭐',
+    'mammifère': '🐋',
+    'reptile': '🐢',
+    'autre': '🌊'
+}
+DETECTION_LABELS = {'ai': '🤖 IA', 'manual': '✍️ Manuel', 'verified': '✓ Vérifié'}
+
+# Styles des blocs de texte multi-lignes
+STATS_TEXT_STYLE = ParagraphStyle('stats_text', fontName='Helvetica', fontSize=10, leading=12)
+NOTES_STYLE = ParagraphStyle('notes', fontName='Helvetica', fontSize=9, leading=12)
+CAPTION_STYLE = ParagraphStyle('caption', fontName='Helvetica-Oblique', fontSize=8,
+                               leading=12, textColor=colors.HexColor("#666666"))
+
+# Galerie photos : boîte d'affichage maximale et résolution d'intégration
+PHOTO_MAX_WIDTH = 12 * cm
+PHOTO_MAX_HEIGHT = 10 * cm
+PHOTO_DPI = 150
+PHOTO_JPEG_QUALITY = 80
 
 # Dossier d'export
 EXPORT_DIR = config.APP_DIR / "exports"
 EXPORT_DIR.mkdir(exist_ok=True)
 
+# Résolution des graphiques matplotlib intégrés en PNG
+GRAPH_DPI = 100
+
+# Cache disque des graphiques rendus en PNG (profil, carte)
+GRAPH_CACHE_DIR = EXPORT_DIR / ".cache"
+
+# Figures matplotlib réutilisées d'un export à l'autre (une par thread, Agg n'étant
+# pas thread-safe) : évite de réallouer les buffers et de réinitialiser les polices
+_figures = threading.local()
+
+# Passe à True au premier échec de téléchargement des tuiles OSM (hors ligne) :
+# les exports suivants du processus passent directement à la carte vectorielle
+_map_tiles_unavailable = False
+
+
+def _get_figure(name: str, figsize: Tuple[float, float]) -> Tuple['Figure', 'Axes']:
+    """
+    Retourne une figure matplotlib réutilisable avec des axes vierges.
+
+    La figure est créée au premier appel pour ce nom dans le thread courant,
+    puis simplement vidée (ax.cla()) lors des appels suivants.
+
+    Args:
+        name: Identifiant de la figure ('profile', 'map', ...)
+        figsize: Taille de la figure en pouces
+
+    Returns:
+        Tuple (figure, axes)
+    """
+    # API objet de matplotlib (pas de pyplot) : aucun backend interactif requis
+    from matplotlib.figure import Figure
+
+    cache = getattr(_figures, 'cache', None)
+    if cache is None:
+        cache = _figures.cache = {}
+
+    fig = cache.get(name)
+    if fig is None:
+        fig = Figure(figsize=figsize, dpi=GRAPH_DPI)
+        fig.subplots()
+        cache[name] = fig
+
+    ax = fig.axes[0]
+    ax.cla()
+    # cla() ne réinitialise pas la couleur de fond des axes
+    ax.set_facecolor('white')
+    return fig, ax
+
 
 def generate_dive_pdf(dive_id: int, output_path: Optional[Path] = None) -> Optional[Path]:
     """
@@ -80,24 +172,11 @@ def generate_dive_pdf(dive_id: int, output_path: Optional[Path] = None) -> Optio
             file_path = Path(dive_data['fichier_original_path'])
             if file_path.exists():
                 logger.info(f"Parsing du fichier {file_path}")
+                df = dive_parser.parse_dive_file(file_path)
 
-                class FakeUploadedFile:
-                    def __init__(self, path):
-                        self.name = path.name
-                        self._content = None
-                        self._path = path
-
-                    def read(self):
-                        if self._content is None:
-                            with open(self._path, 'rb') as f:
-                                self._content = f.read()
-                        return self._content
-
-                    def seek(self, pos):
-                        pass
-
-                fake_file = FakeUploadedFile(file_path)
-                df = dive_parser.parse_dive_file(fake_file)
+                # Mettre le profil en cache pour les exports suivants
+                if not df.empty:
+                    database.save_dive_cache(dive_id, df)
             else:
                 logger.warning(f"Fichier de profil introuvable : {file_path}")
                 df = None
@@ -111,8 +190,8 @@ def generate_dive_pdf(dive_id: int, output_path: Optional[Path] = None) -> Optio
             filename = f"dive_{dive_id}_{timestamp}.pdf"
             output_path = EXPORT_DIR / filename
 
-        # 3. Créer le PDF
-        c = canvas.Canvas(str(output_path), pagesize=A4)
+        # 3. Créer le PDF (flux de contenu compressé)
+        c = canvas.Canvas(str(output_path), pagesize=A4, pageCompression=1)
 
         # Position verticale courante
         y = PAGE_HEIGHT - MARGIN_TOP
@@ -122,7 +201,9 @@ def generate_dive_pdf(dive_id: int, output_path: Optional[Path] = None) -> Optio
         y = _add_statistics_section(c, dive_data, y)
 
         if df is not None and not df.empty:
-            y = _add_dive_profile_graph(c, df, y)
+            # Vitesses de remontée calculées une seule fois (coloration + bandeau)
+            speeds = visualizer.calculate_ascent_speed(df)
+            y = _add_dive_profile_graph(c, df, speeds, y)
 
         # Ajouter la carte de localisation
         y = _add_location_map(c, dive_data, y)
@@ -131,13 +212,19 @@ def generate_dive_pdf(dive_id: int, output_path: Optional[Path] = None) -> Optio
             y = _add_species_list(c, dive_species, y)
 
         if dive_media:
-            y = _add_photo_gallery(c, dive_media, dive_species, y)
+            # Espèces de toutes les photos en une requête (évite N+1)
+            photo_ids = [m['id'] for m in dive_media if m['type'] == 'photo']
+            media_species = species_recognition.get_media_species_bulk(photo_ids)
+            y = _add_photo_gallery(c, dive_media, media_species, y)
 
         # 5. Ajouter footer avec métadonnées
         _add_footer(c, dive_id)
 
-        # 6. Sauvegarder
-        c.save()
+        # 6. Sauvegarder : le document est sérialisé en mémoire puis écrit
+        # en une fois via un tampon, le fichier n'étant créé qu'en cas de succès
+        pdf_data = c.getpdfdata()
+        with open(output_path, 'wb', buffering=PDF_WRITE_BUFFER) as fh:
+            fh.write(pdf_data)
         logger.info(f"PDF généré avec succès : {output_path}")
         return output_path
 
@@ -246,101 +333,133 @@ def _add_statistics_section(c: canvas.Canvas, dive_data: Dict[str, Any], y: floa
     vitesse_max = f"{dive_data.get('vitesse_remontee_max', 0):.1f} m/min" if dive_data.get('vitesse_remontee_max') else "N/A"
     data.append(["Temps de fond", temps_fond, "Vitesse remontée max", vitesse_max])
 
-    # Créer le tableau
+    # Lignes conditions et notes : libellé + texte sur les 3 colonnes restantes
     col_widths = [CONTENT_WIDTH * 0.3, CONTENT_WIDTH * 0.2, CONTENT_WIDTH * 0.3, CONTENT_WIDTH * 0.2]
+    text_width = sum(col_widths[1:]) - 2 * TABLE_PADDING
+    text_rows = []
+
+    conditions_parts = []
+    if dive_data.get('houle'):
+        conditions_parts.append(f"Houle : {dive_data['houle']}")
+    if dive_data.get('visibilite_metres'):
+        conditions_parts.append(f"Visibilité : {dive_data['visibilite_metres']}m")
+    if dive_data.get('courant'):
+        conditions_parts.append(f"Courant : {dive_data['courant']}")
+
+    if conditions_parts:
+        conditions_text = " • ".join(conditions_parts)
+        text_rows.append(["Conditions", Paragraph(escape(conditions_text), STATS_TEXT_STYLE), "", ""])
+
+    if dive_data.get('notes'):
+        # Texte multi-lignes, limité à 5 lignes pour ne pas déborder
+        notes_para, truncated = _wrap_paragraph(dive_data['notes'], NOTES_STYLE,
+                                                text_width, max_lines=5)
+        notes_cell = [notes_para, Paragraph("...", NOTES_STYLE)] if truncated else notes_para
+        text_rows.append(["Notes", notes_cell, "", ""])
+
+    first_text_row = len(data)
+    data.extend(text_rows)
+
+    # Créer le tableau
     table = Table(data, colWidths=col_widths)
 
-    table.setStyle(TableStyle([
+    table_style = [
         ('FONT', (0, 0), (-1, -1), 'Helvetica', 10),
         ('FONT', (0, 0), (0, -1), 'Helvetica-Bold', 10),
-        ('FONT', (2, 0), (2, -1), 'Helvetica-Bold', 10),
+        ('FONT', (2, 0), (2, first_text_row - 1), 'Helvetica-Bold', 10),
         ('TEXTCOLOR', (0, 0), (-1, -1), colors.black),
         ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor("#f0f0f0")),
         ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
         ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
         ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 6),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 6),
+        ('LEFTPADDING', (0, 0), (-1, -1), TABLE_PADDING),
+        ('RIGHTPADDING', (0, 0), (-1, -1), TABLE_PADDING),
         ('TOPPADDING', (0, 0), (-1, -1), 4),
         ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
-    ]))
+    ]
+    for row in range(first_text_row, len(data)):
+        table_style.append(('SPAN', (1, row), (3, row)))
+        table_style.append(('VALIGN', (0, row), (-1, row), 'TOP'))
+    table.setStyle(TableStyle(table_style))
 
     # Calculer hauteur du tableau
     table_width, table_height = table.wrapOn(c, CONTENT_WIDTH, PAGE_HEIGHT)
     table.drawOn(c, MARGIN_LEFT, y - table_height)
-    y -= table_height + 10
+    y -= table_height + 30
 
-    # Conditions environnementales
-    y -= 10
-    c.setFont("Helvetica-Bold", 11)
-    c.drawString(MARGIN_LEFT, y, "Conditions :")
-    y -= 15
+    return y
 
-    c.setFont("Helvetica", 10)
-    conditions_parts = []
 
-    if dive_data.get('houle'):
-        conditions_parts.append(f"Houle : {dive_data['houle']}")
-    if dive_data.get('visibilite_metres'):
-        conditions_parts.append(f"Visibilité : {dive_data['visibilite_metres']}m")
-    if dive_data.get('courant'):
-        conditions_parts.append(f"Courant : {dive_data['courant']}")
+def _wrap_paragraph(text: str, style: ParagraphStyle, width: float,
+                    max_lines: int) -> Tuple[Paragraph, bool]:
+    """
+    Prépare un Paragraph reportlab limité à un nombre de lignes.
 
-    if conditions_parts:
-        conditions_text = " • ".join(conditions_parts)
-        c.drawString(MARGIN_LEFT + 10, y, conditions_text)
-        y -= 18
+    Args:
+        text: Texte brut (les retours à la ligne sont conservés)
+        style: Style du paragraphe (police, taille, interligne, couleur)
+        width: Largeur disponible
+        max_lines: Nombre maximum de lignes
 
-    # Notes
-    if dive_data.get('notes'):
-        y -= 5
-        c.setFont("Helvetica-Bold", 11)
-        c.drawString(MARGIN_LEFT, y, "Notes :")
-        y -= 15
+    Returns:
+        Tuple (paragraphe déjà mis en page, True si le texte a été coupé)
+    """
+    para = Paragraph(escape(text).replace('\n', '<br/>'), style)
+    max_height = max_lines * style.leading
 
-        c.setFont("Helvetica", 9)
-        # Gérer texte multi-lignes
-        notes = dive_data['notes']
-        max_width = CONTENT_WIDTH - 10
-
-        # Découper en lignes
-        from reportlab.pdfbase.pdfmetrics import stringWidth
-        words = notes.split()
-        lines = []
-        current_line = ""
-
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            if stringWidth(test_line, "Helvetica", 9) <= max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
+    _, height = para.wrap(width, max_height)
+    truncated = height > max_height
+    if truncated:
+        para = para.split(width, max_height)[0]
+        para.wrap(width, max_height)
 
-        if current_line:
-            lines.append(current_line)
+    return para, truncated
 
-        # Limiter à 5 lignes pour ne pas déborder
-        for line in lines[:5]:
-            c.drawString(MARGIN_LEFT + 10, y, line)
-            y -= 12
 
-        if len(lines) > 5:
-            c.drawString(MARGIN_LEFT + 10, y, "...")
-            y -= 12
+def _draw_wrapped_text(c: canvas.Canvas, text: str, style: ParagraphStyle,
+                       x: float, y: float, width: float, max_lines: int) -> float:
+    """
+    Dessine un texte avec retour à la ligne automatique (Paragraph reportlab).
+
+    La première ligne de base est placée en y, comme pour drawString. Au-delà
+    de max_lines, le texte est coupé et suivi d'une ligne "...".
+
+    Args:
+        c: Canvas PDF
+        text: Texte brut (les retours à la ligne sont conservés)
+        style: Style du paragraphe (police, taille, interligne, couleur)
+        x: Position horizontale
+        y: Position verticale de la première ligne de base
+        width: Largeur disponible
+        max_lines: Nombre maximum de lignes affichées
+
+    Returns:
+        Nouvelle position verticale
+    """
+    para, truncated = _wrap_paragraph(text, style, width, max_lines)
+    height = para.height
+
+    para.drawOn(c, x, y + style.fontSize - height)
+    y -= height
+
+    if truncated:
+        c.setFont(style.fontName, style.fontSize)
+        c.setFillColor(style.textColor)
+        c.drawString(x, y, "...")
+        c.setFillColor(colors.black)
+        y -= style.leading
 
-    y -= 20
     return y
 
 
-def _add_dive_profile_graph(c: canvas.Canvas, df, y: float) -> float:
+def _add_dive_profile_graph(c: canvas.Canvas, df, speeds: pd.Series, y: float) -> float:
     """
     Ajoute le graphique du profil de plongée.
 
     Args:
         c: Canvas PDF
         df: DataFrame avec les données de profil
+        speeds: Vitesses de remontée (visualizer.calculate_ascent_speed)
         y: Position verticale courante
 
     Returns:
@@ -355,99 +474,52 @@ def _add_dive_profile_graph(c: canvas.Canvas, df, y: float) -> float:
 
         c.setFillColor(colors.black)
 
-        # Créer le graphique avec matplotlib (plus fiable que Kaleido)
-        temps_minutes = df['temps_secondes'] / 60
-        profondeur = df['profondeur_metres']
-
-        # Calculer vitesses de remontée pour coloration
-        speeds = visualizer.calculate_ascent_speed(df)
+        # Tableaux NumPy extraits une fois (pas d'indexation pandas ensuite)
+        temps_minutes = df['temps_secondes'].to_numpy() / 60.0
+        profondeur = df['profondeur_metres'].to_numpy()
 
-        # Créer la figure matplotlib
-        fig_mpl, ax = plt.subplots(figsize=(12, 5), dpi=150)
+        # Classe de vitesse par point : 0 = < 10, 1 = 10-15, 2 = >= 15 m/min
+        speed_classes = np.digitize(speeds.to_numpy(), [10.0, 15.0])
 
-        # Tracer le profil avec segments colorés selon vitesse
-        i = 0
-        while i < len(df):
-            speed = speeds.iloc[i]
+        pdf_img_width = min(CONTENT_WIDTH, 16 * cm)
 
-            # Déterminer couleur
-            if speed < 10:
-                color = '#1f77b4'  # Bleu
-            elif speed < 15:
-                color = '#ff7f0e'  # Orange
+        if config.PDF_VECTOR_PROFILE and len(df) <= config.PDF_VECTOR_MAX_POINTS:
+            # Tracé vectoriel direct sur le canvas (pas de rendu PNG)
+            img = None
+            pdf_img_height = pdf_img_width * PROFILE_ASPECT_RATIO
+        else:
+            # Profil très long : rendu matplotlib, plus léger qu'un tracé vectoriel.
+            # Le PNG est mis en cache sur disque selon le contenu du profil.
+            cache_path = _graph_cache_path('profile', GRAPH_DPI, temps_minutes, profondeur, speed_classes)
+            if cache_path.exists():
+                img = ImageReader(str(cache_path))
             else:
-                color = '#d62728'  # Rouge
-
-            # Trouver fin du segment de même couleur
-            j = i + 1
-            while j < len(df):
-                next_speed = speeds.iloc[j]
-                if (next_speed < 10 and speed >= 10) or \
-                   (next_speed >= 10 and next_speed < 15 and (speed < 10 or speed >= 15)) or \
-                   (next_speed >= 15 and speed < 15):
-                    break
-                j += 1
-
-            # Tracer segment
-            ax.plot(temps_minutes.iloc[i:j+1], profondeur.iloc[i:j+1],
-                   color=color, linewidth=2)
-            i = j
-
-        # Annoter profondeur max
-        max_depth_idx = df['profondeur_metres'].idxmax()
-        max_depth = df['profondeur_metres'].iloc[max_depth_idx]
-        max_depth_time = temps_minutes.iloc[max_depth_idx]
-        ax.annotate(f'Prof. Max: {max_depth:.1f} m',
-                   xy=(max_depth_time, max_depth),
-                   xytext=(max_depth_time + 2, max_depth - 2),
-                   arrowprops=dict(arrowstyle='->', color='#d62728', lw=2),
-                   fontsize=10, color='#d62728', weight='bold',
-                   bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='#d62728', linewidth=2))
-
-        # Configuration axes
-        ax.set_xlabel('Temps (minutes)', fontsize=11, weight='bold')
-        ax.set_ylabel('Profondeur (mètres)', fontsize=11, weight='bold')
-        ax.set_title('Profil de Plongée', fontsize=13, weight='bold', pad=15)
-        ax.invert_yaxis()  # Inverser axe Y
-        ax.grid(True, alpha=0.3, linestyle='--')
-        ax.set_facecolor('white')
-        fig_mpl.patch.set_facecolor('white')
-
-        # Convertir en PNG
-        buf = io.BytesIO()
-        plt.tight_layout()
-        plt.savefig(buf, format='png', dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig_mpl)
-        buf.seek(0)
+                png_data = _render_profile_png(temps_minutes, profondeur, speed_classes)
+                _write_graph_cache(cache_path, png_data)
+                img = ImageReader(io.BytesIO(png_data))
 
-        # Charger l'image avec PIL
-        img = PILImage.open(buf)
-
-        # Calculer les dimensions pour le PDF (max width = CONTENT_WIDTH)
-        img_width, img_height = img.size
-        aspect_ratio = img_height / img_width
-        pdf_img_width = min(CONTENT_WIDTH, 16 * cm)
-        pdf_img_height = pdf_img_width * aspect_ratio
+            # Calculer les dimensions pour le PDF (max width = CONTENT_WIDTH)
+            img_width, img_height = img.getSize()
+            aspect_ratio = img_height / img_width
+            pdf_img_height = pdf_img_width * aspect_ratio
 
         # Vérifier si l'image tient sur la page
         if y - pdf_img_height < MARGIN_BOTTOM:
             c.showPage()
             y = PAGE_HEIGHT - MARGIN_TOP
 
-        # Dessiner l'image
-        img_path = EXPORT_DIR / "temp_graph.png"
-        img.save(img_path, "PNG")
-
-        c.drawImage(str(img_path), MARGIN_LEFT, y - pdf_img_height,
-                   width=pdf_img_width, height=pdf_img_height)
-
-        # Nettoyer le fichier temporaire
-        img_path.unlink()
+        # Dessiner le graphique
+        if img is None:
+            _draw_profile_vector(c, temps_minutes, profondeur, speed_classes,
+                                 MARGIN_LEFT, y - pdf_img_height,
+                                 pdf_img_width, pdf_img_height)
+        else:
+            c.drawImage(img, MARGIN_LEFT, y - pdf_img_height,
+                       width=pdf_img_width, height=pdf_img_height)
 
         y -= pdf_img_height + 10
 
         # Bandeau sécurité
-        speeds = visualizer.calculate_ascent_speed(df)
         max_speed = speeds.max()
 
         c.setFont("Helvetica-Bold", 10)
@@ -474,6 +546,278 @@ def _add_dive_profile_graph(c: canvas.Canvas, df, y: float) -> float:
     return y
 
 
+def _graph_cache_path(name: str, *key_parts: Any) -> Path:
+    """
+    Retourne le chemin du PNG en cache pour un graphique et ses données.
+
+    La clé est un hash du contenu (tableaux NumPy ou valeurs simples) : un
+    graphique dont les données n'ont pas changé est relu depuis le disque.
+
+    Args:
+        name: Type de graphique ('profile', 'map')
+        *key_parts: Données déterminant le rendu
+
+    Returns:
+        Chemin du fichier PNG (existant ou non)
+    """
+    digest = hashlib.sha1()
+    for part in key_parts:
+        if isinstance(part, np.ndarray):
+            digest.update(np.ascontiguousarray(part).tobytes())
+        else:
+            digest.update(repr(part).encode('utf-8'))
+    return GRAPH_CACHE_DIR / f"{name}_{digest.hexdigest()[:20]}.png"
+
+
+def _write_graph_cache(cache_path: Path, png_data: bytes) -> None:
+    """
+    Enregistre un PNG dans le cache des graphiques.
+
+    L'écriture passe par un fichier temporaire renommé, pour qu'un export
+    concurrent ne lise jamais un PNG partiel. Une erreur d'écriture est
+    seulement journalisée : le cache est facultatif.
+
+    Args:
+        cache_path: Chemin retourné par _graph_cache_path
+        png_data: Données PNG
+    """
+    try:
+        GRAPH_CACHE_DIR.mkdir(exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(png_data)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Impossible d'écrire le cache graphique {cache_path.name} : {e}")
+
+
+def _profile_segments(points: np.ndarray, speed_classes: np.ndarray) -> List[Tuple[int, np.ndarray]]:
+    """
+    Découpe le profil en segments de même classe de vitesse.
+
+    Chaque segment inclut le premier point du suivant pour que la courbe soit continue.
+
+    Args:
+        points: Tableau (n, 2) des coordonnées des points
+        speed_classes: Classe de vitesse de chaque point
+
+    Returns:
+        Liste de tuples (classe de vitesse, points du segment)
+    """
+    # Début de chaque segment de même couleur (changement de classe)
+    breaks = np.concatenate((
+        [0],
+        np.flatnonzero(np.diff(speed_classes)) + 1,
+        [len(speed_classes)]
+    ))
+    return [(speed_classes[start], points[start:end + 1])
+            for start, end in zip(breaks[:-1], breaks[1:])]
+
+
+def _render_profile_png(temps_minutes: np.ndarray, profondeur: np.ndarray,
+                        speed_classes: np.ndarray) -> bytes:
+    """
+    Rend le profil de plongée en PNG avec matplotlib.
+
+    Args:
+        temps_minutes: Temps de chaque point (minutes)
+        profondeur: Profondeur de chaque point (mètres)
+        speed_classes: Classe de vitesse de chaque point
+
+    Returns:
+        Données PNG
+    """
+    from matplotlib.collections import LineCollection
+
+    # Récupérer la figure matplotlib réutilisable (axes vidés)
+    fig_mpl, ax = _get_figure('profile', figsize=(10, 4))
+
+    # Tracer le profil avec segments colorés selon vitesse
+    points = np.column_stack((temps_minutes, profondeur))
+    segments = _profile_segments(points, speed_classes)
+    ax.add_collection(LineCollection(
+        [segment for _, segment in segments],
+        colors=[PROFILE_PALETTE[speed_class] for speed_class, _ in segments],
+        linewidths=2
+    ))
+    ax.autoscale_view()
+
+    # Annoter profondeur max
+    max_depth_idx = int(np.nanargmax(profondeur))
+    max_depth = float(profondeur[max_depth_idx])
+    max_depth_time = float(temps_minutes[max_depth_idx])
+    ax.annotate(f'Prof. Max: {max_depth:.1f} m',
+               xy=(max_depth_time, max_depth),
+               xytext=(max_depth_time + 2, max_depth - 2),
+               arrowprops=dict(arrowstyle='->', color='#d62728', lw=2),
+               fontsize=10, color='#d62728', weight='bold',
+               bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='#d62728', linewidth=2))
+
+    # Configuration axes
+    ax.set_xlabel('Temps (minutes)', fontsize=11, weight='bold')
+    ax.set_ylabel('Profondeur (mètres)', fontsize=11, weight='bold')
+    ax.set_title('Profil de Plongée', fontsize=13, weight='bold', pad=15)
+    ax.invert_yaxis()  # Inverser axe Y
+    ax.grid(True, alpha=0.3, linestyle='--')
+    ax.set_facecolor('white')
+    fig_mpl.patch.set_facecolor('white')
+
+    # Convertir en PNG
+    buf = io.BytesIO()
+    # Marges fixes plutôt que tight_layout/bbox_inches='tight' (évite une passe de rendu)
+    fig_mpl.subplots_adjust(left=0.08, right=0.98, top=0.9, bottom=0.15)
+    fig_mpl.savefig(buf, format='png', dpi=GRAPH_DPI, facecolor='white')
+    return buf.getvalue()
+
+
+def _nice_ticks(vmin: float, vmax: float, nbins: int) -> List[float]:
+    """
+    Calcule des graduations "rondes" (pas de 1, 2, 2.5 ou 5 x 10^n).
+
+    Équivalent léger de matplotlib.ticker.MaxNLocator pour les graphiques
+    dessinés directement sur le canvas.
+
+    Args:
+        vmin: Borne inférieure
+        vmax: Borne supérieure
+        nbins: Nombre maximum d'intervalles
+
+    Returns:
+        Liste des graduations comprises entre vmin et vmax
+    """
+    span = vmax - vmin
+    if span <= 0:
+        return [vmin]
+
+    raw_step = span / nbins
+    magnitude = 10 ** math.floor(math.log10(raw_step))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw_step)
+
+    first = math.ceil(vmin / step)
+    last = math.floor(vmax / step)
+    return [round(i * step, 10) for i in range(first, last + 1)]
+
+
+def _draw_profile_vector(c: canvas.Canvas, temps_minutes: np.ndarray, profondeur: np.ndarray,
+                         speed_classes: np.ndarray, x: float, y: float,
+                         width: float, height: float) -> None:
+    """
+    Dessine le profil de plongée en vectoriel directement sur le canvas.
+
+    Reproduit le graphique matplotlib (titre, axes, grille, courbe colorée
+    selon la vitesse de remontée, profondeur max) avec des opérateurs PDF,
+    sans rendu ni intégration d'image.
+
+    Args:
+        c: Canvas PDF
+        temps_minutes: Temps de chaque point (minutes)
+        profondeur: Profondeur de chaque point (mètres)
+        speed_classes: Classe de vitesse de chaque point
+        x: Position horizontale du coin inférieur gauche
+        y: Position verticale du coin inférieur gauche
+        width: Largeur totale du graphique
+        height: Hauteur totale du graphique
+    """
+    # Zone de tracé (marges pour titre, graduations et libellés)
+    plot_x = x + 45
+    plot_y = y + 32
+    plot_w = width - 55
+    plot_h = height - 58
+
+    # Ignorer les points sans mesure (NaN), qui ne peuvent pas être tracés
+    valid = np.isfinite(temps_minutes) & np.isfinite(profondeur)
+    if not valid.all():
+        temps_minutes = temps_minutes[valid]
+        profondeur = profondeur[valid]
+        speed_classes = speed_classes[valid]
+
+    # Échelles : temps de gauche à droite, profondeur vers le bas depuis la surface
+    t_min, t_max = float(temps_minutes.min()), float(temps_minutes.max())
+    d_min = min(0.0, float(profondeur.min()))
+    d_max = float(profondeur.max()) * 1.05
+    t_span = (t_max - t_min) or 1.0
+    d_span = (d_max - d_min) or 1.0
+
+    def to_x(t):
+        return plot_x + (t - t_min) / t_span * plot_w
+
+    def to_y(d):
+        return plot_y + plot_h - (d - d_min) / d_span * plot_h
+
+    c.saveState()
+
+    # Titre
+    c.setFont("Helvetica-Bold", 11)
+    c.setFillColor(colors.black)
+    c.drawCentredString(plot_x + plot_w / 2, y + height - 14, "Profil de Plongée")
+
+    # Grille et graduations
+    c.setFont("Helvetica", 7)
+    c.setLineWidth(0.4)
+    for tick in _nice_ticks(t_min, t_max, nbins=8):
+        if t_min <= tick <= t_max:
+            tx = to_x(tick)
+            c.setStrokeColor(colors.HexColor("#cccccc"))
+            c.setDash(2, 2)
+            c.line(tx, plot_y, tx, plot_y + plot_h)
+            c.setDash()
+            c.drawCentredString(tx, plot_y - 10, f"{tick:g}")
+
+    for tick in _nice_ticks(d_min, d_max, nbins=6):
+        if d_min <= tick <= d_max:
+            ty = to_y(tick)
+            c.setStrokeColor(colors.HexColor("#cccccc"))
+            c.setDash(2, 2)
+            c.line(plot_x, ty, plot_x + plot_w, ty)
+            c.setDash()
+            c.drawRightString(plot_x - 4, ty - 2.5, f"{tick:g}")
+
+    # Cadre
+    c.setStrokeColor(colors.black)
+    c.setLineWidth(0.6)
+    c.rect(plot_x, plot_y, plot_w, plot_h, stroke=1, fill=0)
+
+    # Libellés des axes
+    c.setFont("Helvetica-Bold", 8)
+    c.drawCentredString(plot_x + plot_w / 2, y + 4, "Temps (minutes)")
+    c.saveState()
+    c.translate(x + 10, plot_y + plot_h / 2)
+    c.rotate(90)
+    c.drawCentredString(0, 0, "Profondeur (mètres)")
+    c.restoreState()
+
+    # Courbe : un chemin par couleur, un sous-chemin par segment
+    points = np.column_stack((to_x(temps_minutes), to_y(profondeur)))
+    paths = {}
+    for speed_class, segment in _profile_segments(points, speed_classes):
+        path = paths.get(speed_class)
+        if path is None:
+            path = paths[speed_class] = c.beginPath()
+        path.moveTo(*segment[0])
+        for px, py in segment[1:]:
+            path.lineTo(px, py)
+
+    c.setLineWidth(1.2)
+    c.setLineJoin(1)
+    c.setLineCap(1)
+    for speed_class, path in paths.items():
+        c.setStrokeColor(colors.HexColor(PROFILE_PALETTE[speed_class]))
+        c.drawPath(path, stroke=1, fill=0)
+
+    # Annoter profondeur max
+    max_depth_idx = int(profondeur.argmax())
+    max_depth = float(profondeur[max_depth_idx])
+    mx, my = points[max_depth_idx]
+    label = f"Prof. Max: {max_depth:.1f} m"
+    c.setFont("Helvetica-Bold", 8)
+    label_x = min(mx + 8, plot_x + plot_w - stringWidth(label, "Helvetica-Bold", 8) - 4)
+    c.setFillColor(colors.HexColor("#d62728"))
+    c.setStrokeColor(colors.HexColor("#d62728"))
+    c.circle(mx, my, 2.5, stroke=0, fill=1)
+    c.drawString(label_x, max(my + 6, plot_y + 4), label)
+
+    c.restoreState()
+
+
 def _add_location_map(c: canvas.Canvas, dive_data: Dict[str, Any], y: float) -> float:
     """
     Ajoute une carte statique du site de plongée si les coordonnées GPS sont disponibles.
@@ -486,6 +830,8 @@ def _add_location_map(c: canvas.Canvas, dive_data: Dict[str, Any], y: float) ->
     Returns:
         Nouvelle position verticale
     """
+    global _map_tiles_unavailable
+
     try:
         # Récupérer le site complet avec coordonnées GPS
         site_data = database.get_site_by_name(dive_data['site_nom'])
@@ -520,91 +866,42 @@ def _add_location_map(c: canvas.Canvas, dive_data: Dict[str, Any], y: float) ->
 
         c.setFillColor(colors.black)
 
-        # Créer une carte avec tuiles OpenStreetMap
-        fig_map, ax_map = plt.subplots(figsize=(8, 4.5), dpi=150)
-
-        # Convertir les coordonnées WGS84 (lat/lon) en Web Mercator (EPSG:3857)
-        transformer = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
-        map_x, map_y = transformer.transform(lon, lat)
-
-        # Définir les limites de la carte (environ 10km autour du point)
-        # 0.1 degré ≈ 11km à l'équateur
-        buffer = 0.15  # Zoom modéré pour voir le contexte géographique
-        lon_min, lon_max = lon - buffer, lon + buffer
-        lat_min, lat_max = lat - buffer * 0.6, lat + buffer * 0.6  # Ratio aspect
-
-        # Convertir les limites en Web Mercator
-        x_min, y_min = transformer.transform(lon_min, lat_min)
-        x_max, y_max = transformer.transform(lon_max, lat_max)
-
-        # Configurer les limites de la carte
-        ax_map.set_xlim(x_min, x_max)
-        ax_map.set_ylim(y_min, y_max)
-
-        # Ajouter le fond de carte OpenStreetMap
-        try:
-            ctx.add_basemap(
-                ax_map,
-                crs="EPSG:3857",
-                source=ctx.providers.OpenStreetMap.Mapnik,
-                attribution=False,
-                zoom='auto'
-            )
-        except Exception as e:
-            logger.warning(f"Impossible de télécharger les tuiles OSM: {e}")
-            # Fallback: fond bleu si pas d'internet
-            ax_map.set_facecolor('#b3d9ff')
-
-        # Ajouter un marqueur rouge avec bordure blanche pour le site
-        ax_map.plot(map_x, map_y, 'o', color='#d62728', markersize=18,
-                   markeredgecolor='white', markeredgewidth=3, zorder=10)
-
-        # Ajouter un point central plus petit
-        ax_map.plot(map_x, map_y, 'o', color='white', markersize=6, zorder=11)
-
-        # Ajouter le nom du site et du pays en haut de la carte
+        # Nom du site et du pays en haut de la carte
         title_parts = [dive_data['site_nom']]
         if site_data.get('pays'):
             title_parts.append(site_data['pays'])
-
-        ax_map.set_title(' - '.join(title_parts),
-                        fontsize=12, weight='bold', pad=15)
-
-        # Ajouter les coordonnées en bas
-        coord_text = f'📍 {lat:.5f}°N, {lon:.5f}°E'
-        ax_map.text(0.5, 0.02, coord_text, transform=ax_map.transAxes,
-                   ha='center', va='bottom', fontsize=9, weight='bold',
-                   bbox=dict(boxstyle='round,pad=0.6', facecolor='white',
-                            edgecolor='#1f77b4', linewidth=2, alpha=0.95))
-
-        # Désactiver les axes pour un look plus propre
-        ax_map.set_axis_off()
-
-        # Convertir en PNG
-        buf_map = io.BytesIO()
-        plt.tight_layout()
-        plt.savefig(buf_map, format='png', dpi=150, bbox_inches='tight', facecolor='white')
-        plt.close(fig_map)
-        buf_map.seek(0)
-
-        # Charger l'image avec PIL
-        img_map = PILImage.open(buf_map)
+        title = ' - '.join(title_parts)
+
+        img_map = None
+        if config.PDF_MAP_TILES:
+            # Carte déjà rendue pour ce site (cache disque), sinon rendu matplotlib
+            cache_path = _graph_cache_path('map', GRAPH_DPI, lat, lon, title)
+            if cache_path.exists():
+                img_map = ImageReader(str(cache_path))
+            elif not _map_tiles_unavailable:
+                png_data, tiles_loaded = _render_location_map_png(lat, lon, title)
+                # Sans tuiles (hors ligne), la carte vectorielle est utilisée à la place
+                if tiles_loaded:
+                    _write_graph_cache(cache_path, png_data)
+                    img_map = ImageReader(io.BytesIO(png_data))
+                else:
+                    _map_tiles_unavailable = True
 
         # Calculer les dimensions pour le PDF
-        img_width, img_height = img_map.size
-        aspect_ratio = img_height / img_width
         pdf_img_width = min(CONTENT_WIDTH, 14 * cm)
-        pdf_img_height = pdf_img_width * aspect_ratio
-
-        # Dessiner l'image
-        img_path = EXPORT_DIR / "temp_map.png"
-        img_map.save(img_path, "PNG")
 
-        c.drawImage(str(img_path), MARGIN_LEFT, y - pdf_img_height,
-                   width=pdf_img_width, height=pdf_img_height)
+        if img_map is None:
+            pdf_img_height = pdf_img_width * MAP_ASPECT_RATIO
+            _draw_map_vector(c, lat, lon, title, MARGIN_LEFT, y - pdf_img_height,
+                             pdf_img_width, pdf_img_height)
+        else:
+            img_width, img_height = img_map.getSize()
+            aspect_ratio = img_height / img_width
+            pdf_img_height = pdf_img_width * aspect_ratio
 
-        # Nettoyer le fichier temporaire
-        img_path.unlink()
+            # Dessiner l'image
+            c.drawImage(img_map, MARGIN_LEFT, y - pdf_img_height,
+                       width=pdf_img_width, height=pdf_img_height)
 
         y -= pdf_img_height + 15
 
@@ -630,6 +927,170 @@ def _add_location_map(c: canvas.Canvas, dive_data: Dict[str, Any], y: float) ->
     return y
 
 
+def _render_location_map_png(lat: float, lon: float, title: str) -> Tuple[bytes, bool]:
+    """
+    Rend la carte du site de plongée (tuiles OpenStreetMap) en PNG.
+
+    Args:
+        lat: Latitude du site
+        lon: Longitude du site
+        title: Titre affiché au-dessus de la carte
+
+    Returns:
+        Tuple (données PNG, True si les tuiles OSM ont été chargées)
+    """
+    import contextily as ctx
+    from pyproj import Transformer
+
+    # Créer une carte avec tuiles OpenStreetMap (figure réutilisable, axes vidés)
+    fig_map, ax_map = _get_figure('map', figsize=(8, 4.5))
+
+    # Convertir les coordonnées WGS84 (lat/lon) en Web Mercator (EPSG:3857)
+    transformer = Transformer.from_crs("EPSG:4326", "EPSG:3857", always_xy=True)
+    map_x, map_y = transformer.transform(lon, lat)
+
+    # Définir les limites de la carte (environ 10km autour du point)
+    # 0.1 degré ≈ 11km à l'équateur
+    buffer = 0.15  # Zoom modéré pour voir le contexte géographique
+    lon_min, lon_max = lon - buffer, lon + buffer
+    lat_min, lat_max = lat - buffer * 0.6, lat + buffer * 0.6  # Ratio aspect
+
+    # Convertir les limites en Web Mercator
+    x_min, y_min = transformer.transform(lon_min, lat_min)
+    x_max, y_max = transformer.transform(lon_max, lat_max)
+
+    # Configurer les limites de la carte
+    ax_map.set_xlim(x_min, x_max)
+    ax_map.set_ylim(y_min, y_max)
+
+    # Ajouter le fond de carte OpenStreetMap
+    tiles_loaded = True
+    try:
+        ctx.add_basemap(
+            ax_map,
+            crs="EPSG:3857",
+            source=ctx.providers.OpenStreetMap.Mapnik,
+            attribution=False,
+            zoom='auto'
+        )
+    except Exception as e:
+        logger.warning(f"Impossible de télécharger les tuiles OSM: {e}")
+        # Fallback: fond bleu si pas d'internet
+        ax_map.set_facecolor('#b3d9ff')
+        tiles_loaded = False
+
+    # Ajouter un marqueur rouge avec bordure blanche pour le site
+    ax_map.plot(map_x, map_y, 'o', color='#d62728', markersize=18,
+               markeredgecolor='white', markeredgewidth=3, zorder=10)
+
+    # Ajouter un point central plus petit
+    ax_map.plot(map_x, map_y, 'o', color='white', markersize=6, zorder=11)
+
+    # Ajouter le nom du site et du pays en haut de la carte
+    ax_map.set_title(title, fontsize=12, weight='bold', pad=15)
+
+    # Ajouter les coordonnées en bas
+    coord_text = f'📍 {lat:.5f}°N, {lon:.5f}°E'
+    ax_map.text(0.5, 0.02, coord_text, transform=ax_map.transAxes,
+               ha='center', va='bottom', fontsize=9, weight='bold',
+               bbox=dict(boxstyle='round,pad=0.6', facecolor='white',
+                        edgecolor='#1f77b4', linewidth=2, alpha=0.95))
+
+    # Désactiver les axes pour un look plus propre
+    ax_map.set_axis_off()
+
+    # Convertir en PNG
+    buf_map = io.BytesIO()
+    # Marges fixes plutôt que tight_layout/bbox_inches='tight' (évite une passe de rendu)
+    fig_map.subplots_adjust(left=0.01, right=0.99, top=0.9, bottom=0.01)
+    fig_map.savefig(buf_map, format='png', dpi=GRAPH_DPI, facecolor='white')
+    return buf_map.getvalue(), tiles_loaded
+
+
+def _draw_map_vector(c: canvas.Canvas, lat: float, lon: float, title: str,
+                     x: float, y: float, width: float, height: float) -> None:
+    """
+    Dessine une carte simplifiée du site directement sur le canvas.
+
+    Fond océan, grille de latitudes/longitudes et marqueur du site, avec
+    des opérateurs PDF (pas de tuiles ni de rendu matplotlib). Utilisée
+    quand les tuiles OpenStreetMap sont désactivées ou indisponibles.
+
+    Args:
+        c: Canvas PDF
+        lat: Latitude du site
+        lon: Longitude du site
+        title: Titre affiché au-dessus de la carte
+        x: Position horizontale du coin inférieur gauche
+        y: Position verticale du coin inférieur gauche
+        width: Largeur totale de la carte
+        height: Hauteur totale de la carte
+    """
+    # Zone de carte sous le titre
+    map_h = height - 22
+    center_x = x + width / 2
+    center_y = y + map_h / 2
+
+    # Même emprise que la carte à tuiles (environ 10km autour du point)
+    buffer = 0.15
+    lon_min, lon_max = lon - buffer, lon + buffer
+    lat_min, lat_max = lat - buffer * 0.6, lat + buffer * 0.6
+
+    c.saveState()
+
+    # Titre
+    c.setFont("Helvetica-Bold", 11)
+    c.setFillColor(colors.black)
+    c.drawCentredString(center_x, y + height - 12, title)
+
+    # Fond océan
+    c.setFillColor(colors.HexColor("#b3d9ff"))
+    c.setStrokeColor(colors.HexColor("#7fb2e5"))
+    c.setLineWidth(0.6)
+    c.rect(x, y, width, map_h, stroke=1, fill=1)
+
+    # Grille de coordonnées
+    c.setFont("Helvetica", 6)
+    c.setLineWidth(0.3)
+    c.setDash(2, 2)
+    for tick in _nice_ticks(lon_min, lon_max, nbins=5):
+        if lon_min < tick < lon_max:
+            tx = x + (tick - lon_min) / (lon_max - lon_min) * width
+            c.setStrokeColor(colors.HexColor("#7fb2e5"))
+            c.line(tx, y, tx, y + map_h)
+            c.setFillColor(colors.HexColor("#36648b"))
+            c.drawCentredString(tx, y + map_h - 8, f"{tick:.2f}°")
+    for tick in _nice_ticks(lat_min, lat_max, nbins=4):
+        if lat_min < tick < lat_max:
+            ty = y + (tick - lat_min) / (lat_max - lat_min) * map_h
+            c.setStrokeColor(colors.HexColor("#7fb2e5"))
+            c.line(x, ty, x + width, ty)
+            c.setFillColor(colors.HexColor("#36648b"))
+            c.drawString(x + 3, ty + 2, f"{tick:.2f}°")
+    c.setDash()
+
+    # Marqueur rouge avec bordure blanche pour le site
+    c.setFillColor(colors.HexColor("#d62728"))
+    c.setStrokeColor(colors.white)
+    c.setLineWidth(2)
+    c.circle(center_x, center_y, 7, stroke=1, fill=1)
+    c.setFillColor(colors.white)
+    c.circle(center_x, center_y, 2.2, stroke=0, fill=1)
+
+    # Coordonnées en bas
+    coord_text = f"{lat:.5f}°N, {lon:.5f}°E"
+    c.setFont("Helvetica-Bold", 8)
+    box_w = stringWidth(coord_text, "Helvetica-Bold", 8) + 12
+    c.setFillColor(colors.white)
+    c.setStrokeColor(colors.HexColor("#1f77b4"))
+    c.setLineWidth(1)
+    c.roundRect(center_x - box_w / 2, y + 5, box_w, 14, 3, stroke=1, fill=1)
+    c.setFillColor(colors.black)
+    c.drawCentredString(center_x, y + 9, coord_text)
+
+    c.restoreState()
+
+
 def _add_species_list(c: canvas.Canvas, dive_species: List[Dict[str, Any]], y: float) -> float:
     """
     Ajoute la liste des espèces observées.
@@ -654,19 +1115,6 @@ def _add_species_list(c: canvas.Canvas, dive_species: List[Dict[str, Any]], y: f
     y -= 20
 
     c.setFillColor(colors.black)
-    c.setFont("Helvetica", 10)
-
-    # Emojis par catégorie
-    emoji_map = {
-        'poisson': '🐟',
-        'corail': '🪸',
-        'mollusque': '🐚',
-        'crustacé': '🦀',
-        'échinoderme': '⭐',
-        'mammifère': '🐋',
-        'reptile': '🐢',
-        'autre': '🌊'
-    }
 
     for species in dive_species:
         # Vérifier si on doit changer de page
@@ -674,7 +1122,7 @@ def _add_species_list(c: canvas.Canvas, dive_species: List[Dict[str, Any]], y: f
             c.showPage()
             y = PAGE_HEIGHT - MARGIN_TOP
 
-        emoji = emoji_map.get(species['category'], '🌊')
+        emoji = SPECIES_EMOJIS.get(species['category'], '🌊')
         common_name = species['common_name_fr'] or species['scientific_name']
 
         # Nom commun en normal
@@ -695,8 +1143,7 @@ def _add_species_list(c: canvas.Canvas, dive_species: List[Dict[str, Any]], y: f
             info_parts.append(f"Qté: {species['quantity']}")
 
         if species.get('detected_by'):
-            detection_map = {'ai': '🤖 IA', 'manual': '✍️ Manuel', 'verified': '✓ Vérifié'}
-            info_parts.append(detection_map.get(species['detected_by'], ''))
+            info_parts.append(DETECTION_LABELS.get(species['detected_by'], ''))
 
         if info_parts:
             c.setFont("Helvetica", 8)
@@ -711,14 +1158,14 @@ def _add_species_list(c: canvas.Canvas, dive_species: List[Dict[str, Any]], y: f
 
 
 def _add_photo_gallery(c: canvas.Canvas, dive_media: List[Dict[str, Any]],
-                       dive_species: List[Dict[str, Any]], y: float) -> float:
+                       media_species: Dict[int, List[Dict[str, Any]]], y: float) -> float:
     """
     Ajoute la galerie de photos avec les espèces identifiées.
 
     Args:
         c: Canvas PDF
         dive_media: Liste des médias de la plongée
-        dive_species: Liste des espèces (pour lier aux médias)
+        media_species: Espèces identifiées par média ({media_id: espèces})
         y: Position verticale courante
 
     Returns:
@@ -743,6 +1190,12 @@ def _add_photo_gallery(c: canvas.Canvas, dive_media: List[Dict[str, Any]],
 
     c.setFillColor(colors.black)
 
+    # Taille cible en pixels de la boîte d'affichage à PHOTO_DPI
+    photo_target_px = (
+        int(min(PHOTO_MAX_WIDTH, CONTENT_WIDTH) / inch * PHOTO_DPI),
+        int(PHOTO_MAX_HEIGHT / inch * PHOTO_DPI),
+    )
+
     # Ajouter chaque photo
     for idx, media in enumerate(photos, 1):
         photo_path = Path(media['filepath'])
@@ -757,18 +1210,19 @@ def _add_photo_gallery(c: canvas.Canvas, dive_media: List[Dict[str, Any]],
             y = PAGE_HEIGHT - MARGIN_TOP
 
         try:
-            # Charger l'image
-            img = PILImage.open(photo_path)
+            # Charger l'image réduite à la taille d'affichage
+            img_data, (img_width, img_height) = _load_photo_thumbnail(
+                str(photo_path), photo_path.stat().st_mtime_ns, photo_target_px
+            )
 
             # Calculer dimensions (max 12cm de large)
-            img_width, img_height = img.size
             aspect_ratio = img_height / img_width
-            pdf_img_width = min(12 * cm, CONTENT_WIDTH)
+            pdf_img_width = min(PHOTO_MAX_WIDTH, CONTENT_WIDTH)
             pdf_img_height = pdf_img_width * aspect_ratio
 
             # Limiter la hauteur à 10cm
-            if pdf_img_height > 10 * cm:
-                pdf_img_height = 10 * cm
+            if pdf_img_height > PHOTO_MAX_HEIGHT:
+                pdf_img_height = PHOTO_MAX_HEIGHT
                 pdf_img_width = pdf_img_height / aspect_ratio
 
             # Vérifier si l'image tient
@@ -777,32 +1231,19 @@ def _add_photo_gallery(c: canvas.Canvas, dive_media: List[Dict[str, Any]],
                 y = PAGE_HEIGHT - MARGIN_TOP
 
             # Dessiner l'image
-            c.drawImage(str(photo_path), MARGIN_LEFT, y - pdf_img_height,
+            c.drawImage(ImageReader(io.BytesIO(img_data)), MARGIN_LEFT, y - pdf_img_height,
                        width=pdf_img_width, height=pdf_img_height,
                        preserveAspectRatio=True)
 
             y -= pdf_img_height + 5
 
             # Caption avec espèces
-            caption = _format_species_caption(media['id'], dive_species)
+            caption = _format_species_caption(media_species.get(media['id'], []))
 
             if caption:
-                c.setFont("Helvetica-Oblique", 8)
-                c.setFillColor(colors.HexColor("#666666"))
-
-                # Gérer caption multi-lignes
-                max_caption_width = pdf_img_width
-                from reportlab.pdfbase.pdfmetrics import stringWidth
-
-                if stringWidth(caption, "Helvetica-Oblique", 8) > max_caption_width:
-                    # Tronquer si trop long
-                    while stringWidth(caption + "...", "Helvetica-Oblique", 8) > max_caption_width and len(caption) > 20:
-                        caption = caption[:-1]
-                    caption += "..."
-
-                c.drawString(MARGIN_LEFT, y, caption)
-                y -= 12
-                c.setFillColor(colors.black)
+                # Caption multi-lignes sur la largeur de la photo
+                y = _draw_wrapped_text(c, caption, CAPTION_STYLE,
+                                       MARGIN_LEFT, y, pdf_img_width, max_lines=2)
 
             y -= 10
 
@@ -813,20 +1254,41 @@ def _add_photo_gallery(c: canvas.Canvas, dive_media: List[Dict[str, Any]],
     return y
 
 
-def _format_species_caption(media_id: int, dive_species: List[Dict[str, Any]]) -> str:
+@lru_cache(maxsize=64)
+def _load_photo_thumbnail(photo_path: str, mtime_ns: int,
+                          target_px: Tuple[int, int]) -> Tuple[bytes, Tuple[int, int]]:
+    """
+    Réduit une photo à la taille d'affichage et la réencode en JPEG.
+
+    Les photos d'appareil (plusieurs mégapixels) sont sinon intégrées en pleine
+    résolution dans le PDF. Le résultat est mis en cache ; la date de
+    modification fait partie de la clé pour ignorer une photo remplacée.
+
+    Args:
+        photo_path: Chemin de la photo
+        mtime_ns: Date de modification du fichier (clé de cache)
+        target_px: Taille maximale (largeur, hauteur) en pixels
+
+    Returns:
+        Tuple (données JPEG, (largeur, hauteur) en pixels)
+    """
+    with PILImage.open(photo_path) as img:
+        img.thumbnail(target_px, PILImage.LANCZOS)
+        buf = io.BytesIO()
+        img.convert('RGB').save(buf, 'JPEG', quality=PHOTO_JPEG_QUALITY, optimize=True)
+        return buf.getvalue(), img.size
+
+
+def _format_species_caption(media_species: List[Dict[str, Any]]) -> str:
     """
     Formate la caption d'une photo avec les espèces identifiées.
 
     Args:
-        media_id: ID du média
-        dive_species: Liste complète des espèces de la plongée
+        media_species: Espèces identifiées sur la photo
 
     Returns:
         Caption formatée
     """
-    # Récupérer les espèces pour ce média
-    media_species = species_recognition.get_media_species(media_id)
-
     if not media_species:
         return ""
 
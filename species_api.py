@@ -8,22 +8,484 @@ Utilise principalement WoRMS (World Register of Marine Species) pour :
 - Comparer avec les détections IA
 """
 
+import asyncio
+import codecs
+import json
+import sqlite3
+import threading
 import requests
-from typing import Optional, Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from functools import lru_cache
+from urllib.parse import quote
+from typing import Optional, Dict, List, Any, Tuple, Iterator
+from config import config
 from logger import get_logger
 import time
 
+try:
+    import orjson  # Décodeur JSON plus rapide (optionnel)
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 logger = get_logger(__name__)
 
 # API WoRMS (World Register of Marine Species)
 WORMS_BASE_URL = "https://www.marinespecies.org/rest"
 WORMS_TIMEOUT = 10  # secondes
+WORMS_USER_AGENT = "dive-analyzer/1.0"
+WORMS_MAX_REQUESTS_PER_SECOND = 15  # Marge sous la limite WoRMS (~180 / 10 s)
+
+# Endpoints WoRMS (les noms sont encodés avec quote avant insertion)
+_URL_RECORDS_BY_NAME = WORMS_BASE_URL + "/AphiaRecordsByName/{}"
+_URL_RECORDS_BY_NAMES = WORMS_BASE_URL + "/AphiaRecordsByNames"
+_URL_VERNACULARS = WORMS_BASE_URL + "/AphiaVernacularsByAphiaID/{}"
+
+# Requêtes WoRMS simultanées (limitées par le pool de la session et le débit)
+WORMS_MAX_WORKERS = 8
+
+# Taille des caches des réponses WoRMS (LRU, éviction automatique)
+WORMS_CACHE_SIZE = 2048
+
+# Cache disque des réponses WoRMS, partagé entre sessions (données taxonomiques stables)
+WORMS_DISK_CACHE_PATH = config.APP_DIR / "worms_cache.db"
+WORMS_DISK_CACHE_TTL_S = 30 * 24 * 3600  # 30 jours
+
+# Durée de vie des résultats négatifs (nom inconnu : faute de frappe, espèce ajoutée depuis...)
+WORMS_NEGATIVE_TTL_S = 3600  # 1 heure en mémoire
+WORMS_DISK_NEGATIVE_TTL_S = 24 * 3600  # 1 jour sur disque
+
+# Paramètres de la recherche exacte (communs à la recherche simple et groupée)
+_EXACT_SEARCH_PARAMS = {
+    'like': 'false',  # Correspondance exacte
+    'marine_only': 'true'  # Uniquement espèces marines
+}
+
+# Champs d'un WormsRecord : (attribut, clé de to_dict, champ WoRMS, valeur par défaut)
+_WORMS_FIELD_MAP = (
+    ('aphia_id', 'aphia_id', 'AphiaID', None),
+    ('scientific_name', 'scientific_name', 'scientificname', None),
+    ('authority', 'authority', 'authority', None),
+    ('status', 'status', 'status', None),  # accepted, unaccepted, etc.
+    ('rank', 'rank', 'rank', None),  # Species, Genus, etc.
+    ('valid_name', 'valid_name', 'valid_name', None),  # Si synonyme, le nom valide
+    ('kingdom', 'kingdom', 'kingdom', None),
+    ('phylum', 'phylum', 'phylum', None),
+    ('class_', 'class', 'class', None),
+    ('order', 'order', 'order', None),
+    ('family', 'family', 'family', None),
+    ('genus', 'genus', 'genus', None),
+    ('is_marine', 'isMarine', 'isMarine', False),
+    ('is_brackish', 'isBrackish', 'isBrackish', False),
+    ('is_freshwater', 'isFreshwater', 'isFreshwater', False),
+    ('is_terrestrial', 'isTerrestrial', 'isTerrestrial', False),
+    ('is_extinct', 'isExtinct', 'isExtinct', False),
+    ('match_type', 'match_type', 'match_type', 'exact'),
+)
+
+# Libellés du résumé d'espèce (voir get_species_info_summary)
+_SUMMARY_TAXONOMY_LABELS = (('family', "Famille"), ('order', "Ordre"), ('class_', "Classe"))
+_SUMMARY_HABITAT_LABELS = (('is_marine', "🌊 Marin"), ('is_brackish', "💧 Saumâtre"), ('is_freshwater', "🏞️ Eau douce"))
+
+# Nombre maximum de noms par requête AphiaRecordsByNames
+WORMS_BATCH_SIZE = 50
+
+
+def _create_session() -> requests.Session:
+    """
+    Crée la session HTTP partagée pour les appels WoRMS.
+
+    La session garde les connexions ouvertes (keep-alive) : les appels
+    successifs évitent une nouvelle poignée de main TCP + TLS. Les erreurs
+    transitoires (429, 5xx) sont retentées avec un délai croissant.
+
+    Returns:
+        Session configurée
+    """
+    retry = Retry(
+        total=5,
+        backoff_factor=1.0,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST"]),
+        respect_retry_after_header=True,  # Délai imposé par WoRMS en cas de 429
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=20)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.headers.update({
+        "User-Agent": WORMS_USER_AGENT,
+        "Accept": "application/json",
+    })
+    return session
+
+
+_SESSION = _create_session()
+
+
+class _RateLimiter:
+    """
+    Limiteur de débit à seau de jetons, partagé entre threads.
+
+    WoRMS bride les clients au-delà d'environ 180 requêtes / 10 s : les
+    appels sont espacés pour rester sous ce seuil même en rafale.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        Args:
+            rate: Jetons ajoutés par seconde
+            capacity: Nombre maximum de jetons (taille des rafales)
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Attend qu'un jeton soit disponible puis le consomme."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # Un solde négatif est une dette : les appels suivants attendent d'autant plus
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
 
-# Cache pour éviter les requêtes répétées
-_species_cache: Dict[str, Dict[str, Any]] = {}
+        if wait > 0:
+            time.sleep(wait)
 
 
-def search_worms_species(scientific_name: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
+_RATE_LIMITER = _RateLimiter(rate=WORMS_MAX_REQUESTS_PER_SECOND, capacity=WORMS_MAX_REQUESTS_PER_SECOND)
+
+# Pool de threads partagé : les appels WoRMS sont limités par la latence réseau
+_EXECUTOR = ThreadPoolExecutor(max_workers=WORMS_MAX_WORKERS, thread_name_prefix="worms")
+
+
+def _worms_get(url: str, params: Optional[Dict[str, Any]] = None, stream: bool = False) -> requests.Response:
+    """
+    Effectue un GET WoRMS via la session partagée, sous limitation de débit.
+
+    Args:
+        url: URL de l'endpoint
+        params: Paramètres de requête
+        stream: Ne pas télécharger le corps d'avance (lecture via iter_content)
+
+    Returns:
+        Réponse HTTP (statut non vérifié)
+    """
+    _RATE_LIMITER.acquire()
+    return _SESSION.get(url, params=params, timeout=WORMS_TIMEOUT, stream=stream)
+
+
+def _iter_json_array(response: requests.Response, chunk_size: int = 8192) -> Iterator[Any]:
+    """
+    Décode au fil de l'eau les éléments d'un tableau JSON de premier niveau.
+
+    Le corps est lu par blocs : l'appelant peut s'arrêter après quelques
+    éléments sans télécharger ni décoder le reste de la réponse.
+
+    Args:
+        response: Réponse ouverte avec stream=True
+        chunk_size: Taille des blocs lus
+
+    Yields:
+        Éléments du tableau, dans l'ordre
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    buffer = ''
+    started = False
+
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        buffer += utf8.decode(chunk)
+        pos = 0
+
+        while True:
+            # Sauter les blancs et séparateurs entre éléments
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+                pos += 1
+            if pos >= len(buffer):
+                break
+
+            if not started:
+                if buffer[pos] != '[':
+                    raise ValueError("Réponse WoRMS inattendue (tableau JSON attendu)")
+                started = True
+                pos += 1
+                continue
+
+            if buffer[pos] == ']':
+                return
+
+            try:
+                item, pos = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                break  # Élément incomplet : attendre le bloc suivant
+
+            yield item
+
+        buffer = buffer[pos:]
+
+
+_disk_cache_state = threading.local()
+
+
+def _disk_cache_connection() -> sqlite3.Connection:
+    """
+    Retourne la connexion au cache disque du thread courant (créée au besoin).
+
+    Returns:
+        Connexion SQLite au fichier WORMS_DISK_CACHE_PATH
+    """
+    conn = getattr(_disk_cache_state, 'conn', None)
+    if conn is None:
+        conn = sqlite3.connect(WORMS_DISK_CACHE_PATH)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS worms_responses ("
+            "key TEXT PRIMARY KEY, payload TEXT NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        _disk_cache_state.conn = conn
+    return conn
+
+
+def _disk_cache_key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """
+    Construit la clé de cache disque d'une requête (URL complète encodée).
+
+    Args:
+        url: URL de l'endpoint
+        params: Paramètres de requête
+
+    Returns:
+        URL préparée, identique à celle envoyée à WoRMS
+    """
+    return requests.Request('GET', url, params=params).prepare().url
+
+
+def _disk_cache_get(key: str) -> Tuple[bool, Any]:
+    """
+    Lit une réponse WoRMS dans le cache disque.
+
+    Args:
+        key: Clé de la requête (voir _disk_cache_key)
+
+    Returns:
+        Tuple (trouvée, données JSON) ; les entrées expirées sont ignorées
+    """
+    try:
+        row = _disk_cache_connection().execute(
+            "SELECT payload, fetched_at FROM worms_responses WHERE key = ? AND fetched_at > ?",
+            (key, time.time() - WORMS_DISK_CACHE_TTL_S)
+        ).fetchone()
+    except sqlite3.Error as e:
+        logger.error("Erreur de lecture du cache WoRMS : %s", e)
+        return False, None
+
+    if row is None:
+        return False, None
+
+    data = _json_loads(row[0])
+
+    # Réponse vide (rien trouvé) : durée de vie plus courte
+    if not data and row[1] <= time.time() - WORMS_DISK_NEGATIVE_TTL_S:
+        return False, None
+    return True, data
+
+
+def _disk_cache_put(key: str, data: Any) -> None:
+    """
+    Enregistre une réponse WoRMS dans le cache disque.
+
+    Args:
+        key: Clé de la requête (voir _disk_cache_key)
+        data: Données JSON de la réponse (None si WoRMS n'a rien trouvé)
+    """
+    try:
+        conn = _disk_cache_connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO worms_responses (key, payload, fetched_at) VALUES (?, ?, ?)",
+                (key, json.dumps(data), time.time())
+            )
+    except sqlite3.Error as e:
+        logger.error("Erreur d'écriture du cache WoRMS : %s", e)
+
+
+def _worms_get_json(url: str, params: Optional[Dict[str, Any]] = None) -> Any:
+    """
+    Effectue un GET WoRMS et retourne le JSON, en passant par le cache disque.
+
+    Args:
+        url: URL de l'endpoint
+        params: Paramètres de requête
+
+    Returns:
+        Données JSON de la réponse (None si réponse vide, ex. 204)
+
+    Raises:
+        requests.exceptions.RequestException: En cas d'erreur réseau ou HTTP (non mise en cache)
+    """
+    key = _disk_cache_key(url, params)
+    found, data = _disk_cache_get(key)
+    if found:
+        return data
+
+    response = _worms_get(url, params=params)
+    response.raise_for_status()
+
+    # WoRMS répond 204 (corps vide) quand il ne trouve rien
+    data = _json_loads(response.content) if response.content else None
+    _disk_cache_put(key, data)
+    return data
+
+
+@dataclass(frozen=True)
+class WormsRecord:
+    """
+    Fiche WoRMS d'une espèce, telle que mise en cache.
+
+    Classe à __slots__ (pas de __dict__ par instance) : les caches peuvent
+    contenir des milliers de fiches. to_dict() fournit l'ancien format
+    dictionnaire (clés WoRMS, ex: 'class', 'isMarine').
+
+    __slots__ est déclaré à la main (dataclass(slots=True) demande Python
+    3.10) ; __getstate__ / __setstate__ permettent copy et pickle malgré
+    frozen=True.
+    """
+
+    __slots__ = tuple(attr for attr, _, _, _ in _WORMS_FIELD_MAP) + ('common_names', 'url')
+
+    aphia_id: Optional[int]
+    scientific_name: Optional[str]
+    authority: Optional[str]
+    status: Optional[str]
+    rank: Optional[str]
+    valid_name: Optional[str]
+    kingdom: Optional[str]
+    phylum: Optional[str]
+    class_: Optional[str]
+    order: Optional[str]
+    family: Optional[str]
+    genus: Optional[str]
+    is_marine: bool
+    is_brackish: bool
+    is_freshwater: bool
+    is_terrestrial: bool
+    is_extinct: bool
+    match_type: str
+    common_names: Tuple[str, ...]
+    url: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Convertit la fiche en dictionnaire.
+
+        Returns:
+            Dictionnaire au format de search_worms_species (avant WormsRecord)
+        """
+        data = {key: getattr(self, attr) for attr, key, _, _ in _WORMS_FIELD_MAP}
+        data['common_names'] = list(self.common_names)
+        data['url'] = self.url
+        return data
+
+    def __getstate__(self) -> Tuple[Any, ...]:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+
+class _WormsNotFound(Exception):
+    """Espèce absente de WoRMS (exception : le résultat n'est pas mis en cache)."""
+
+
+# Fiches WoRMS par nom normalisé, de la moins à la plus récemment utilisée
+# (partagées par search_worms_species et search_worms_species_batch)
+_records: Dict[str, WormsRecord] = {}
+_records_lock = threading.Lock()
+
+# Noms normalisés inconnus de WoRMS -> instant d'expiration (time.monotonic)
+_not_found: Dict[str, float] = {}
+_not_found_lock = threading.Lock()
+
+
+def _is_known_not_found(key: str) -> bool:
+    """
+    Indique si un nom a été récemment signalé inconnu par WoRMS.
+
+    Args:
+        key: Nom normalisé (voir _normalize_key)
+
+    Returns:
+        True si le résultat négatif est encore valide
+    """
+    expires_at = _not_found.get(key)
+    if expires_at is None:
+        return False
+    if expires_at > time.monotonic():
+        return True
+
+    with _not_found_lock:
+        _not_found.pop(key, None)
+    return False
+
+
+def _get_cached_record(key: str) -> Optional[WormsRecord]:
+    """
+    Retourne la fiche en cache pour un nom, sans requête réseau.
+
+    Args:
+        key: Nom normalisé (voir _normalize_key)
+
+    Returns:
+        Fiche WoRMS, ou None si le nom n'est pas en cache
+    """
+    with _records_lock:
+        record = _records.pop(key, None)
+        if record is not None:
+            # Remise en fin de dictionnaire : entrée la plus récemment utilisée
+            _records[key] = record
+        return record
+
+
+def _cache_record(key: str, record: WormsRecord) -> None:
+    """
+    Met une fiche en cache (au plus WORMS_CACHE_SIZE fiches).
+
+    Args:
+        key: Nom normalisé (voir _normalize_key)
+        record: Fiche WoRMS
+    """
+    with _records_lock:
+        _records.pop(key, None)
+        if len(_records) >= WORMS_CACHE_SIZE:
+            # La fiche la moins récemment utilisée sort
+            del _records[next(iter(_records))]
+        _records[key] = record
+
+
+def _remember_not_found(key: str) -> None:
+    """
+    Mémorise un résultat négatif pour WORMS_NEGATIVE_TTL_S secondes.
+
+    Args:
+        key: Nom normalisé (voir _normalize_key)
+    """
+    with _not_found_lock:
+        # Taille bornée comme les caches LRU : les entrées les plus anciennes sortent
+        if len(_not_found) >= WORMS_CACHE_SIZE:
+            del _not_found[next(iter(_not_found))]
+        _not_found[key] = time.monotonic() + WORMS_NEGATIVE_TTL_S
+
+
+def search_worms_species(scientific_name: str, use_cache: bool = True) -> Optional[WormsRecord]:
     """
     Recherche une espèce dans WoRMS par nom scientifique.
 
@@ -32,9 +494,9 @@ def search_worms_species(scientific_name: str, use_cache: bool = True) -> Option
         use_cache: Utiliser le cache pour éviter les requêtes répétées
 
     Returns:
-        Dictionnaire avec les informations de l'espèce, ou None si non trouvée
+        Fiche WoRMS de l'espèce (partagée avec le cache, non modifiable), ou None si non trouvée
 
-    Exemple de retour:
+    Exemple de retour (to_dict):
     {
         'aphia_id': 275717,
         'scientific_name': 'Amphiprion ocellaris',
@@ -62,83 +524,248 @@ def search_worms_species(scientific_name: str, use_cache: bool = True) -> Option
         return None
 
     scientific_name = scientific_name.strip()
+    key = _normalize_key(scientific_name)
 
-    # Vérifier le cache
-    if use_cache and scientific_name in _species_cache:
-        logger.debug(f"Espèce trouvée dans le cache : {scientific_name}")
-        return _species_cache[scientific_name]
+    if use_cache and _is_known_not_found(key):
+        return None
+
+    if use_cache:
+        record = _get_cached_record(key)
+        if record is not None:
+            return record
 
     try:
-        logger.info(f"Recherche WoRMS pour : {scientific_name}")
+        record = _search_worms_species_uncached(key)
+        if use_cache:
+            _cache_record(key, record)
+        return record
+
+    except _WormsNotFound:
+        logger.info("Aucun résultat WoRMS pour : %s", scientific_name)
+        _remember_not_found(key)
+        return None
+    except requests.exceptions.RequestException as e:
+        # Inclut les timeouts (requests.exceptions.Timeout)
+        logger.error("Erreur réseau lors de la recherche WoRMS pour %s : %s", scientific_name, e)
+        return None
+    except Exception as e:
+        logger.error("Erreur inattendue lors de la recherche WoRMS : %s", e)
+        return None
 
-        # Endpoint pour recherche par nom
-        url = f"{WORMS_BASE_URL}/AphiaRecordsByName/{scientific_name}"
-        params = {
-            'like': 'false',  # Correspondance exacte
-            'marine_only': 'true'  # Uniquement espèces marines
-        }
 
-        response = requests.get(url, params=params, timeout=WORMS_TIMEOUT)
-        response.raise_for_status()
+def _normalize_key(scientific_name: str) -> str:
+    """
+    Normalise un nom scientifique pour servir de clé de cache.
 
-        results = response.json()
+    Casse et espaces superflus sont ignorés : "Amphiprion  Ocellaris" et
+    "amphiprion ocellaris" partagent la même entrée.
 
-        if not results or len(results) == 0:
-            logger.info(f"Aucun résultat WoRMS pour : {scientific_name}")
-            return None
+    Args:
+        scientific_name: Nom scientifique saisi
 
-        # Prendre le premier résultat (correspondance exacte)
-        species_data = results[0]
+    Returns:
+        Nom en minuscules (casefold), espaces internes réduits à un seul
+    """
+    return " ".join(scientific_name.split()).casefold()
+
+
+def _search_worms_species_uncached(scientific_name: str) -> WormsRecord:
+    """
+    Interroge WoRMS pour un nom scientifique et formate le résultat.
+
+    Les erreurs sont propagées (et non converties en None) pour que le cache
+    ne mémorise que les réponses valides.
+
+    Args:
+        scientific_name: Nom scientifique normalisé (voir _normalize_key)
+
+    Returns:
+        Fiche WoRMS (voir search_worms_species)
+
+    Raises:
+        _WormsNotFound: Si WoRMS ne connaît pas ce nom
+        requests.exceptions.RequestException: En cas d'erreur réseau
+    """
+    # Graphie usuelle : genre en majuscule, épithètes en minuscules
+    query_name = scientific_name.capitalize()
+    logger.info("Recherche WoRMS pour : %s", query_name)
+
+    # Endpoint pour recherche par nom
+    url = _URL_RECORDS_BY_NAME.format(quote(query_name, safe=''))
+
+    # Vide (None) quand le nom est inconnu
+    results = _worms_get_json(url, params=_EXACT_SEARCH_PARAMS)
+
+    return _build_worms_record(scientific_name, results)
+
+
+def _build_worms_record(scientific_name: str, results: Optional[List[Dict[str, Any]]]) -> WormsRecord:
+    """
+    Formate la réponse WoRMS d'une recherche exacte en fiche.
+
+    Args:
+        scientific_name: Nom scientifique normalisé (voir _normalize_key)
+        results: Enregistrements WoRMS renvoyés pour ce nom (vide ou None si inconnu)
+
+    Returns:
+        Fiche WoRMS (voir search_worms_species)
+
+    Raises:
+        _WormsNotFound: Si WoRMS ne connaît pas ce nom
+    """
+    if not results or len(results) == 0:
+        raise _WormsNotFound(scientific_name)
+
+    # Prendre le premier résultat (correspondance exacte)
+    species_data = results[0]
+
+    # Formater les données, enrichies des noms communs
+    fields = {attr: species_data.get(field, default) for attr, _, field, default in _WORMS_FIELD_MAP}
+    aphia_id = fields['aphia_id']
+    record = WormsRecord(
+        **fields,
+        common_names=tuple(get_worms_common_names(aphia_id)) if aphia_id else (),
+        url=species_data.get('url') or f"https://www.marinespecies.org/aphia.php?p=taxdetails&id={aphia_id}"
+    )
+
+    logger.info("Espèce trouvée dans WoRMS : %s (AphiaID: %s)", record.scientific_name, record.aphia_id)
+
+    return record
+
+
+def clear_worms_caches(include_disk: bool = False) -> None:
+    """
+    Vide les caches des réponses WoRMS.
+
+    Args:
+        include_disk: Vider aussi le cache disque partagé entre sessions
+    """
+    with _records_lock:
+        _records.clear()
+    _get_worms_common_names_cached.cache_clear()
+    with _not_found_lock:
+        _not_found.clear()
 
-        # Enrichir avec les noms communs
-        aphia_id = species_data.get('AphiaID')
-        if aphia_id:
-            common_names = get_worms_common_names(aphia_id)
-            species_data['common_names'] = common_names
+    if include_disk:
+        try:
+            conn = _disk_cache_connection()
+            with conn:
+                conn.execute("DELETE FROM worms_responses")
+        except sqlite3.Error as e:
+            logger.error("Erreur lors du vidage du cache WoRMS : %s", e)
+
+    logger.info("Caches WoRMS vidés")
+
+
+def search_worms_species_batch(scientific_names: List[str]) -> Dict[str, Optional[WormsRecord]]:
+    """
+    Recherche plusieurs espèces dans WoRMS en un minimum de requêtes.
+
+    Les noms déjà en cache sont servis directement ; les autres sont envoyés
+    par lots de WORMS_BATCH_SIZE à l'endpoint AphiaRecordsByNames (une
+    requête par lot au lieu d'une par nom), puis mis en cache.
+
+    Args:
+        scientific_names: Noms scientifiques à rechercher
+
+    Returns:
+        Dictionnaire {nom nettoyé: fiche WoRMS, ou None si non trouvée}
+    """
+    if not scientific_names:
+        return {}
+
+    names = list(dict.fromkeys(name.strip() for name in scientific_names if name and name.strip()))
+    keys = {name: _normalize_key(name) for name in names}
+    results: Dict[str, Optional[WormsRecord]] = {}
+
+    # 1. Noms déjà en cache (sans requête réseau)
+    misses = []
+    for key in dict.fromkeys(keys.values()):
+        if _is_known_not_found(key):
+            results[key] = None
+            continue
+        record = _get_cached_record(key)
+        if record is None:
+            misses.append(key)
         else:
-            species_data['common_names'] = []
-
-        # Formater les données
-        formatted_data = {
-            'aphia_id': species_data.get('AphiaID'),
-            'scientific_name': species_data.get('scientificname'),
-            'authority': species_data.get('authority'),
-            'status': species_data.get('status'),  # accepted, unaccepted, etc.
-            'rank': species_data.get('rank'),  # Species, Genus, etc.
-            'valid_name': species_data.get('valid_name'),  # Si synonyme, le nom valide
-            'kingdom': species_data.get('kingdom'),
-            'phylum': species_data.get('phylum'),
-            'class': species_data.get('class'),
-            'order': species_data.get('order'),
-            'family': species_data.get('family'),
-            'genus': species_data.get('genus'),
-            'isMarine': species_data.get('isMarine', False),
-            'isBrackish': species_data.get('isBrackish', False),
-            'isFreshwater': species_data.get('isFreshwater', False),
-            'isTerrestrial': species_data.get('isTerrestrial', False),
-            'isExtinct': species_data.get('isExtinct', False),
-            'match_type': species_data.get('match_type', 'exact'),
-            'common_names': species_data.get('common_names', []),
-            'url': species_data.get('url', f"https://www.marinespecies.org/aphia.php?p=taxdetails&id={aphia_id}")
-        }
+            results[key] = record
+
+    # 2. Noms manquants, par lots
+    for start in range(0, len(misses), WORMS_BATCH_SIZE):
+        chunk = misses[start:start + WORMS_BATCH_SIZE]
+
+        try:
+            prefetched = _fetch_worms_records_batch(chunk)
+        except requests.exceptions.RequestException as e:
+            logger.error("Erreur réseau lors de la recherche WoRMS groupée : %s", e)
+            results.update({key: None for key in chunk})
+            continue
+
+        # Noms communs du lot téléchargés en parallèle (mis en cache pour le formatage)
+        aphia_ids = {records[0].get('AphiaID') for records in prefetched.values() if records}
+        list(_EXECUTOR.map(get_worms_common_names, [aphia_id for aphia_id in aphia_ids if aphia_id]))
+
+        for key in chunk:
+            try:
+                record = _build_worms_record(key, prefetched.get(key))
+                _cache_record(key, record)
+                results[key] = record
+            except _WormsNotFound:
+                logger.info("Aucun résultat WoRMS pour : %s", key)
+                _remember_not_found(key)
+                results[key] = None
+            except Exception as e:
+                logger.error("Erreur inattendue lors de la recherche WoRMS : %s", e)
+                results[key] = None
+
+    return {name: results[keys[name]] for name in names}
+
+
+def _fetch_worms_records_batch(scientific_names: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Interroge l'endpoint AphiaRecordsByNames pour un lot de noms.
 
-        # Mettre en cache
-        _species_cache[scientific_name] = formatted_data
+    Args:
+        scientific_names: Noms scientifiques normalisés (WORMS_BATCH_SIZE maximum)
 
-        logger.info(f"Espèce trouvée dans WoRMS : {formatted_data['scientific_name']} "
-                   f"(AphiaID: {formatted_data['aphia_id']})")
+    Returns:
+        Dictionnaire {nom normalisé: liste des enregistrements WoRMS (vide si inconnu)}
 
-        return formatted_data
+    Raises:
+        requests.exceptions.RequestException: En cas d'erreur réseau
+    """
+    # Réponses déjà sur disque, sous la clé de la recherche exacte individuelle
+    records_by_name: Dict[str, List[Dict[str, Any]]] = {}
+    # Graphie usuelle envoyée à WoRMS, comme pour la recherche individuelle
+    query_names = {name: name.capitalize() for name in scientific_names}
+    keys = {
+        name: _disk_cache_key(_URL_RECORDS_BY_NAME.format(quote(query_names[name], safe='')), _EXACT_SEARCH_PARAMS)
+        for name in scientific_names
+    }
+    for name, key in keys.items():
+        found, records = _disk_cache_get(key)
+        if found:
+            records_by_name[name] = records or []
 
-    except requests.exceptions.Timeout:
-        logger.error(f"Timeout lors de la recherche WoRMS pour {scientific_name}")
-        return None
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Erreur réseau lors de la recherche WoRMS : {e}")
-        return None
-    except Exception as e:
-        logger.error(f"Erreur inattendue lors de la recherche WoRMS : {e}")
-        return None
+    to_fetch = [name for name in scientific_names if name not in records_by_name]
+    if not to_fetch:
+        return records_by_name
+
+    logger.info("Recherche WoRMS groupée pour %s nom(s)", len(to_fetch))
+
+    url = _URL_RECORDS_BY_NAMES
+    params = {'scientificnames[]': [query_names[name] for name in to_fetch], **_EXACT_SEARCH_PARAMS}
+
+    response = _worms_get(url, params=params)
+    response.raise_for_status()
+
+    # Un tableau de résultats par nom, dans l'ordre de la requête
+    batches = _json_loads(response.content) if response.content else []
+    for name, records in zip(to_fetch, batches):
+        records_by_name[name] = records or []
+        _disk_cache_put(keys[name], records or None)
+
+    return records_by_name
 
 
 def get_worms_common_names(aphia_id: int) -> List[str]:
@@ -152,44 +779,57 @@ def get_worms_common_names(aphia_id: int) -> List[str]:
         Liste des noms communs
     """
     try:
-        url = f"{WORMS_BASE_URL}/AphiaVernacularsByAphiaID/{aphia_id}"
-        response = requests.get(url, timeout=WORMS_TIMEOUT)
-        response.raise_for_status()
-
-        vernaculars = response.json()
-
-        if not vernaculars:
-            return []
-
-        # Extraire les noms (priorité aux noms français et anglais)
-        names = []
-        for vernacular in vernaculars:
-            name = vernacular.get('vernacular')
-            language = vernacular.get('language_code', '').lower()
-
-            # Priorité : français, puis anglais, puis autres
-            if language == 'fra' and name:
-                names.insert(0, name)
-            elif language == 'eng' and name:
-                names.append(name)
-            elif name:
-                names.append(name)
-
-        # Dédupliquer tout en gardant l'ordre
-        seen = set()
-        unique_names = []
-        for name in names:
-            if name.lower() not in seen:
-                seen.add(name.lower())
-                unique_names.append(name)
-
-        return unique_names[:5]  # Limiter à 5 noms
+        # Copie : la liste en cache ne doit pas être modifiée par l'appelant
+        return list(_get_worms_common_names_cached(aphia_id))
 
     except Exception as e:
-        logger.error(f"Erreur lors de la récupération des noms communs : {e}")
+        logger.error("Erreur lors de la récupération des noms communs : %s", e)
         return []
 
 
+@lru_cache(maxsize=WORMS_CACHE_SIZE)
+def _get_worms_common_names_cached(aphia_id: int) -> Tuple[str, ...]:
+    """
+    Interroge WoRMS pour les noms communs d'un AphiaID (résultat mis en cache).
+
+    Args:
+        aphia_id: Identifiant AphiaID de l'espèce
+
+    Returns:
+        Tuple des noms communs (5 maximum, français en premier)
+
+    Raises:
+        requests.exceptions.RequestException: En cas d'erreur réseau (non mise en cache)
+    """
+    url = _URL_VERNACULARS.format(aphia_id)
+    vernaculars = _worms_get_json(url)
+
+    if not vernaculars:
+        return ()
+
+    # Extraire les noms par langue (priorité : français, puis anglais, puis autres)
+    fra, eng, other = [], [], []
+    for vernacular in vernaculars:
+        name = vernacular.get('vernacular')
+        if not name:
+            continue
+
+        language = vernacular.get('language_code', '').lower()
+        if language == 'fra':
+            fra.append(name)
+        elif language == 'eng':
+            eng.append(name)
+        else:
+            other.append(name)
+
+    # Dédupliquer sans tenir compte de la casse, en gardant la première graphie
+    unique_names: Dict[str, str] = {}
+    for name in fra + eng + other:
+        unique_names.setdefault(name.lower(), name)
+
+    return tuple(unique_names.values())[:5]  # Limiter à 5 noms
+
+
 def fuzzy_search_worms(query: str, limit: int = 10) -> List[Dict[str, Any]]:
     """
     Recherche floue dans WoRMS (pour suggestions/autocomplétion).
@@ -201,28 +841,38 @@ def fuzzy_search_worms(query: str, limit: int = 10) -> List[Dict[str, Any]]:
     Returns:
         Liste de dictionnaires avec les résultats
     """
-    if not query or len(query) < 3:
+    if not query:
+        return []
+
+    query = query.strip()
+    if len(query) < 3:
         return []
 
     try:
-        url = f"{WORMS_BASE_URL}/AphiaRecordsByName/{query}"
+        url = _URL_RECORDS_BY_NAME.format(quote(query, safe=''))
         params = {
             'like': 'true',  # Recherche floue
             'marine_only': 'true',
             'offset': 1
         }
 
-        response = requests.get(url, params=params, timeout=WORMS_TIMEOUT)
-        response.raise_for_status()
-
-        results = response.json()
-
-        if not results:
-            return []
-
-        # Formater et limiter les résultats
+        # Seuls les `limit` premiers éléments sont lus (et mis en cache)
+        key = f"{_disk_cache_key(url, params)}#limit={limit}"
+        found, results = _disk_cache_get(key)
+
+        if not found:
+            with _worms_get(url, params=params, stream=True) as response:
+                response.raise_for_status()
+                results = []
+                for item in _iter_json_array(response):
+                    results.append(item)
+                    if len(results) >= limit:
+                        break
+            _disk_cache_put(key, results)
+
+        # Formater les résultats
         formatted_results = []
-        for item in results[:limit]:
+        for item in results:
             formatted_results.append({
                 'aphia_id': item.get('AphiaID'),
                 'scientific_name': item.get('scientificname'),
@@ -235,7 +885,7 @@ def fuzzy_search_worms(query: str, limit: int = 10) -> List[Dict[str, Any]]:
         return formatted_results
 
     except Exception as e:
-        logger.error(f"Erreur lors de la recherche floue WoRMS : {e}")
+        logger.error("Erreur lors de la recherche floue WoRMS : %s", e)
         return []
 
 
@@ -258,8 +908,101 @@ def validate_species_name(scientific_name: str) -> Dict[str, Any]:
             'details': dict
         }
     """
-    worms_data = search_worms_species(scientific_name)
+    # Détections IA sans nom : résultat "non trouvé" sans passer par la recherche
+    if not scientific_name or scientific_name.isspace():
+        return _build_validation(None)
+
+    return _build_validation(search_worms_species(scientific_name))
+
+
+def validate_species_names(scientific_names: List[str]) -> Dict[str, Dict[str, Any]]:
+    """
+    Valide plusieurs noms d'espèces avec une recherche WoRMS groupée.
+
+    Args:
+        scientific_names: Noms scientifiques à valider
+
+    Returns:
+        Dictionnaire {nom nettoyé: validation (voir validate_species_name)}
+    """
+    worms_results = search_worms_species_batch(scientific_names)
+    return {name: _build_validation(worms_data) for name, worms_data in worms_results.items()}
+
+
+def validate_species_names_parallel(scientific_names: List[str]) -> List[Dict[str, Any]]:
+    """
+    Valide plusieurs noms d'espèces en lançant les recherches WoRMS en parallèle.
+
+    Chaque nom suit le chemin de validate_species_name (recherche exacte
+    individuelle, en cache) ; les requêtes se recouvrent sur WORMS_MAX_WORKERS
+    threads, dans la limite du débit autorisé par WoRMS.
+
+    Args:
+        scientific_names: Noms scientifiques à valider
+
+    Returns:
+        Validations dans l'ordre des noms (voir validate_species_name)
+    """
+    return list(_EXECUTOR.map(validate_species_name, scientific_names))
+
+
+async def search_worms_species_async(scientific_name: str, use_cache: bool = True) -> Optional[WormsRecord]:
+    """
+    Variante asynchrone de search_worms_species.
+
+    La recherche s'exécute sur le pool partagé (_EXECUTOR) : la boucle
+    d'événements n'est pas bloquée et plusieurs recherches lancées avec
+    asyncio.gather se recouvrent sur les connexions de la session.
+
+    Args:
+        scientific_name: Nom scientifique de l'espèce
+        use_cache: Utiliser le cache si disponible
+
+    Returns:
+        Fiche WoRMS de l'espèce ou None si non trouvée
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, search_worms_species, scientific_name, use_cache)
+
+
+async def get_worms_common_names_async(aphia_id: int) -> List[str]:
+    """
+    Variante asynchrone de get_worms_common_names.
+
+    Args:
+        aphia_id: Identifiant AphiaID de l'espèce
+
+    Returns:
+        Liste des noms communs
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_EXECUTOR, get_worms_common_names, aphia_id)
+
 
+async def validate_many(scientific_names: List[str]) -> List[Dict[str, Any]]:
+    """
+    Valide plusieurs noms d'espèces de façon asynchrone.
+
+    Args:
+        scientific_names: Noms scientifiques à valider
+
+    Returns:
+        Validations dans l'ordre des noms (voir validate_species_name)
+    """
+    worms_results = await asyncio.gather(*(search_worms_species_async(name) for name in scientific_names))
+    return [_build_validation(worms_data) for worms_data in worms_results]
+
+
+def _build_validation(worms_data: Optional[WormsRecord]) -> Dict[str, Any]:
+    """
+    Construit le résultat de validation à partir des données WoRMS.
+
+    Args:
+        worms_data: Résultat de search_worms_species (None si non trouvée)
+
+    Returns:
+        Dictionnaire de validation (voir validate_species_name)
+    """
     if not worms_data:
         return {
             'is_valid': False,
@@ -271,24 +1014,24 @@ def validate_species_name(scientific_name: str) -> Dict[str, Any]:
             'details': {}
         }
 
-    is_accepted = worms_data['status'] == 'accepted'
-    correct_name = worms_data['valid_name'] if worms_data['valid_name'] else worms_data['scientific_name']
+    is_accepted = worms_data.status == 'accepted'
+    correct_name = worms_data.valid_name if worms_data.valid_name else worms_data.scientific_name
 
     # Déterminer la confiance
     confidence = 'high'
-    if worms_data['status'] == 'unaccepted':
+    if worms_data.status == 'unaccepted':
         confidence = 'medium'
-    elif worms_data['status'] not in ['accepted', 'unaccepted']:
+    elif worms_data.status not in ['accepted', 'unaccepted']:
         confidence = 'low'
 
     return {
         'is_valid': True,
-        'is_marine': worms_data.get('isMarine', False),
+        'is_marine': worms_data.is_marine,
         'status': 'accepted' if is_accepted else 'synonym',
         'correct_name': correct_name,
-        'aphia_id': worms_data['aphia_id'],
+        'aphia_id': worms_data.aphia_id,
         'confidence': confidence,
-        'details': worms_data
+        'details': worms_data.to_dict()
     }
 
 
@@ -346,17 +1089,23 @@ def compare_with_ai_detection(ai_species_name: str, confidence_score: float = 0.
     }
 
 
-def get_species_info_summary(scientific_name: str) -> Optional[str]:
+def get_species_info_summary(scientific_name: str, *,
+                             worms_data: Optional[WormsRecord] = None) -> Optional[str]:
     """
     Génère un résumé textuel des informations d'une espèce.
 
     Args:
         scientific_name: Nom scientifique de l'espèce
+        worms_data: Fiche déjà obtenue par search_worms_species, pour éviter
+                    une nouvelle recherche
 
     Returns:
         Résumé formaté en texte, ou None si non trouvé
     """
-    worms_data = search_worms_species(scientific_name)
+    if worms_data is None:
+        if not scientific_name or scientific_name.isspace():
+            return None
+        worms_data = search_worms_species(scientific_name)
 
     if not worms_data:
         return None
@@ -364,42 +1113,30 @@ def get_species_info_summary(scientific_name: str) -> Optional[str]:
     summary_parts = []
 
     # Nom et autorité
-    if worms_data['authority']:
-        summary_parts.append(f"**{worms_data['scientific_name']}** {worms_data['authority']}")
+    if worms_data.authority:
+        summary_parts.append(f"**{worms_data.scientific_name}** {worms_data.authority}")
     else:
-        summary_parts.append(f"**{worms_data['scientific_name']}**")
+        summary_parts.append(f"**{worms_data.scientific_name}**")
 
     # Statut
-    status_emoji = "✅" if worms_data['status'] == 'accepted' else "⚠️"
-    summary_parts.append(f"{status_emoji} Statut: {worms_data['status']}")
+    status_emoji = "✅" if worms_data.status == 'accepted' else "⚠️"
+    summary_parts.append(f"{status_emoji} Statut: {worms_data.status}")
 
     # Taxonomie
-    taxonomy = []
-    if worms_data['family']:
-        taxonomy.append(f"Famille: {worms_data['family']}")
-    if worms_data['order']:
-        taxonomy.append(f"Ordre: {worms_data['order']}")
-    if worms_data['class']:
-        taxonomy.append(f"Classe: {worms_data['class']}")
-
+    taxonomy = " | ".join(
+        f"{label}: {getattr(worms_data, attr)}"
+        for attr, label in _SUMMARY_TAXONOMY_LABELS if getattr(worms_data, attr)
+    )
     if taxonomy:
-        summary_parts.append(" | ".join(taxonomy))
+        summary_parts.append(taxonomy)
 
     # Noms communs
-    if worms_data['common_names']:
-        names_str = ", ".join(worms_data['common_names'])
-        summary_parts.append(f"Noms communs: {names_str}")
+    if worms_data.common_names:
+        summary_parts.append(f"Noms communs: {', '.join(worms_data.common_names)}")
 
     # Habitat
-    habitat_tags = []
-    if worms_data.get('isMarine'):
-        habitat_tags.append("🌊 Marin")
-    if worms_data.get('isBrackish'):
-        habitat_tags.append("💧 Saumâtre")
-    if worms_data.get('isFreshwater'):
-        habitat_tags.append("🏞️ Eau douce")
-
-    if habitat_tags:
-        summary_parts.append(" ".join(habitat_tags))
+    habitat = " ".join(label for attr, label in _SUMMARY_HABITAT_LABELS if getattr(worms_data, attr))
+    if habitat:
+        summary_parts.append(habitat)
 
     return "\n\n".join(summary_parts)
@@ -9,17 +9,179 @@ Fonctionnalités :
 - Gestion du catalogue d'espèces
 """
 
+import atexit
 import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Iterator, Tuple
 from datetime import datetime
 import base64
+import io
 import json
+import mimetypes
+import os
+import re
+from PIL import Image, ImageOps
 from logger import get_logger
-from database import get_connection
+from database import get_connection, get_setting
+
+try:
+    import anthropic  # Requis pour l'analyse IA uniquement
+except ImportError:
+    anthropic = None
 
 logger = get_logger(__name__)
 
+# Nombre maximum d'identifiants par clause IN (limite de paramètres SQLite)
+SQL_BATCH_SIZE = 500
+
+# Lignes lues à la fois par les itérateurs de résultats (iter_search_species, iter_dive_species)
+FETCH_CHUNK_SIZE = 200
+
+# Taille des caches de fiches espèces (lecture par ID / par nom)
+SPECIES_CACHE_SIZE = 4096
+
+# Analyses IA simultanées dans process_images_batch (appels limités par le débit de l'API)
+AI_MAX_WORKERS = 4
+
+# Images envoyées à l'IA : côté le plus long au-delà duquel Claude réduit
+# l'image de toute façon (envoyer plus ne coûte que bande passante et tokens)
+AI_IMAGE_MAX_EDGE = 1568
+AI_IMAGE_JPEG_QUALITY = 85
+AI_IMAGE_CACHE_SIZE = 8  # Analyse + description d'une même photo : une seule préparation
+
+# Taille des blocs lus pour l'encodage base64 (multiple de 3 : pas de remplissage intermédiaire)
+BASE64_CHUNK_SIZE = 48 * 1024
+
+# Objet JSON englobant dans une réponse de l'IA (texte libre autour toléré)
+_JSON_OBJECT_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Types MIME par extension d'image (complété au fil des extensions rencontrées)
+_MIME_BY_SUFFIX = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.webp': 'image/webp',
+    '.gif': 'image/gif',
+}
+
+# Réglages propres à la connexion longue durée du module (journal WAL et
+# synchronous = NORMAL : voir database.get_connection)
+SQLITE_PRAGMAS = (
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA mmap_size = 268435456",  # 256 Mo
+    "PRAGMA cache_size = -65536",  # 64 Mo
+)
+
+# Espèces les plus observées, par le compteur tenu à jour par les triggers
+# (schéma : voir database.init_database)
+TOP_SPECIES_SQL = """
+    SELECT scientific_name, common_name_fr, observation_count
+    FROM species
+    ORDER BY observation_count DESC
+    LIMIT 10
+"""
+
+# Connexion SQLite propre à chaque thread (sqlite3 interdit le partage entre threads).
+# Streamlit exécute chaque rerun dans un nouveau thread : toutes les connexions
+# ouvertes sont recensées par thread, pour refermer celles des threads terminés.
+_thread_state = threading.local()
+_connections: Dict[threading.Thread, sqlite3.Connection] = {}
+_connections_lock = threading.Lock()
+
+
+def _get_connection() -> sqlite3.Connection:
+    """
+    Retourne la connexion du thread courant, ouverte au premier appel.
+
+    La connexion est réutilisée d'un appel à l'autre : le fichier n'est plus
+    rouvert pour chaque requête. À chaque ouverture, les connexions laissées
+    par des threads terminés sont fermées.
+
+    Returns:
+        Connexion SQLite (voir database.get_connection, réglée en plus par
+        SQLITE_PRAGMAS), dont les lignes sont des sqlite3.Row
+    """
+    conn = getattr(_thread_state, 'conn', None)
+    if conn is None:
+        _close_connections(finished_only=True)
+        # Utilisée par ce seul thread, mais refermable depuis un autre une fois celui-ci terminé
+        conn = get_connection(check_same_thread=False)
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        # Lignes accessibles par nom de colonne : dict(row) sans zip() par ligne
+        conn.row_factory = sqlite3.Row
+        _thread_state.conn = conn
+        with _connections_lock:
+            _connections[threading.current_thread()] = conn
+    return conn
+
+
+def _close_connections(finished_only: bool = False) -> None:
+    """
+    Ferme les connexions ouvertes par _get_connection.
+
+    Args:
+        finished_only: Ne fermer que celles des threads terminés (sinon
+            toutes, à la sortie du programme)
+    """
+    with _connections_lock:
+        threads = [t for t in _connections if not (finished_only and t.is_alive())]
+        stale = [_connections.pop(t) for t in threads]
+    for conn in stale:
+        conn.close()
+
+
+atexit.register(_close_connections)
+
+
+@lru_cache(maxsize=1)
+def _fts_available() -> bool:
+    """Indique si l'index plein texte species_fts existe (FTS5 peut manquer à SQLite)."""
+    return _get_connection().execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'species_fts'"
+    ).fetchone() is not None
+
+
+def _iter_rows(cursor: sqlite3.Cursor, chunk: int) -> Iterator[Dict[str, Any]]:
+    """Parcourt un curseur par blocs de `chunk` lignes, converties en dictionnaires."""
+    while True:
+        rows = cursor.fetchmany(chunk)
+        if not rows:
+            break
+        for row in rows:
+            yield dict(row)
+
+
+def _invalidate_species_cache() -> None:
+    """Vide les caches de get_species_by_id / get_species_by_name (après écriture au catalogue)."""
+    _get_species_by_id_cached.cache_clear()
+    _get_species_by_name_cached.cache_clear()
+
+
+@lru_cache(maxsize=8)
+def _get_setting_cached(key: str, default: str = "") -> str:
+    """database.get_setting mis en cache : évite deux requêtes SQLite par image analysée."""
+    return get_setting(key, default)
+
+
+@lru_cache(maxsize=4)
+def _get_anthropic_client(api_key: str):
+    """Client Anthropic partagé par clé API (son pool de connexions HTTP est réutilisé)."""
+    return anthropic.Anthropic(api_key=api_key)
+
+
+def invalidate_settings_cache() -> None:
+    """
+    Vide le cache des paramètres IA (clé API, modèle) et des clients Anthropic.
+
+    À appeler après toute modification de ces paramètres (page Paramètres).
+    """
+    _get_setting_cached.cache_clear()
+    _get_anthropic_client.cache_clear()
+
 
 def add_species(
     scientific_name: str,
@@ -49,23 +211,23 @@ def add_species(
     Returns:
         ID de l'espèce créée, ou None si erreur
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = _get_connection()
 
     try:
-        cursor.execute("""
-            INSERT INTO species
-            (scientific_name, common_name_fr, common_name_en, category,
-             description, conservation_status, habitat, depth_range,
-             image_url, created_date)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            scientific_name, common_name_fr, common_name_en, category,
-            description, conservation_status, habitat, depth_range,
-            image_url, datetime.now().isoformat()
-        ))
-
-        conn.commit()
+        with conn:
+            cursor = conn.execute("""
+                INSERT INTO species
+                (scientific_name, common_name_fr, common_name_en, category,
+                 description, conservation_status, habitat, depth_range,
+                 image_url, created_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
+            """, (
+                scientific_name, common_name_fr, common_name_en, category,
+                description, conservation_status, habitat, depth_range,
+                image_url
+            ))
+
+        _invalidate_species_cache()
         species_id = cursor.lastrowid
         logger.info(f"Espèce ajoutée : {scientific_name} (ID={species_id})")
         return species_id
@@ -74,11 +236,8 @@ def add_species(
         logger.warning(f"L'espèce {scientific_name} existe déjà")
         return None
     except Exception as e:
-        conn.rollback()
         logger.error(f"Erreur lors de l'ajout de l'espèce : {e}")
         return None
-    finally:
-        conn.close()
 
 
 def get_species_by_name(name: str) -> Optional[Dict[str, Any]]:
@@ -91,39 +250,45 @@ def get_species_by_name(name: str) -> Optional[Dict[str, Any]]:
     Returns:
         Dictionnaire avec les informations de l'espèce, ou None
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    # Espaces superflus ignorés : une seule entrée de cache par nom
+    species = _get_species_by_name_cached(name.strip())
+    # Copie : la fiche en cache ne doit pas être modifiée par l'appelant
+    return dict(species) if species else None
+
+
+@lru_cache(maxsize=SPECIES_CACHE_SIZE)
+def _get_species_by_name_cached(name: str) -> Optional[Dict[str, Any]]:
+    """
+    Interroge le catalogue par nom (résultat mis en cache, voir _invalidate_species_cache).
 
-    cursor.execute("""
+    Args:
+        name: Nom à rechercher (scientifique ou commun)
+
+    Returns:
+        Dictionnaire avec les informations de l'espèce, ou None
+    """
+    conn = _get_connection()
+
+    cursor = conn.execute("""
         SELECT id, scientific_name, common_name_fr, common_name_en, category,
                description, conservation_status, habitat, depth_range,
                image_url, created_date
         FROM species
-        WHERE scientific_name = ?
-           OR common_name_fr = ?
-           OR common_name_en = ?
-        LIMIT 1
+        WHERE id = (
+            -- Une recherche indexée par colonne, dans l'ordre de priorité :
+            -- la première correspondance arrête l'évaluation
+            SELECT id FROM species WHERE scientific_name = ?
+            UNION ALL
+            SELECT id FROM species WHERE common_name_fr = ?
+            UNION ALL
+            SELECT id FROM species WHERE common_name_en = ?
+            LIMIT 1
+        )
     """, (name, name, name))
 
     result = cursor.fetchone()
-    conn.close()
-
-    if result:
-        return {
-            'id': result[0],
-            'scientific_name': result[1],
-            'common_name_fr': result[2],
-            'common_name_en': result[3],
-            'category': result[4],
-            'description': result[5],
-            'conservation_status': result[6],
-            'habitat': result[7],
-            'depth_range': result[8],
-            'image_url': result[9],
-            'created_date': result[10]
-        }
 
-    return None
+    return dict(result) if result else None
 
 
 def add_or_get_species(
@@ -136,7 +301,7 @@ def add_or_get_species(
     Ajoute une espèce au catalogue ou récupère son ID si elle existe déjà.
 
     Cette fonction est pratique pour l'analyse d'images : elle évite les doublons
-    en vérifiant d'abord si l'espèce existe déjà dans la base.
+    sur le nom scientifique (contrainte d'unicité de la table species).
 
     Args:
         scientific_name: Nom scientifique (obligatoire)
@@ -147,72 +312,187 @@ def add_or_get_species(
     Returns:
         ID de l'espèce (existante ou nouvellement créée), ou None si erreur
     """
-    # Vérifier si l'espèce existe déjà par nom scientifique
-    existing_species = get_species_by_name(scientific_name)
-
-    if existing_species:
-        logger.debug(f"Espèce existante trouvée : {scientific_name} (ID={existing_species['id']})")
-        return existing_species['id']
-
-    # L'espèce n'existe pas, la créer
-    logger.info(f"Nouvelle espèce détectée : {scientific_name}")
-    species_id = add_species(
-        scientific_name=scientific_name,
-        common_name_fr=common_name_fr,
-        common_name_en=common_name_en,
-        category=category,
-        description="Espèce détectée automatiquement par IA"
-    )
+    conn = _get_connection()
 
-    return species_id
+    try:
+        # Insertion directe : en cas de doublon sur le nom scientifique, aucune
+        # écriture (ni trigger), et pas de fenêtre entre vérification et insertion
+        with conn:
+            cursor = conn.execute("""
+                INSERT INTO species
+                (scientific_name, common_name_fr, common_name_en, category,
+                 description, created_date)
+                VALUES (?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
+                ON CONFLICT(scientific_name) DO NOTHING
+            """, (
+                scientific_name, common_name_fr, common_name_en, category,
+                "Espèce détectée automatiquement par IA"
+            ))
+
+        if cursor.rowcount:
+            _invalidate_species_cache()
+            species_id = cursor.lastrowid
+            logger.info(f"Nouvelle espèce détectée : {scientific_name} (ID={species_id})")
+            return species_id
+
+        result = conn.execute(
+            "SELECT id FROM species WHERE scientific_name = ?", (scientific_name,)
+        ).fetchone()
+        if result is None:
+            return None
+
+        logger.debug(f"Espèce existante trouvée : {scientific_name} (ID={result[0]})")
+        return result[0]
 
+    except Exception as e:
+        logger.error(f"Erreur lors de l'ajout de l'espèce : {e}")
+        return None
 
-def search_species(query: str, category: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+
+def iter_search_species(
+    query: str,
+    category: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+    prefix: bool = True,
+    chunk: int = FETCH_CHUNK_SIZE
+) -> Iterator[Dict[str, Any]]:
     """
-    Recherche des espèces par mot-clé.
+    Recherche des espèces par mot-clé, résultats produits au fil de la lecture.
+
+    Les lignes sont lues par blocs de `chunk` : la mémoire reste stable
+    quelle que soit la taille du résultat.
 
     Args:
         query: Terme de recherche
         category: Filtrer par catégorie (optionnel)
         limit: Nombre maximum de résultats
+        offset: Nombre de résultats à sauter (pagination)
+        prefix: Recherche par début de mot (indexée) ; False pour une
+                recherche de sous-chaîne quelconque (parcours complet)
+        chunk: Nombre de lignes lues à la fois
+
+    Yields:
+        Espèces correspondantes
+    """
+    conn = _get_connection()
+
+    conditions = []
+    params: List[Any] = []
+
+    if category:
+        conditions.append("category = ?")
+        params.append(category)
+
+    if query:
+        condition, condition_params = _name_search_condition(query, prefix)
+        conditions.append(condition)
+        params.extend(condition_params)
+
+    sql = """
+        SELECT id, scientific_name, common_name_fr, common_name_en, category,
+               description, conservation_status, habitat, depth_range
+        FROM species
+    """
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+    sql += " ORDER BY scientific_name LIMIT ? OFFSET ?"
+    params.extend([limit, offset])
+
+    yield from _iter_rows(conn.execute(sql, params), chunk)
+
+
+def search_species(
+    query: str,
+    category: Optional[str] = None,
+    limit: int = 20,
+    offset: int = 0,
+    prefix: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Recherche des espèces par mot-clé (voir iter_search_species).
+
+    Args:
+        query: Terme de recherche
+        category: Filtrer par catégorie (optionnel)
+        limit: Nombre maximum de résultats
+        offset: Nombre de résultats à sauter (pagination)
+        prefix: Recherche par début de mot (indexée) ou sous-chaîne quelconque
 
     Returns:
         Liste d'espèces correspondantes
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    return list(iter_search_species(query, category, limit, offset, prefix))
+
+
+def _name_search_condition(query: str, prefix: bool = True) -> Tuple[str, List[str]]:
+    """
+    Construit la condition SQL de recherche par nom (scientifique ou commun).
+
+    En mode préfixe, chaque mot de la recherche doit commencer un mot d'un
+    des noms : via l'index plein texte (sans tenir compte de la casse ni des
+    accents : "crustace" trouve "crustacé"), ou à défaut par LIKE 'q%' sur le
+    nom entier. Sinon, recherche de sous-chaîne par LIKE '%q%'.
+
+    Args:
+        query: Terme de recherche
+        prefix: Recherche par début de mot plutôt que par sous-chaîne
+
+    Returns:
+        Tuple (condition SQL, paramètres)
+    """
+    terms = query.split()
+
+    if prefix and terms and _fts_available():
+        # Chaque mot entre guillemets (syntaxe FTS5 neutralisée), en préfixe
+        match = " ".join('"' + term.replace('"', '""') + '"*' for term in terms)
+        return "id IN (SELECT rowid FROM species_fts WHERE species_fts MATCH ?)", [match]
+
+    query_pattern = f"{query}%" if prefix else f"%{query}%"
+    return (
+        "(scientific_name LIKE ? OR common_name_fr LIKE ? OR common_name_en LIKE ?)",
+        [query_pattern, query_pattern, query_pattern]
+    )
 
-    query_pattern = f"%{query}%"
+
+def count_species(category: Optional[str] = None, search_query: Optional[str] = None,
+                  prefix: bool = True) -> int:
+    """
+    Compte les espèces du catalogue correspondant aux filtres.
+
+    Utilisé pour la pagination : seul le total est calculé côté SQL,
+    les espèces de la page étant récupérées via get_all_species / search_species.
+
+    Args:
+        category: Filtrer par catégorie (optionnel)
+        search_query: Terme de recherche (mêmes critères que search_species)
+        prefix: Recherche par début de mot (voir search_species)
+
+    Returns:
+        Nombre d'espèces correspondantes
+    """
+    conn = _get_connection()
+
+    conditions = []
+    params = []
 
     if category:
-        cursor.execute("""
-            SELECT id, scientific_name, common_name_fr, common_name_en, category,
-                   description, conservation_status, habitat, depth_range
-            FROM species
-            WHERE category = ?
-              AND (scientific_name LIKE ? OR common_name_fr LIKE ? OR common_name_en LIKE ?)
-            ORDER BY scientific_name
-            LIMIT ?
-        """, (category, query_pattern, query_pattern, query_pattern, limit))
-    else:
-        cursor.execute("""
-            SELECT id, scientific_name, common_name_fr, common_name_en, category,
-                   description, conservation_status, habitat, depth_range
-            FROM species
-            WHERE scientific_name LIKE ? OR common_name_fr LIKE ? OR common_name_en LIKE ?
-            ORDER BY scientific_name
-            LIMIT ?
-        """, (query_pattern, query_pattern, query_pattern, limit))
+        conditions.append("category = ?")
+        params.append(category)
+
+    if search_query:
+        condition, condition_params = _name_search_condition(search_query, prefix)
+        conditions.append(condition)
+        params.extend(condition_params)
 
-    columns = [desc[0] for desc in cursor.description]
-    species_list = []
+    sql = "SELECT COUNT(*) FROM species"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
 
-    for row in cursor.fetchall():
-        species_dict = dict(zip(columns, row))
-        species_list.append(species_dict)
+    cursor = conn.execute(sql, params)
+    total = cursor.fetchone()[0]
 
-    conn.close()
-    return species_list
+    return total
 
 
 def add_species_to_dive(
@@ -239,21 +519,20 @@ def add_species_to_dive(
     Returns:
         ID de l'association créée, ou None si erreur
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = _get_connection()
 
     try:
-        cursor.execute("""
-            INSERT INTO dive_species
-            (dive_id, species_id, media_id, confidence_score, quantity,
-             notes, detected_by, detection_date)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
-            dive_id, species_id, media_id, confidence_score, quantity,
-            notes, detected_by, datetime.now().isoformat()
-        ))
+        with conn:
+            cursor = conn.execute("""
+                INSERT INTO dive_species
+                (dive_id, species_id, media_id, confidence_score, quantity,
+                 notes, detected_by, detection_date)
+                VALUES (?, ?, ?, ?, ?, ?, ?, strftime('%Y-%m-%dT%H:%M:%f', 'now', 'localtime'))
+            """, (
+                dive_id, species_id, media_id, confidence_score, quantity,
+                notes, detected_by
+            ))
 
-        conn.commit()
         association_id = cursor.lastrowid
         logger.info(f"Espèce associée à la plongée : dive_id={dive_id}, species_id={species_id}")
         return association_id
@@ -262,27 +541,24 @@ def add_species_to_dive(
         logger.warning(f"Association déjà existante : dive_id={dive_id}, species_id={species_id}")
         return None
     except Exception as e:
-        conn.rollback()
         logger.error(f"Erreur lors de l'association de l'espèce : {e}")
         return None
-    finally:
-        conn.close()
 
 
-def get_dive_species(dive_id: int) -> List[Dict[str, Any]]:
+def iter_dive_species(dive_id: int, chunk: int = FETCH_CHUNK_SIZE) -> Iterator[Dict[str, Any]]:
     """
-    Récupère toutes les espèces associées à une plongée.
+    Parcourt les espèces associées à une plongée, par blocs de `chunk` lignes.
 
     Args:
         dive_id: ID de la plongée
+        chunk: Nombre de lignes lues à la fois
 
-    Returns:
-        Liste d'espèces avec leurs détails
+    Yields:
+        Espèces avec leurs détails, de la plus récente à la plus ancienne
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = _get_connection()
 
-    cursor.execute("""
+    cursor = conn.execute("""
         SELECT ds.id, ds.species_id, ds.media_id, ds.confidence_score,
                ds.quantity, ds.notes, ds.detected_by, ds.detection_date,
                s.scientific_name, s.common_name_fr, s.common_name_en,
@@ -293,15 +569,20 @@ def get_dive_species(dive_id: int) -> List[Dict[str, Any]]:
         ORDER BY ds.detection_date DESC
     """, (dive_id,))
 
-    columns = [desc[0] for desc in cursor.description]
-    species_list = []
+    yield from _iter_rows(cursor, chunk)
 
-    for row in cursor.fetchall():
-        species_dict = dict(zip(columns, row))
-        species_list.append(species_dict)
 
-    conn.close()
-    return species_list
+def get_dive_species(dive_id: int) -> List[Dict[str, Any]]:
+    """
+    Récupère toutes les espèces associées à une plongée.
+
+    Args:
+        dive_id: ID de la plongée
+
+    Returns:
+        Liste d'espèces avec leurs détails
+    """
+    return list(iter_dive_species(dive_id))
 
 
 def get_media_species(media_id: int) -> List[Dict[str, Any]]:
@@ -314,10 +595,9 @@ def get_media_species(media_id: int) -> List[Dict[str, Any]]:
     Returns:
         Liste d'espèces identifiées sur ce média
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = _get_connection()
 
-    cursor.execute("""
+    cursor = conn.execute("""
         SELECT ds.id, ds.species_id, ds.confidence_score,
                ds.quantity, ds.notes, ds.detected_by, ds.detection_date,
                s.scientific_name, s.common_name_fr, s.common_name_en,
@@ -328,61 +608,138 @@ def get_media_species(media_id: int) -> List[Dict[str, Any]]:
         ORDER BY ds.confidence_score DESC, ds.detection_date DESC
     """, (media_id,))
 
-    columns = [desc[0] for desc in cursor.description]
-    species_list = []
+    return [dict(row) for row in cursor]
 
-    for row in cursor.fetchall():
-        species_dict = dict(zip(columns, row))
-        species_list.append(species_dict)
 
-    conn.close()
-    return species_list
+def get_media_species_bulk(media_ids: List[int]) -> Dict[int, List[Dict[str, Any]]]:
+    """
+    Récupère les espèces associées à plusieurs médias en une seule requête.
 
+    Équivalent groupé de get_media_species() : évite une requête par média
+    (les identifiants sont envoyés par lots pour respecter la limite de
+    paramètres SQLite).
 
-def analyze_image_with_ai(image_path: Path) -> List[Dict[str, Any]]:
+    Args:
+        media_ids: Liste des IDs de médias
+
+    Returns:
+        Dictionnaire {media_id: liste d'espèces}, ordonnée comme get_media_species()
     """
-    Analyse une image pour détecter des espèces marines avec l'IA.
+    species_by_media = {media_id: [] for media_id in media_ids}
+    if not media_ids:
+        return species_by_media
 
-    Cette fonction utilise Claude Vision API pour identifier les espèces.
-    Note : Nécessite une clé API Anthropic configurée dans les variables d'environnement.
+    conn = _get_connection()
+
+    for start in range(0, len(media_ids), SQL_BATCH_SIZE):
+        batch = media_ids[start:start + SQL_BATCH_SIZE]
+        placeholders = ", ".join("?" * len(batch))
+
+        cursor = conn.execute(f"""
+            SELECT ds.media_id, ds.id, ds.species_id, ds.confidence_score,
+                   ds.quantity, ds.notes, ds.detected_by, ds.detection_date,
+                   s.scientific_name, s.common_name_fr, s.common_name_en,
+                   s.category, s.conservation_status
+            FROM dive_species ds
+            JOIN species s ON ds.species_id = s.id
+            WHERE ds.media_id IN ({placeholders})
+            ORDER BY ds.confidence_score DESC, ds.detection_date DESC
+        """, batch)
+
+        for row in cursor:
+            species_dict = dict(row)
+            species_by_media[species_dict.pop('media_id')].append(species_dict)
+
+    return species_by_media
+
+
+def _image_mime_type(image_path: Path) -> str:
+    """
+    Détermine le type MIME d'une image d'après son extension.
 
     Args:
-        image_path: Chemin vers l'image à analyser
+        image_path: Chemin de l'image
 
     Returns:
-        Liste de détections avec nom d'espèce et score de confiance
+        Type MIME (image/jpeg par défaut)
     """
-    try:
-        # Importer anthropic seulement si nécessaire
-        import anthropic
-        import os
-        import database
+    suffix = Path(image_path).suffix.lower()
+    mime_type = _MIME_BY_SUFFIX.get(suffix)
+    if mime_type is None:
+        mime_type = mimetypes.guess_type(f"image{suffix}")[0] or 'image/jpeg'
+        _MIME_BY_SUFFIX[suffix] = mime_type
+    return mime_type
 
-        # Vérifier si la clé API est disponible
-        # Priorité 1 : Base de données (paramètres utilisateur)
-        api_key = database.get_setting("anthropic_api_key", "")
 
-        # Priorité 2 : Variable d'environnement
-        if not api_key:
-            api_key = os.environ.get('ANTHROPIC_API_KEY')
+def _encode_image_base64(image_path: Path) -> str:
+    """
+    Encode un fichier image en base64, par blocs.
 
-        if not api_key:
-            logger.warning("Clé API Claude non configurée - analyse IA désactivée. Configurez-la dans les Paramètres.")
-            return []
+    Le fichier n'est jamais chargé en entier : seuls les blocs encodés sont
+    conservés, puis assemblés en une seule chaîne.
 
-        # Lire et encoder l'image
-        with open(image_path, 'rb') as f:
-            image_data = base64.standard_b64encode(f.read()).decode('utf-8')
+    Args:
+        image_path: Chemin de l'image
+
+    Returns:
+        Contenu du fichier encodé en base64 (ASCII)
+    """
+    encoded_chunks = []
+    with open(image_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(BASE64_CHUNK_SIZE), b''):
+            encoded_chunks.append(base64.standard_b64encode(chunk).decode('ascii'))
+    return ''.join(encoded_chunks)
 
-        # Déterminer le type MIME
-        import mimetypes
-        mime_type = mimetypes.guess_type(str(image_path))[0] or 'image/jpeg'
 
-        # Créer le client Anthropic
-        client = anthropic.Anthropic(api_key=api_key)
+def _prepare_image(image_path: Path) -> Tuple[str, str]:
+    """
+    Prépare une image pour l'API : encodage base64, réduite si elle dépasse AI_IMAGE_MAX_EDGE.
 
-        # Construire le prompt
-        prompt = """Analyse cette image de plongée sous-marine et identifie toutes les espèces marines visibles.
+    Le résultat est mis en cache par (chemin, date de modification, taille).
+
+    Args:
+        image_path: Chemin de l'image
+
+    Returns:
+        Tuple (données en base64, type MIME)
+    """
+    stat = Path(image_path).stat()
+    return _prepare_image_cached(str(image_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=AI_IMAGE_CACHE_SIZE)
+def _prepare_image_cached(image_path: str, mtime_ns: int, size: int) -> Tuple[str, str]:
+    """
+    Implémentation de _prepare_image (mtime_ns et size ne servent qu'à la clé du cache).
+
+    Args:
+        image_path: Chemin de l'image
+        mtime_ns: Date de modification du fichier (ns)
+        size: Taille du fichier (octets)
+
+    Returns:
+        Tuple (données en base64, type MIME)
+    """
+    try:
+        with Image.open(image_path) as img:
+            if max(img.size) > AI_IMAGE_MAX_EDGE:
+                # Appliquer l'orientation EXIF (perdue au réencodage) puis réduire
+                img = ImageOps.exif_transpose(img)
+                img.thumbnail((AI_IMAGE_MAX_EDGE, AI_IMAGE_MAX_EDGE), Image.Resampling.LANCZOS)
+
+                buffer = io.BytesIO()
+                img.convert('RGB').save(buffer, 'JPEG', quality=AI_IMAGE_JPEG_QUALITY, optimize=True)
+                logger.debug(f"Image réduite pour l'IA : {image_path} ({size} -> {buffer.tell()} octets)")
+                return base64.standard_b64encode(buffer.getbuffer()).decode('ascii'), 'image/jpeg'
+    except Exception as e:
+        # Format non reconnu par Pillow : le fichier est envoyé tel quel
+        logger.debug(f"Image envoyée sans réduction ({image_path}) : {e}")
+
+    return _encode_image_base64(Path(image_path)), _image_mime_type(Path(image_path))
+
+
+# Consignes envoyées à Claude Vision
+SPECIES_ANALYSIS_PROMPT = """Analyse cette image de plongée sous-marine et identifie toutes les espèces marines visibles.
 
 Pour chaque espèce détectée, fournis :
 1. Le nom scientifique
@@ -407,84 +764,233 @@ Réponds UNIQUEMENT avec un JSON valide au format suivant :
 Si aucune espèce n'est détectable, retourne : {"species": []}
 """
 
-        # Récupérer le modèle configuré (par défaut Haiku 4.5 pour rapidité et coût)
-        model = database.get_setting("ai_model", "claude-3-5-haiku-20241022")
+IMAGE_DESCRIPTION_PROMPT = """Décris cette photo de plongée sous-marine de manière détaillée et évocatrice.
+
+Inclus dans ta description :
+- L'ambiance générale et les couleurs dominantes
+- Les éléments marins visibles (espèces, formations, etc.)
+- La qualité de l'eau (visibilité, lumière)
+- Tout détail intéressant ou remarquable
+- Le contexte de la prise de vue si identifiable
+
+Écris une description narrative et captivante en français, d'environ 3-4 phrases.
+Réponds UNIQUEMENT avec la description, sans préambule ni formatage spécial."""
 
-        logger.info(f"Analyse d'image avec modèle : {model}")
+FULL_ANALYSIS_PROMPT = """Analyse cette image de plongée sous-marine : identifie toutes les espèces marines visibles et décris la photo.
 
-        # Appeler l'API
-        try:
-            message = client.messages.create(
-                model=model,
-                max_tokens=2048,  # Augmenté pour avoir plus de détails
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": mime_type,
-                                    "data": image_data,
-                                },
+Pour chaque espèce détectée, fournis :
+1. Le nom scientifique
+2. Le nom commun en français
+3. Le nom commun en anglais
+4. La catégorie (poisson, corail, mollusque, crustacé, échinoderme, mammifère, reptile, autre)
+5. Un score de confiance entre 0 et 1
+
+Pour la description, écris un texte narratif et captivant en français, d'environ 3-4 phrases, incluant
+l'ambiance générale et les couleurs dominantes, les éléments marins visibles, la qualité de l'eau
+(visibilité, lumière) et tout détail remarquable.
+
+Réponds UNIQUEMENT avec un JSON valide au format suivant :
+{
+  "species": [
+    {
+      "scientific_name": "Nom scientifique",
+      "common_name_fr": "Nom français",
+      "common_name_en": "Nom anglais",
+      "category": "poisson",
+      "confidence": 0.95
+    }
+  ],
+  "description": "Description de la photo"
+}
+
+Si aucune espèce n'est détectable, retourne une liste "species" vide.
+"""
+
+
+def _ask_vision_model(image_path: Path, prompt: str, max_tokens: int, purpose: str) -> Optional[str]:
+    """
+    Envoie une image et une consigne à Claude Vision.
+
+    Args:
+        image_path: Chemin de l'image
+        prompt: Consigne accompagnant l'image
+        max_tokens: Longueur maximale de la réponse
+        purpose: Nom de l'opération, pour les messages du journal
+
+    Returns:
+        Texte de la réponse, ou None si l'IA est indisponible ou en erreur
+    """
+    if anthropic is None:
+        logger.warning(f"Module 'anthropic' non installé - {purpose} désactivée")
+        return None
+
+    # Vérifier si la clé API est disponible
+    # Priorité 1 : Base de données (paramètres utilisateur)
+    api_key = _get_setting_cached("anthropic_api_key", "")
+
+    # Priorité 2 : Variable d'environnement
+    if not api_key:
+        api_key = os.environ.get('ANTHROPIC_API_KEY')
+
+    if not api_key:
+        logger.warning(f"Clé API Claude non configurée - {purpose} désactivée. Configurez-la dans les Paramètres.")
+        return None
+
+    # Lire, réduire si nécessaire et encoder l'image
+    image_data, mime_type = _prepare_image(image_path)
+
+    # Client Anthropic (partagé entre les appels)
+    client = _get_anthropic_client(api_key)
+
+    # Récupérer le modèle configuré (par défaut Haiku 4.5 pour rapidité et coût)
+    model = _get_setting_cached("ai_model", "claude-3-5-haiku-20241022")
+
+    logger.info(f"{purpose[:1].upper()}{purpose[1:]} avec modèle : {model}")
+
+    # Appeler l'API
+    try:
+        message = client.messages.create(
+            model=model,
+            max_tokens=max_tokens,
+            messages=[
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "image",
+                            "source": {
+                                "type": "base64",
+                                "media_type": mime_type,
+                                "data": image_data,
                             },
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ],
-                    }
-                ],
-            )
-        except anthropic.NotFoundError as e:
-            logger.error(f"Modèle '{model}' introuvable. Utilisez 'claude-3-5-haiku-20241022' ou 'claude-3-5-sonnet-20241022'. Erreur : {e}")
-            return []
-        except anthropic.AuthenticationError as e:
-            logger.error(f"Erreur d'authentification API. Vérifiez votre clé API dans les Paramètres. Erreur : {e}")
-            return []
-        except anthropic.RateLimitError as e:
-            logger.error(f"Limite de débit API atteinte. Attendez quelques instants. Erreur : {e}")
-            return []
+                        },
+                        {
+                            "type": "text",
+                            "text": prompt
+                        }
+                    ],
+                }
+            ],
+        )
+    except anthropic.NotFoundError as e:
+        logger.error(f"Modèle '{model}' introuvable. Utilisez 'claude-3-5-haiku-20241022' ou 'claude-3-5-sonnet-20241022'. Erreur : {e}")
+        return None
+    except anthropic.AuthenticationError as e:
+        logger.error(f"Erreur d'authentification API. Vérifiez votre clé API dans les Paramètres. Erreur : {e}")
+        return None
+    except anthropic.RateLimitError as e:
+        logger.error(f"Limite de débit API atteinte. Attendez quelques instants. Erreur : {e}")
+        return None
+
+    response_text = message.content[0].text
+    logger.debug(f"Réponse brute de l'IA : {response_text[:200]}...")
+    return response_text
+
 
-        # Parser la réponse
-        response_text = message.content[0].text
-        logger.debug(f"Réponse brute de l'IA : {response_text[:200]}...")
-
-        # Extraire le JSON de la réponse
-        # La réponse peut contenir du texte avant/après le JSON
-        import re
-        json_match = re.search(r'\{.*\}', response_text, re.DOTALL)
-        if json_match:
-            try:
-                response_data = json.loads(json_match.group())
-                detected_species = response_data.get('species', [])
-
-                logger.info(f"Détection IA : {len(detected_species)} espèce(s) trouvée(s)")
-                return detected_species
-            except json.JSONDecodeError as e:
-                logger.error(f"Erreur de parsing JSON : {e}")
-                logger.debug(f"JSON invalide : {json_match.group()[:500]}")
-                return []
-        else:
+def _parse_json_response(response_text: str) -> Optional[Dict[str, Any]]:
+    """
+    Extrait l'objet JSON d'une réponse de l'IA.
+
+    Args:
+        response_text: Texte de la réponse
+
+    Returns:
+        Objet JSON décodé, ou None si la réponse n'en contient pas de valide
+    """
+    try:
+        # Cas nominal : le prompt impose une réponse JSON seule
+        response_data = json.loads(response_text)
+    except json.JSONDecodeError:
+        # Sinon, extraire le JSON : la réponse peut contenir du texte avant/après
+        json_match = _JSON_OBJECT_RE.search(response_text)
+        if not json_match:
             logger.warning("Impossible de trouver du JSON dans la réponse de l'IA")
             logger.debug(f"Réponse complète : {response_text}")
+            return None
+        try:
+            response_data = json.loads(json_match.group())
+        except json.JSONDecodeError as e:
+            logger.error(f"Erreur de parsing JSON : {e}")
+            logger.debug(f"JSON invalide : {json_match.group()[:500]}")
+            return None
+
+    return response_data if isinstance(response_data, dict) else None
+
+
+def analyze_image_with_ai(image_path: Path) -> List[Dict[str, Any]]:
+    """
+    Analyse une image pour détecter des espèces marines avec l'IA.
+
+    Cette fonction utilise Claude Vision API pour identifier les espèces.
+    Note : Nécessite une clé API Anthropic configurée dans les variables d'environnement.
+
+    Args:
+        image_path: Chemin vers l'image à analyser
+
+    Returns:
+        Liste de détections avec nom d'espèce et score de confiance
+    """
+    try:
+        response_text = _ask_vision_model(image_path, SPECIES_ANALYSIS_PROMPT, 2048, "analyse IA")
+        if response_text is None:
             return []
 
-    except ImportError:
-        logger.warning("Module 'anthropic' non installé - analyse IA désactivée")
-        return []
+        response_data = _parse_json_response(response_text)
+        detected_species = response_data.get('species', []) if response_data else []
+
+        logger.info(f"Détection IA : {len(detected_species)} espèce(s) trouvée(s)")
+        return detected_species
+
     except Exception as e:
         logger.error(f"Erreur inattendue lors de l'analyse IA : {type(e).__name__}: {e}")
         return []
 
 
+def analyze_image_full(image_path: Path) -> Dict[str, Any]:
+    """
+    Identifie les espèces et décrit une image en un seul appel à l'IA.
+
+    Équivaut à analyze_image_with_ai() suivi de generate_image_description(),
+    pour le coût (latence, image envoyée, tokens) d'une seule requête.
+
+    Args:
+        image_path: Chemin vers l'image à analyser
+
+    Returns:
+        Dictionnaire {'species': liste de détections, 'description': texte ou None}
+    """
+    analysis: Dict[str, Any] = {'species': [], 'description': None}
+
+    try:
+        response_text = _ask_vision_model(image_path, FULL_ANALYSIS_PROMPT, 2048, "analyse IA complète")
+        if response_text is None:
+            return analysis
+
+        response_data = _parse_json_response(response_text)
+        if not response_data:
+            return analysis
+
+        analysis['species'] = response_data.get('species') or []
+        description = response_data.get('description')
+        if isinstance(description, str) and description.strip():
+            analysis['description'] = description.strip()
+
+        logger.info(f"Analyse IA complète : {len(analysis['species'])} espèce(s), "
+                    f"description {'générée' if analysis['description'] else 'absente'}")
+
+    except Exception as e:
+        logger.error(f"Erreur inattendue lors de l'analyse IA complète : {type(e).__name__}: {e}")
+
+    return analysis
+
+
 def process_image_and_add_species(
     image_path: Path,
     dive_id: int,
     media_id: Optional[int] = None,
     auto_add: bool = False,
-    confidence_threshold: float = 0.7
+    confidence_threshold: float = 0.7,
+    describe: bool = False
 ) -> List[Dict[str, Any]]:
     """
     Analyse une image avec l'IA et ajoute les espèces détectées à la plongée.
@@ -495,161 +1001,284 @@ def process_image_and_add_species(
         media_id: ID du média associé
         auto_add: Si True, ajoute automatiquement les espèces avec confiance >= threshold
         confidence_threshold: Seuil de confiance pour l'ajout automatique
+        describe: Si True (et media_id fourni), génère aussi la description du média
+                  dans le même appel à l'IA et l'enregistre à la place de l'actuelle
 
     Returns:
         Liste des espèces détectées avec leurs IDs d'association
     """
-    detections = analyze_image_with_ai(image_path)
-    results = []
-
-    for detection in detections:
-        scientific_name = detection.get('scientific_name', '')
-        common_name_fr = detection.get('common_name_fr', '')
-        common_name_en = detection.get('common_name_en', '')
-        category = detection.get('category', 'autre')
-        confidence = detection.get('confidence', 0.0)
-
-        # Vérifier si l'espèce existe déjà
-        species = get_species_by_name(scientific_name)
-
-        if not species:
-            # Ajouter l'espèce au catalogue
-            species_id = add_species(
-                scientific_name=scientific_name,
-                common_name_fr=common_name_fr,
-                common_name_en=common_name_en,
-                category=category,
-                description=f"Espèce détectée automatiquement par IA"
-            )
-        else:
-            species_id = species['id']
-
-        result = {
-            'species_id': species_id,
-            'scientific_name': scientific_name,
-            'common_name_fr': common_name_fr,
-            'confidence': confidence,
-            'added': False,
-            'association_id': None
-        }
+    detections, description = _run_image_analysis(image_path, describe and media_id is not None)
+    if not detections and not description:
+        return []
 
-        # Ajouter à la plongée si auto_add est activé et confiance suffisante
-        if auto_add and confidence >= confidence_threshold and species_id:
-            association_id = add_species_to_dive(
-                dive_id=dive_id,
-                species_id=species_id,
-                media_id=media_id,
-                confidence_score=confidence,
-                detected_by='ai'
-            )
-            if association_id:
-                result['added'] = True
-                result['association_id'] = association_id
+    return _save_detections([(detections, media_id, description)], dive_id, auto_add, confidence_threshold)[0]
 
-        results.append(result)
 
-    return results
+def process_images_batch(
+    image_paths: List[Path],
+    dive_id: int,
+    media_ids: Optional[List[Optional[int]]] = None,
+    auto_add: bool = False,
+    confidence_threshold: float = 0.7,
+    max_workers: int = AI_MAX_WORKERS,
+    describe: bool = False
+) -> List[List[Dict[str, Any]]]:
+    """
+    Analyse plusieurs images en parallèle et enregistre les détections en une transaction.
 
+    Équivalent groupé de process_image_and_add_species() : les appels à l'API
+    (dominés par la latence réseau) sont simultanés, puis toutes les espèces
+    détectées sont enregistrées en une seule écriture.
 
-def generate_image_description(image_path: Path) -> Optional[str]:
+    Args:
+        image_paths: Chemins des images
+        dive_id: ID de la plongée
+        media_ids: IDs des médias associés, dans l'ordre des images (optionnel)
+        auto_add: Si True, ajoute automatiquement les espèces avec confiance >= threshold
+        confidence_threshold: Seuil de confiance pour l'ajout automatique
+        max_workers: Nombre maximum d'analyses simultanées
+        describe: Si True, génère aussi la description de chaque média (voir
+                  process_image_and_add_species)
+
+    Returns:
+        Pour chaque image (même ordre), la liste des espèces détectées
     """
-    Génère une description détaillée d'une image de plongée avec l'IA.
+    if not image_paths:
+        return []
+    if media_ids is None:
+        media_ids = [None] * len(image_paths)
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(image_paths)))) as executor:
+        all_analyses = list(executor.map(
+            _run_image_analysis,
+            image_paths,
+            [describe and media_id is not None for media_id in media_ids]
+        ))
 
-    Cette fonction utilise Claude Vision API pour créer une description narrative
-    de la photo de plongée, incluant l'ambiance, les éléments visuels et le contexte.
+    analyzed = [
+        (index, (detections, media_id, description))
+        for index, ((detections, description), media_id) in enumerate(zip(all_analyses, media_ids))
+        if detections or description
+    ]
+
+    batch_results: List[List[Dict[str, Any]]] = [[] for _ in image_paths]
+    if analyzed:
+        saved = _save_detections([item for _, item in analyzed], dive_id, auto_add, confidence_threshold)
+        for (index, _), results in zip(analyzed, saved):
+            batch_results[index] = results
+
+    return batch_results
+
+
+def _run_image_analysis(image_path: Path, describe: bool) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """
+    Analyse une image : détections, et description si demandée (un seul appel à l'IA).
 
     Args:
-        image_path: Chemin vers l'image à décrire
+        image_path: Chemin de l'image
+        describe: Générer aussi la description
 
     Returns:
-        Description générée par l'IA, ou None si erreur
+        Tuple (détections, description ou None)
     """
-    try:
-        import anthropic
-        import os
-        import database
-
-        # Vérifier si la clé API est disponible
-        api_key = database.get_setting("anthropic_api_key", "")
-        if not api_key:
-            api_key = os.environ.get('ANTHROPIC_API_KEY')
+    if describe:
+        analysis = analyze_image_full(image_path)
+        return analysis['species'], analysis['description']
+    return analyze_image_with_ai(image_path), None
 
-        if not api_key:
-            logger.warning("Clé API Claude non configurée - génération de description désactivée")
-            return None
 
-        # Lire et encoder l'image
-        with open(image_path, 'rb') as f:
-            image_data = base64.standard_b64encode(f.read()).decode('utf-8')
+def _save_detections(
+    analyses: List[Tuple[List[Dict[str, Any]], Optional[int], Optional[str]]],
+    dive_id: int,
+    auto_add: bool,
+    confidence_threshold: float
+) -> List[List[Dict[str, Any]]]:
+    """
+    Enregistre les détections IA d'une ou plusieurs images, en une seule transaction.
 
-        # Déterminer le type MIME
-        import mimetypes
-        mime_type = mimetypes.guess_type(str(image_path))[0] or 'image/jpeg'
+    Args:
+        analyses: Liste de tuples (détections de l'image, ID du média, description
+                  générée ou None)
+        dive_id: ID de la plongée
+        auto_add: Si True, ajoute automatiquement les espèces avec confiance >= threshold
+        confidence_threshold: Seuil de confiance pour l'ajout automatique
 
-        # Créer le client Anthropic
-        client = anthropic.Anthropic(api_key=api_key)
+    Returns:
+        Pour chaque image, la liste des espèces détectées avec leurs IDs d'association
+    """
+    all_results = [
+        [
+            {
+                'species_id': None,
+                'scientific_name': detection.get('scientific_name', ''),
+                'common_name_fr': detection.get('common_name_fr', ''),
+                'confidence': detection.get('confidence', 0.0),
+                'added': False,
+                'association_id': None
+            }
+            for detection in detections
+        ]
+        for detections, _, _ in analyses
+    ]
+    names = list(dict.fromkeys(
+        result['scientific_name'] for results in all_results for result in results if result['scientific_name']
+    ))
+    descriptions = [
+        (description, media_id)
+        for _, media_id, description in analyses
+        if description and media_id is not None
+    ]
+    if not names and not descriptions:
+        return all_results
+
+    # Horodatage commun à toute l'analyse (sert aussi à relire les associations créées)
+    now = datetime.now().isoformat()
+    conn = _get_connection()
 
-        # Prompt pour la description
-        prompt = """Décris cette photo de plongée sous-marine de manière détaillée et évocatrice.
+    try:
+        # Une seule transaction : catalogue puis associations
+        with conn:
+            # Descriptions générées dans le même appel que les détections
+            if descriptions:
+                conn.executemany("UPDATE dive_media SET description = ? WHERE id = ?", descriptions)
+
+            # Espèces déjà au catalogue, en une requête
+            species_ids = _get_species_ids_by_name(conn, names)
+
+            # Ajouter au catalogue les espèces inconnues (première détection retenue)
+            missing = [name for name in names if name not in species_ids]
+            if missing:
+                new_species: Dict[str, Dict[str, Any]] = {}
+                for detections, _, _ in analyses:
+                    for detection in detections:
+                        if detection.get('scientific_name') in missing:
+                            new_species.setdefault(detection['scientific_name'], detection)
+
+                conn.executemany("""
+                    INSERT OR IGNORE INTO species
+                    (scientific_name, common_name_fr, common_name_en, category,
+                     description, created_date)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, [
+                    (
+                        detection['scientific_name'], detection.get('common_name_fr', ''),
+                        detection.get('common_name_en', ''), detection.get('category', 'autre'),
+                        "Espèce détectée automatiquement par IA", now
+                    )
+                    for detection in new_species.values()
+                ])
+                species_ids.update(_get_species_ids_by_name(conn, missing))
+                _invalidate_species_cache()
+
+            for (_, media_id, _), results in zip(analyses, all_results):
+                for result in results:
+                    result['species_id'] = species_ids.get(result['scientific_name'])
+
+                # Détections regroupées par espèce : une association par espèce et par
+                # média, avec la meilleure confiance et le nombre de détections
+                best_results: Dict[int, Dict[str, Any]] = {}
+                quantities: Dict[int, int] = {}
+                for result in results:
+                    species_id = result['species_id']
+                    if not species_id:
+                        continue
+                    quantities[species_id] = quantities.get(species_id, 0) + 1
+                    best = best_results.get(species_id)
+                    if best is None or result['confidence'] > best['confidence']:
+                        best_results[species_id] = result
+
+                # Ajouter à la plongée si auto_add est activé et confiance suffisante
+                to_add = {
+                    species_id: result
+                    for species_id, result in best_results.items()
+                    if auto_add and result['confidence'] >= confidence_threshold
+                }
+
+                if not to_add:
+                    continue
+
+                conn.executemany("""
+                    INSERT OR IGNORE INTO dive_species
+                    (dive_id, species_id, media_id, confidence_score, quantity,
+                     notes, detected_by, detection_date)
+                    VALUES (?, ?, ?, ?, ?, '', 'ai', ?)
+                """, [
+                    (dive_id, species_id, media_id, result['confidence'], quantities[species_id], now)
+                    for species_id, result in to_add.items()
+                ])
+
+                # Associations créées par cette analyse (horodatage commun)
+                placeholders = ", ".join("?" * len(to_add))
+                association_ids = dict(conn.execute(f"""
+                    SELECT species_id, id FROM dive_species
+                    WHERE dive_id = ? AND detection_date = ? AND media_id IS ?
+                      AND species_id IN ({placeholders})
+                """, [dive_id, now, media_id, *to_add]))
+
+                for species_id, result in to_add.items():
+                    if species_id in association_ids:
+                        result['added'] = True
+                        result['association_id'] = association_ids[species_id]
+
+        added_count = sum(result['added'] for results in all_results for result in results)
+        logger.info(f"Analyse IA enregistrée : {len(names)} espèce(s) sur {len(analyses)} image(s), "
+                    f"{added_count} ajoutée(s) à la plongée {dive_id}, "
+                    f"{len(descriptions)} description(s)")
+
+    except sqlite3.Error as e:
+        logger.error(f"Erreur lors de l'enregistrement des espèces détectées : {e}")
+        # Transaction annulée : aucun identifiant n'est valide
+        for results in all_results:
+            for result in results:
+                result.update(species_id=None, added=False, association_id=None)
+
+    return all_results
+
+
+def _get_species_ids_by_name(conn: sqlite3.Connection, scientific_names: List[str]) -> Dict[str, int]:
+    """
+    Résout des noms scientifiques en IDs du catalogue, en une requête par lot.
 
-Inclus dans ta description :
-- L'ambiance générale et les couleurs dominantes
-- Les éléments marins visibles (espèces, formations, etc.)
-- La qualité de l'eau (visibilité, lumière)
-- Tout détail intéressant ou remarquable
-- Le contexte de la prise de vue si identifiable
+    Args:
+        conn: Connexion SQLite
+        scientific_names: Noms scientifiques exacts
 
-Écris une description narrative et captivante en français, d'environ 3-4 phrases.
-Réponds UNIQUEMENT avec la description, sans préambule ni formatage spécial."""
+    Returns:
+        Dictionnaire {nom scientifique: ID} (les noms inconnus sont absents)
+    """
+    species_ids = {}
+    for start in range(0, len(scientific_names), SQL_BATCH_SIZE):
+        batch = scientific_names[start:start + SQL_BATCH_SIZE]
+        placeholders = ", ".join("?" * len(batch))
+        species_ids.update(conn.execute(
+            f"SELECT scientific_name, id FROM species WHERE scientific_name IN ({placeholders})",
+            batch
+        ))
+    return species_ids
 
-        # Récupérer le modèle configuré
-        model = database.get_setting("ai_model", "claude-3-5-haiku-20241022")
 
-        logger.info(f"Génération de description avec modèle : {model}")
+def generate_image_description(image_path: Path) -> Optional[str]:
+    """
+    Génère une description détaillée d'une image de plongée avec l'IA.
 
-        # Appeler l'API
-        try:
-            message = client.messages.create(
-                model=model,
-                max_tokens=500,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": mime_type,
-                                    "data": image_data,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ],
-                    }
-                ],
-            )
+    Cette fonction utilise Claude Vision API pour créer une description narrative
+    de la photo de plongée, incluant l'ambiance, les éléments visuels et le contexte.
 
-            description = message.content[0].text.strip()
-            logger.info(f"Description générée avec succès ({len(description)} caractères)")
-            return description
+    Args:
+        image_path: Chemin vers l'image à décrire
 
-        except anthropic.NotFoundError as e:
-            logger.error(f"Modèle '{model}' introuvable : {e}")
-            return None
-        except anthropic.AuthenticationError as e:
-            logger.error(f"Erreur d'authentification API : {e}")
-            return None
-        except anthropic.RateLimitError as e:
-            logger.error(f"Limite de débit API atteinte : {e}")
+    Returns:
+        Description générée par l'IA, ou None si erreur
+    """
+    try:
+        response_text = _ask_vision_model(image_path, IMAGE_DESCRIPTION_PROMPT, 500, "génération de description")
+        if response_text is None:
             return None
 
-    except ImportError:
-        logger.warning("Module 'anthropic' non installé")
-        return None
+        description = response_text.strip()
+        logger.info(f"Description générée avec succès ({len(description)} caractères)")
+        return description
+
     except Exception as e:
         logger.error(f"Erreur lors de la génération de description : {type(e).__name__}: {e}")
         return None
@@ -665,10 +1294,25 @@ def get_species_by_id(species_id: int) -> Optional[Dict[str, Any]]:
     Returns:
         Dictionnaire avec les informations de l'espèce, ou None
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    species = _get_species_by_id_cached(species_id)
+    # Copie : la fiche en cache ne doit pas être modifiée par l'appelant
+    return dict(species) if species else None
+
+
+@lru_cache(maxsize=SPECIES_CACHE_SIZE)
+def _get_species_by_id_cached(species_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Interroge le catalogue par ID (résultat mis en cache, voir _invalidate_species_cache).
+
+    Args:
+        species_id: ID de l'espèce
+
+    Returns:
+        Dictionnaire avec les informations de l'espèce, ou None
+    """
+    conn = _get_connection()
 
-    cursor.execute("""
+    cursor = conn.execute("""
         SELECT id, scientific_name, common_name_fr, common_name_en, category,
                description, conservation_status, habitat, depth_range,
                image_url, created_date
@@ -677,24 +1321,8 @@ def get_species_by_id(species_id: int) -> Optional[Dict[str, Any]]:
     """, (species_id,))
 
     result = cursor.fetchone()
-    conn.close()
-
-    if result:
-        return {
-            'id': result[0],
-            'scientific_name': result[1],
-            'common_name_fr': result[2],
-            'common_name_en': result[3],
-            'category': result[4],
-            'description': result[5],
-            'conservation_status': result[6],
-            'habitat': result[7],
-            'depth_range': result[8],
-            'image_url': result[9],
-            'created_date': result[10]
-        }
 
-    return None
+    return dict(result) if result else None
 
 
 def get_all_species(limit: int = 100, offset: int = 0, category: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -709,11 +1337,10 @@ def get_all_species(limit: int = 100, offset: int = 0, category: Optional[str] =
     Returns:
         Liste d'espèces
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = _get_connection()
 
     if category:
-        cursor.execute("""
+        cursor = conn.execute("""
             SELECT id, scientific_name, common_name_fr, common_name_en, category,
                    description, conservation_status, habitat, depth_range,
                    image_url, created_date
@@ -723,7 +1350,7 @@ def get_all_species(limit: int = 100, offset: int = 0, category: Optional[str] =
             LIMIT ? OFFSET ?
         """, (category, limit, offset))
     else:
-        cursor.execute("""
+        cursor = conn.execute("""
             SELECT id, scientific_name, common_name_fr, common_name_en, category,
                    description, conservation_status, habitat, depth_range,
                    image_url, created_date
@@ -732,15 +1359,7 @@ def get_all_species(limit: int = 100, offset: int = 0, category: Optional[str] =
             LIMIT ? OFFSET ?
         """, (limit, offset))
 
-    columns = [desc[0] for desc in cursor.description]
-    species_list = []
-
-    for row in cursor.fetchall():
-        species_dict = dict(zip(columns, row))
-        species_list.append(species_dict)
-
-    conn.close()
-    return species_list
+    return [dict(row) for row in cursor]
 
 
 def update_species(
@@ -765,55 +1384,52 @@ def update_species(
     Returns:
         True si la mise à jour a réussi
     """
-    # Récupérer les valeurs actuelles
-    current = get_species_by_id(species_id)
-    if not current:
-        logger.warning(f"Espèce {species_id} introuvable")
-        return False
+    # Seules les colonnes fournies sont réécrites (noms de colonnes fixes, valeurs en paramètres)
+    changes = {
+        column: value
+        for column, value in (
+            ('scientific_name', scientific_name),
+            ('common_name_fr', common_name_fr),
+            ('common_name_en', common_name_en),
+            ('category', category),
+            ('description', description),
+            ('conservation_status', conservation_status),
+            ('habitat', habitat),
+            ('depth_range', depth_range),
+            ('image_url', image_url),
+        )
+        if value is not None
+    }
+
+    if not changes:
+        if get_species_by_id(species_id) is None:
+            logger.warning(f"Espèce {species_id} introuvable")
+            return False
+        return True
 
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = _get_connection()
 
     try:
-        cursor.execute("""
-            UPDATE species
-            SET scientific_name = ?,
-                common_name_fr = ?,
-                common_name_en = ?,
-                category = ?,
-                description = ?,
-                conservation_status = ?,
-                habitat = ?,
-                depth_range = ?,
-                image_url = ?
-            WHERE id = ?
-        """, (
-            scientific_name if scientific_name is not None else current['scientific_name'],
-            common_name_fr if common_name_fr is not None else current['common_name_fr'],
-            common_name_en if common_name_en is not None else current['common_name_en'],
-            category if category is not None else current['category'],
-            description if description is not None else current['description'],
-            conservation_status if conservation_status is not None else current['conservation_status'],
-            habitat if habitat is not None else current['habitat'],
-            depth_range if depth_range is not None else current['depth_range'],
-            image_url if image_url is not None else current['image_url'],
-            species_id
-        ))
+        assignments = ", ".join(f"{column} = ?" for column in changes)
+        with conn:
+            cursor = conn.execute(
+                f"UPDATE species SET {assignments} WHERE id = ?",
+                (*changes.values(), species_id)
+            )
 
-        conn.commit()
-        conn.close()
+        if cursor.rowcount == 0:
+            logger.warning(f"Espèce {species_id} introuvable")
+            return False
+
+        _invalidate_species_cache()
 
-        logger.info(f"Espèce {species_id} mise à jour : {scientific_name or current['scientific_name']}")
+        logger.info(f"Espèce {species_id} mise à jour : {', '.join(changes)}")
         return True
 
     except sqlite3.IntegrityError as e:
-        conn.rollback()
-        conn.close()
         logger.error(f"Erreur d'intégrité lors de la mise à jour : {e}")
         return False
     except Exception as e:
-        conn.rollback()
-        conn.close()
         logger.error(f"Erreur lors de la mise à jour de l'espèce : {e}")
         return False
 
@@ -831,32 +1447,28 @@ def delete_species(species_id: int) -> bool:
     Returns:
         True si la suppression a réussi
     """
-    conn = get_connection()
-    cursor = conn.cursor()
+    conn = _get_connection()
 
     try:
         # Vérifier si l'espèce existe
-        cursor.execute("SELECT scientific_name FROM species WHERE id = ?", (species_id,))
+        cursor = conn.execute("SELECT scientific_name FROM species WHERE id = ?", (species_id,))
         result = cursor.fetchone()
 
         if not result:
             logger.warning(f"Espèce {species_id} introuvable")
-            conn.close()
             return False
 
         scientific_name = result[0]
 
         # Supprimer l'espèce (les associations seront supprimées automatiquement via CASCADE)
-        cursor.execute("DELETE FROM species WHERE id = ?", (species_id,))
-        conn.commit()
-        conn.close()
+        with conn:
+            conn.execute("DELETE FROM species WHERE id = ?", (species_id,))
+        _invalidate_species_cache()
 
         logger.info(f"Espèce supprimée : {scientific_name} (ID={species_id})")
         return True
 
     except Exception as e:
-        conn.rollback()
-        conn.close()
         logger.error(f"Erreur lors de la suppression de l'espèce : {e}")
         return False
 
@@ -868,52 +1480,38 @@ def get_species_stats() -> Dict[str, Any]:
     Returns:
         Dictionnaire avec les statistiques
     """
-    conn = get_connection()
-    cursor = conn.cursor()
-
-    # Total d'espèces par catégorie
-    cursor.execute("""
-        SELECT category, COUNT(*) as count
-        FROM species
-        GROUP BY category
-        ORDER BY count DESC
-    """)
-    category_stats = dict(cursor.fetchall())
-
-    # Espèces les plus observées
-    cursor.execute("""
-        SELECT s.scientific_name, s.common_name_fr, COUNT(ds.id) as observation_count
-        FROM species s
-        LEFT JOIN dive_species ds ON s.id = ds.species_id
-        GROUP BY s.id
-        ORDER BY observation_count DESC
-        LIMIT 10
-    """)
-    top_species = []
-    for row in cursor.fetchall():
-        top_species.append({
+    conn = _get_connection()
+
+    # Une seule requête (un seul instantané de la base) : chaque regroupement
+    # revient sous forme de tableau JSON de lignes [clé, ..., nombre]
+    category_json, top_json, detection_json = conn.execute(f"""
+        SELECT
+            -- Total d'espèces par catégorie
+            (SELECT json_group_array(json_array(category, count))
+             FROM (SELECT category, COUNT(*) as count FROM species GROUP BY category)),
+            -- Espèces les plus observées
+            (SELECT json_group_array(json_array(scientific_name, common_name_fr, observation_count))
+             FROM ({TOP_SPECIES_SQL})),
+            -- Détections par type
+            (SELECT json_group_array(json_array(detected_by, count))
+             FROM (SELECT detected_by, COUNT(*) as count FROM dive_species GROUP BY detected_by))
+    """).fetchone()
+
+    # L'ordre d'entrée des agrégats n'est pas garanti par SQLite : tri côté Python
+    category_stats = dict(sorted(json.loads(category_json), key=lambda row: -row[1]))
+    top_species = [
+        {
             'scientific_name': row[0],
             'common_name_fr': row[1],
             'observation_count': row[2]
-        })
-
-    # Total d'espèces dans le catalogue
-    cursor.execute("SELECT COUNT(*) FROM species")
-    total_species = cursor.fetchone()[0]
-
-    # Total d'observations
-    cursor.execute("SELECT COUNT(*) FROM dive_species")
-    total_observations = cursor.fetchone()[0]
-
-    # Détections par type
-    cursor.execute("""
-        SELECT detected_by, COUNT(*) as count
-        FROM dive_species
-        GROUP BY detected_by
-    """)
-    detection_stats = dict(cursor.fetchall())
+        }
+        for row in sorted(json.loads(top_json), key=lambda row: -row[2])
+    ]
+    detection_stats = dict(json.loads(detection_json))
 
-    conn.close()
+    # Les totaux découlent des regroupements (chaque ligne appartient à un groupe)
+    total_species = sum(category_stats.values())
+    total_observations = sum(detection_stats.values())
 
     return {
         'total_species': total_species,
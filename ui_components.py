@@ -8,6 +8,120 @@ avec le style glassmorphism et les animations.
 import streamlit as st
 import textwrap
 from pathlib import Path
+from typing import List
+
+
+# Gabarits HTML des composants, préparés une fois pour toutes (str.format)
+_METRIC_CARD_TEMPLATE = '''
+    <div class="metric-card animate-fade-in">
+        <div class="metric-icon">{icon}</div>
+        <div class="metric-value">{value}</div>
+        <div class="metric-label">{label}</div>
+        {delta_html}
+    </div>
+    '''
+
+_METRIC_DELTA_TEMPLATE = '<div style="color: {delta_color}; font-size: 0.9rem; margin-top: 5px; font-weight: 600;">{delta_icon} {delta}</div>'
+
+_ACHIEVEMENT_BADGE_TEMPLATE = '''
+    <div class="achievement-badge {locked_class} animate-fade-in">
+        <div class="achievement-icon">{icon}</div>
+        <div class="achievement-title">{title}</div>
+        <div class="achievement-description">{description}</div>
+        {progress_html}
+    </div>
+    '''
+
+_BADGE_PROGRESS_TEMPLATE = '<div style="margin-top: 10px;"><div class="progress-bar-container" style="height: 8px;"><div class="progress-bar-fill" style="width: {progress_pct}%;"></div></div><div style="font-size: 0.7rem; color: #94a3b8; margin-top: 3px; text-align: center;">{progress} / {target}</div></div>'
+
+_GLASS_CARD_TEMPLATE = '''
+    <div class="{hover_class}">
+        {content}
+    </div>
+    '''
+
+_PROGRESS_BAR_TEMPLATE = '''
+    <div style="margin: 15px 0;">
+        <div style="
+            display: flex;
+            justify-content: space-between;
+            margin-bottom: 8px;
+            color: #cbd5e1;
+            font-size: 0.9rem;
+        ">
+            <span>{label}</span>
+            <span>{value} / {max_value}</span>
+        </div>
+        <div class="progress-bar-container">
+            <div style="
+                background: {gradient};
+                height: 100%;
+                width: {percentage}%;
+                border-radius: 10px;
+                transition: width 0.5s ease;
+                box-shadow: 0 0 20px rgba(59, 130, 246, 0.6);
+            "></div>
+        </div>
+    </div>
+    '''
+
+_STAT_COMPARISON_TEMPLATE = '''
+    <div class="metric-card animate-fade-in">
+        <div class="metric-icon">{icon}</div>
+        <div class="metric-label">{label}</div>
+        <div class="metric-value">{current_str}{unit}</div>
+        <div style="
+            color: {color};
+            font-size: 0.9rem;
+            margin-top: 8px;
+            font-weight: 600;
+        ">
+            {arrow} {sign}{diff_str}{unit} ({sign}{pct_str}%)
+        </div>
+    </div>
+    '''
+
+_INFO_CARD_TEMPLATE = '''
+    <div style="
+        background: {bg_color};
+        backdrop-filter: blur(10px);
+        -webkit-backdrop-filter: blur(10px);
+        border-radius: 15px;
+        border: 2px solid {border_color};
+        padding: 20px;
+        margin: 15px 0;
+    " class="animate-fade-in">
+        <div style="display: flex; align-items: center; gap: 10px; margin-bottom: 10px;">
+            <span style="font-size: 1.5rem;">{icon}</span>
+            <span style="font-size: 1.1rem; font-weight: 600; color: #e0f2fe;">{title}</span>
+        </div>
+        <div style="color: #cbd5e1; line-height: 1.6;">
+            {clean_content}
+        </div>
+    </div>
+    '''
+
+# Couleurs des barres de progression et des cartes d'information
+_PROGRESS_GRADIENTS = {
+    "blue": "linear-gradient(90deg, #3b82f6 0%, #06b6d4 100%)",
+    "green": "linear-gradient(90deg, #10b981 0%, #059669 100%)",
+    "orange": "linear-gradient(90deg, #f59e0b 0%, #d97706 100%)",
+    "red": "linear-gradient(90deg, #ef4444 0%, #dc2626 100%)"
+}
+
+_INFO_BACKGROUNDS = {
+    "info": "rgba(59, 130, 246, 0.2)",
+    "success": "rgba(16, 185, 129, 0.2)",
+    "warning": "rgba(245, 158, 11, 0.2)",
+    "error": "rgba(239, 68, 68, 0.2)"
+}
+
+_INFO_BORDERS = {
+    "info": "rgba(59, 130, 246, 0.4)",
+    "success": "rgba(16, 185, 129, 0.4)",
+    "warning": "rgba(245, 158, 11, 0.4)",
+    "error": "rgba(239, 68, 68, 0.4)"
+}
 
 
 def load_custom_css():
@@ -19,18 +133,41 @@ def load_custom_css():
     """
     css_file = Path(__file__).parent / ".streamlit" / "style.css"
 
-    if css_file.exists():
-        with open(css_file, 'r', encoding='utf-8') as f:
-            css_content = f.read()
-            st.markdown(f'<style>{css_content}</style>', unsafe_allow_html=True)
-    else:
+    try:
+        mtime_ns = css_file.stat().st_mtime_ns
+    except OSError:
         st.warning("⚠️ Fichier CSS personnalisé introuvable")
+        return
+
+    st.markdown(_read_css(str(css_file), mtime_ns), unsafe_allow_html=True)
+
+
+@st.cache_data(max_entries=4, show_spinner=False)
+def _read_css(css_path: str, mtime_ns: int) -> str:
+    """
+    Lit le fichier CSS et le renvoie dans une balise <style>.
+
+    Mis en cache : lu une seule fois au lieu de à chaque rerun. La date de
+    modification fait partie de la clé, une modification du fichier est
+    donc prise en compte.
+
+    Args:
+        css_path: Chemin du fichier CSS
+        mtime_ns: Date de modification du fichier (clé de cache)
+
+    Returns:
+        Balisage <style> à injecter dans la page
+    """
+    css_content = Path(css_path).read_text(encoding='utf-8')
+    return f'<style>{css_content}</style>'
 
 
 def create_metric_card(icon: str, value: str, label: str, delta: str = None):
     """
     Crée une carte de métrique stylisée avec effet glassmorphism.
 
+    Voir metric_card_html() pour regrouper plusieurs cartes (flush_cards).
+
     Args:
         icon: Emoji ou icône à afficher
         value: Valeur principale de la métrique
@@ -40,6 +177,16 @@ def create_metric_card(icon: str, value: str, label: str, delta: str = None):
     Example:
         >>> create_metric_card("🤿", "42", "Plongées Totales", "+5")
     """
+    st.html(metric_card_html(icon, value, label, delta))
+
+
+def metric_card_html(icon: str, value: str, label: str, delta: str = None) -> str:
+    """
+    Construit le HTML d'une carte de métrique (voir create_metric_card).
+
+    Returns:
+        Balisage HTML de la carte
+    """
     delta_html = ""
     if delta:
         # Déterminer la couleur selon le signe
@@ -53,18 +200,13 @@ def create_metric_card(icon: str, value: str, label: str, delta: str = None):
             delta_color = "#6b7280"  # Gris
             delta_icon = ""
 
-        delta_html = f'<div style="color: {delta_color}; font-size: 0.9rem; margin-top: 5px; font-weight: 600;">{delta_icon} {delta}</div>'
-
-    html = f'''
-    <div class="metric-card animate-fade-in">
-        <div class="metric-icon">{icon}</div>
-        <div class="metric-value">{value}</div>
-        <div class="metric-label">{label}</div>
-        {delta_html}
-    </div>
-    '''
+        delta_html = _METRIC_DELTA_TEMPLATE.format(
+            delta_color=delta_color, delta_icon=delta_icon, delta=delta
+        )
 
-    st.markdown(html, unsafe_allow_html=True)
+    return _METRIC_CARD_TEMPLATE.format(
+        icon=icon, value=value, label=label, delta_html=delta_html
+    )
 
 
 def create_achievement_badge(
@@ -94,24 +236,37 @@ def create_achievement_badge(
         ...     unlocked=True
         ... )
     """
+    st.html(achievement_badge_html(icon, title, description, unlocked, progress, target))
+
+
+def achievement_badge_html(
+    icon: str,
+    title: str,
+    description: str,
+    unlocked: bool = False,
+    progress: int = 0,
+    target: int = 100
+) -> str:
+    """
+    Construit le HTML d'un badge d'achievement (voir create_achievement_badge).
+
+    Returns:
+        Balisage HTML du badge
+    """
     locked_class = "" if unlocked else "locked"
 
     # Progress bar HTML (seulement si non débloqué)
     progress_html = ""
     if not unlocked and target > 0:
         progress_pct = min(100, (progress / target) * 100)
-        progress_html = f'<div style="margin-top: 10px;"><div class="progress-bar-container" style="height: 8px;"><div class="progress-bar-fill" style="width: {progress_pct}%;"></div></div><div style="font-size: 0.7rem; color: #94a3b8; margin-top: 3px; text-align: center;">{progress} / {target}</div></div>'
+        progress_html = _BADGE_PROGRESS_TEMPLATE.format(
+            progress_pct=progress_pct, progress=progress, target=target
+        )
 
-    html = f'''
-    <div class="achievement-badge {locked_class} animate-fade-in">
-        <div class="achievement-icon">{icon}</div>
-        <div class="achievement-title">{title}</div>
-        <div class="achievement-description">{description}</div>
-        {progress_html}
-    </div>
-    '''
-
-    st.markdown(html, unsafe_allow_html=True)
+    return _ACHIEVEMENT_BADGE_TEMPLATE.format(
+        locked_class=locked_class, icon=icon, title=title,
+        description=description, progress_html=progress_html
+    )
 
 
 def create_glass_card(content: str, hover_effect: bool = True):
@@ -125,15 +280,18 @@ def create_glass_card(content: str, hover_effect: bool = True):
     Example:
         >>> create_glass_card("<h3>Titre</h3><p>Contenu...</p>")
     """
-    hover_class = "glass-card" if hover_effect else "glass-card-no-hover"
+    st.html(glass_card_html(content, hover_effect))
 
-    html = f'''
-    <div class="{hover_class}">
-        {content}
-    </div>
-    '''
 
-    st.markdown(html, unsafe_allow_html=True)
+def glass_card_html(content: str, hover_effect: bool = True) -> str:
+    """
+    Construit le HTML d'une carte glassmorphism (voir create_glass_card).
+
+    Returns:
+        Balisage HTML de la carte
+    """
+    hover_class = "glass-card" if hover_effect else "glass-card-no-hover"
+    return _GLASS_CARD_TEMPLATE.format(hover_class=hover_class, content=content)
 
 
 def create_progress_bar(
@@ -154,44 +312,29 @@ def create_progress_bar(
     Example:
         >>> create_progress_bar("Niveau", 75, 100, "blue")
     """
-    percentage = min(100, (value / max_value) * 100) if max_value > 0 else 0
+    st.html(progress_bar_html(label, value, max_value, color))
 
-    # Définir les couleurs selon le paramètre
-    color_map = {
-        "blue": "linear-gradient(90deg, #3b82f6 0%, #06b6d4 100%)",
-        "green": "linear-gradient(90deg, #10b981 0%, #059669 100%)",
-        "orange": "linear-gradient(90deg, #f59e0b 0%, #d97706 100%)",
-        "red": "linear-gradient(90deg, #ef4444 0%, #dc2626 100%)"
-    }
 
-    gradient = color_map.get(color, color_map["blue"])
+def progress_bar_html(
+    label: str,
+    value: int,
+    max_value: int,
+    color: str = "blue"
+) -> str:
+    """
+    Construit le HTML d'une barre de progression (voir create_progress_bar).
 
-    html = f'''
-    <div style="margin: 15px 0;">
-        <div style="
-            display: flex;
-            justify-content: space-between;
-            margin-bottom: 8px;
-            color: #cbd5e1;
-            font-size: 0.9rem;
-        ">
-            <span>{label}</span>
-            <span>{value} / {max_value}</span>
-        </div>
-        <div class="progress-bar-container">
-            <div style="
-                background: {gradient};
-                height: 100%;
-                width: {percentage}%;
-                border-radius: 10px;
-                transition: width 0.5s ease;
-                box-shadow: 0 0 20px rgba(59, 130, 246, 0.6);
-            "></div>
-        </div>
-    </div>
-    '''
+    Returns:
+        Balisage HTML de la barre
+    """
+    percentage = min(100, (value / max_value) * 100) if max_value > 0 else 0
 
-    st.markdown(html, unsafe_allow_html=True)
+    gradient = _PROGRESS_GRADIENTS.get(color, _PROGRESS_GRADIENTS["blue"])
+
+    return _PROGRESS_BAR_TEMPLATE.format(
+        label=label, value=value, max_value=max_value,
+        gradient=gradient, percentage=percentage
+    )
 
 
 def create_stat_comparison(
@@ -216,6 +359,23 @@ def create_stat_comparison(
     Example:
         >>> create_stat_comparison("⬇️", "Profondeur Max", 35.5, 30.2, "m")
     """
+    st.html(stat_comparison_html(icon, label, current_value, previous_value, unit, format_string))
+
+
+def stat_comparison_html(
+    icon: str,
+    label: str,
+    current_value: float,
+    previous_value: float,
+    unit: str = "",
+    format_string: str = "{:.1f}"
+) -> str:
+    """
+    Construit le HTML d'une comparaison de statistiques (voir create_stat_comparison).
+
+    Returns:
+        Balisage HTML de la carte
+    """
     # Calculer la différence et le pourcentage
     diff = current_value - previous_value
 
@@ -243,23 +403,10 @@ def create_stat_comparison(
     diff_str = format_string.format(abs(diff))
     pct_str = format_string.format(abs(pct_change))
 
-    html = f'''
-    <div class="metric-card animate-fade-in">
-        <div class="metric-icon">{icon}</div>
-        <div class="metric-label">{label}</div>
-        <div class="metric-value">{current_str}{unit}</div>
-        <div style="
-            color: {color};
-            font-size: 0.9rem;
-            margin-top: 8px;
-            font-weight: 600;
-        ">
-            {arrow} {sign}{diff_str}{unit} ({sign}{pct_str}%)
-        </div>
-    </div>
-    '''
-
-    st.markdown(html, unsafe_allow_html=True)
+    return _STAT_COMPARISON_TEMPLATE.format(
+        icon=icon, label=label, current_str=current_str, unit=unit, color=color,
+        arrow=arrow, sign=sign, diff_str=diff_str, pct_str=pct_str
+    )
 
 
 def create_info_card(title: str, content: str, icon: str = "ℹ️", type: str = "info"):
@@ -280,45 +427,48 @@ def create_info_card(title: str, content: str, icon: str = "ℹ️", type: str =
         ...     "info"
         ... )
     """
+    st.html(info_card_html(title, content, icon, type))
+
+
+def info_card_html(title: str, content: str, icon: str = "ℹ️", type: str = "info") -> str:
+    """
+    Construit le HTML d'une carte d'information (voir create_info_card).
+
+    Returns:
+        Balisage HTML de la carte
+    """
     # Nettoyer le content: enlever l'indentation commune et les espaces de début/fin
-    clean_content = textwrap.dedent(content).strip()
-
-    # Définir les couleurs selon le type
-    color_map = {
-        "info": "rgba(59, 130, 246, 0.2)",
-        "success": "rgba(16, 185, 129, 0.2)",
-        "warning": "rgba(245, 158, 11, 0.2)",
-        "error": "rgba(239, 68, 68, 0.2)"
-    }
-
-    border_map = {
-        "info": "rgba(59, 130, 246, 0.4)",
-        "success": "rgba(16, 185, 129, 0.4)",
-        "warning": "rgba(245, 158, 11, 0.4)",
-        "error": "rgba(239, 68, 68, 0.4)"
-    }
-
-    bg_color = color_map.get(type, color_map["info"])
-    border_color = border_map.get(type, border_map["info"])
-
-    html = f'''
-    <div style="
-        background: {bg_color};
-        backdrop-filter: blur(10px);
-        -webkit-backdrop-filter: blur(10px);
-        border-radius: 15px;
-        border: 2px solid {border_color};
-        padding: 20px;
-        margin: 15px 0;
-    " class="animate-fade-in">
-        <div style="display: flex; align-items: center; gap: 10px; margin-bottom: 10px;">
-            <span style="font-size: 1.5rem;">{icon}</span>
-            <span style="font-size: 1.1rem; font-weight: 600; color: #e0f2fe;">{title}</span>
-        </div>
-        <div style="color: #cbd5e1; line-height: 1.6;">
-            {clean_content}
-        </div>
-    </div>
-    '''
+    # (sur une seule ligne, dedent n'a rien de plus à faire que strip)
+    if '\n' in content:
+        clean_content = textwrap.dedent(content).strip()
+    else:
+        clean_content = content.strip()
+
+    bg_color = _INFO_BACKGROUNDS.get(type, _INFO_BACKGROUNDS["info"])
+    border_color = _INFO_BORDERS.get(type, _INFO_BORDERS["info"])
+
+    return _INFO_CARD_TEMPLATE.format(
+        bg_color=bg_color, border_color=border_color, icon=icon,
+        title=title, clean_content=clean_content
+    )
+
 
-    st.markdown(html, unsafe_allow_html=True)
+def flush_cards(cards: List[str]):
+    """
+    Affiche plusieurs composants HTML en un seul élément Streamlit.
+
+    Chaque élément a un coût de rendu côté navigateur : pour un tableau de
+    bord de nombreuses cartes, construire les HTML avec les fonctions
+    *_html() puis les afficher ensemble est bien plus léger.
+
+    Args:
+        cards: Balisages HTML (metric_card_html, achievement_badge_html, ...)
+
+    Example:
+        >>> flush_cards([
+        ...     metric_card_html("🤿", "42", "Plongées Totales"),
+        ...     metric_card_html("⬇️", "35 m", "Profondeur Max"),
+        ... ])
+    """
+    if cards:
+        st.html("".join(cards))
@@ -5,6 +5,7 @@ Ce module fournit des fonctions de validation robustes pour garantir
 la sécurité et l'intégrité des fichiers uploadés par les utilisateurs.
 """
 
+import hashlib
 from pathlib import Path
 from typing import Tuple, Optional
 from config import config
@@ -13,22 +14,36 @@ from logger import get_logger
 logger = get_logger(__name__)
 
 
+# Taille des blocs lus pour l'empreinte d'un fichier uploadé
+FINGERPRINT_CHUNK_SIZE = 1024 * 1024
+
+# Caractères conservés dans les noms de fichiers ; tout autre caractère
+# ASCII est remplacé par "_" (table de traduction construite une seule fois)
+FILENAME_SAFE_CHARS = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._-"
+_FILENAME_TRANSLATION = str.maketrans({
+    chr(code): chr(code) if chr(code) in FILENAME_SAFE_CHARS else '_'
+    for code in range(128)
+})
+
+# Octets lus en début de fichier pour vérifier les magic bytes
+MAGIC_HEADER_SIZE = 20
+
 # Magic bytes des formats supportés (pour validation stricte)
 MAGIC_BYTES = {
-    '.fit': [
+    '.fit': (
         b'\x0e\x10',  # FIT header signature (version 1.0)
         b'\x0e\x20',  # FIT header signature (version 2.0)
-    ],
-    '.xml': [
+    ),
+    '.xml': (
         b'<?xml',  # XML declaration
         b'<uddf',  # UDDF root
-    ],
-    '.uddf': [
+    ),
+    '.uddf': (
         b'<?xml',  # UDDF est un format XML
         b'<uddf',
-    ],
+    ),
     # DL7 : format binaire propriétaire OSTC, pas de magic bytes connus
-    '.dl7': []
+    '.dl7': ()
 }
 
 
@@ -86,7 +101,7 @@ def validate_file_content(file_content: bytes, filename: str) -> Tuple[bool, str
     malveillant.
 
     Args:
-        file_content: Contenu brut du fichier
+        file_content: Début du fichier (MAGIC_HEADER_SIZE octets suffisent)
         filename: Nom du fichier
 
     Returns:
@@ -100,18 +115,16 @@ def validate_file_content(file_content: bytes, filename: str) -> Tuple[bool, str
         return True, ""
 
     # Récupérer les magic bytes attendus
-    expected_magic = MAGIC_BYTES.get(ext, [])
+    expected_magic = MAGIC_BYTES.get(ext, ())
 
     if not expected_magic:
         # Si pas de magic bytes définis, on accepte
         return True, ""
 
     # Vérifier si le fichier commence par l'un des magic bytes attendus
-    file_start = file_content[:20]  # Lire les 20 premiers bytes
-
-    for magic in expected_magic:
-        if file_start.startswith(magic):
-            return True, ""
+    # (startswith sur un tuple : un seul appel, sans copie du début du fichier)
+    if file_content.startswith(expected_magic):
+        return True, ""
 
     # Aucun magic byte ne correspond
     logger.warning(f"Magic bytes invalides pour {filename} (extension {ext})")
@@ -154,11 +167,11 @@ def validate_uploaded_file(uploaded_file) -> Tuple[bool, str]:
         return False, error
 
     # 3. Valider le contenu (magic bytes)
-    # Note: On doit lire le contenu, donc on le retourne à la position 0 après
-    file_content = uploaded_file.read()
+    # Note: Seul l'en-tête est lu, puis le curseur est remis au début
+    header = uploaded_file.read(MAGIC_HEADER_SIZE)
     uploaded_file.seek(0)  # Remettre le curseur au début
 
-    valid, error = validate_file_content(file_content, uploaded_file.name)
+    valid, error = validate_file_content(header, uploaded_file.name)
     if not valid:
         logger.error(f"Contenu invalide : {error}")
         return False, error
@@ -169,6 +182,36 @@ def validate_uploaded_file(uploaded_file) -> Tuple[bool, str]:
     return True, ""
 
 
+def file_fingerprint(uploaded_file) -> str:
+    """
+    Calcule l'empreinte (BLAKE2b) du contenu d'un fichier uploadé.
+
+    Sert de clé de cache pour le parsing : un même fichier uploadé à
+    nouveau n'est pas re-parsé. Tout le contenu est haché (un en-tête seul
+    ne distinguerait pas deux plongées du même ordinateur), sans copie
+    lorsque le fichier est déjà en mémoire (UploadedFile) ; sinon il est lu
+    par blocs et le curseur est remis au début.
+
+    Args:
+        uploaded_file: Fichier uploadé via Streamlit (avec .read(), .seek())
+
+    Returns:
+        Empreinte hexadécimale du contenu
+    """
+    digest = hashlib.blake2b(digest_size=16)
+
+    if hasattr(uploaded_file, 'getbuffer'):
+        with uploaded_file.getbuffer() as buffer:
+            digest.update(buffer)
+    else:
+        uploaded_file.seek(0)
+        for chunk in iter(lambda: uploaded_file.read(FINGERPRINT_CHUNK_SIZE), b''):
+            digest.update(chunk)
+        uploaded_file.seek(0)
+
+    return digest.hexdigest()
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Nettoie un nom de fichier pour éviter les injections path traversal.
@@ -190,9 +233,10 @@ def sanitize_filename(filename: str) -> str:
     # Extraire le nom de base (sans chemin)
     filename = Path(filename).name
 
-    # Remplacer les caractères spéciaux par des underscores
-    safe_chars = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._-"
-    sanitized = ''.join(c if c in safe_chars else '_' for c in filename)
+    # Remplacer les caractères spéciaux par des underscores : les caractères
+    # non ASCII deviennent "?" à l'encodage, puis "_" comme les autres
+    sanitized = filename.encode('ascii', 'replace').decode('ascii')
+    sanitized = sanitized.translate(_FILENAME_TRANSLATION)
 
     # Éviter les noms de fichiers vides ou ne commençant/finissant par un point
     sanitized = sanitized.strip('._')
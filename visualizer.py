@@ -24,28 +24,46 @@ def calculate_ascent_speed(df: pd.DataFrame) -> pd.Series:
     Note:
         Le premier point a une vitesse de 0 (pas de point précédent)
     """
-    # Initialiser avec des zéros
-    speeds = np.zeros(len(df))
+    depths, times = _profile_arrays(df)
+    return pd.Series(_ascent_speeds(depths, times), index=df.index)
 
-    # Calculer les différences de profondeur et de temps
+
+def _profile_arrays(df: pd.DataFrame) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Extrait une fois les profondeurs et les temps du profil en tableaux NumPy.
+
+    Les calculs internes (vitesses, paliers, graphique) travaillent sur ces
+    tableaux plutôt que de relire les colonnes du DataFrame chacun de leur côté.
+
+    Args:
+        df: DataFrame avec colonnes temps_secondes et profondeur_metres
+
+    Returns:
+        Tuple (profondeurs en m, temps en s), en float
+    """
+    depths = df['profondeur_metres'].to_numpy(dtype=float)
+    times = df['temps_secondes'].to_numpy(dtype=float)
+    return depths, times
+
+
+def _ascent_speeds(depths: np.ndarray, times: np.ndarray) -> np.ndarray:
+    """Vitesses de remontée en m/min (voir calculate_ascent_speed)."""
+    speeds = np.zeros(len(depths))
+
+    # Différences de profondeur et de temps entre points consécutifs
     # Note: En remontée, profondeur diminue, donc Δprofondeur est négatif
     # On inverse le signe pour avoir vitesse positive = remontée
-    for i in range(1, len(df)):
-        delta_depth = df['profondeur_metres'].iloc[i] - df['profondeur_metres'].iloc[i-1]
-        delta_time = df['temps_secondes'].iloc[i] - df['temps_secondes'].iloc[i-1]
-
-        if delta_time > 0:
-            # Vitesse en m/s, puis convertir en m/min
-            # Inverser le signe : remontée (prof diminue) = vitesse positive
-            speed_ms = -delta_depth / delta_time
-            speeds[i] = speed_ms * 60  # Convertir en m/min
-        else:
-            speeds[i] = 0
+    delta_depth = np.diff(depths)
+    delta_time = np.diff(times)
+
+    # Vitesse en m/s convertie en m/min ; 0 si le temps n'avance pas
+    valid = delta_time > 0
+    speeds[1:][valid] = -delta_depth[valid] / delta_time[valid] * 60
 
     # Clipper les valeurs aberrantes (max 30 m/min est déjà très rapide)
-    speeds = np.clip(speeds, -30, 30)
+    np.clip(speeds, -30, 30, out=speeds)
 
-    return pd.Series(speeds, index=df.index)
+    return speeds
 
 
 def detect_safety_stops(df: pd.DataFrame) -> list[dict]:
@@ -66,49 +84,135 @@ def detect_safety_stops(df: pd.DataFrame) -> list[dict]:
         - temps_fin: Temps de fin du palier (s)
         - duree: Durée du palier (s)
     """
+    return _safety_stops(*_profile_arrays(df))
+
+
+def _safety_stops(depths: np.ndarray, times: np.ndarray) -> list[dict]:
+    """Paliers de sécurité du profil (voir detect_safety_stops)."""
     paliers = []
 
     # Paramètres de détection
     DEPTH_TOLERANCE = 1.5  # ± 1.5m
     MIN_DURATION = 30  # 30 secondes minimum
 
-    i = 0
-    while i < len(df) - 1:
-        # Profondeur de référence
-        ref_depth = df['profondeur_metres'].iloc[i]
-        start_time = df['temps_secondes'].iloc[i]
-
-        # Chercher combien de temps on reste à cette profondeur
-        j = i + 1
-        while j < len(df):
-            current_depth = df['profondeur_metres'].iloc[j]
-            if abs(current_depth - ref_depth) > DEPTH_TOLERANCE:
-                break
-            j += 1
-
-        # Calculer la durée
-        end_time = df['temps_secondes'].iloc[j-1]
-        duration = end_time - start_time
-
-        # Si c'est un palier valide (durée suffisante)
-        if duration >= MIN_DURATION:
-            # Calculer profondeur moyenne sur le segment
-            avg_depth = df['profondeur_metres'].iloc[i:j].mean()
-
-            paliers.append({
-                'prof_moyenne': avg_depth,
-                'temps_debut': start_time,
-                'temps_fin': end_time,
-                'duree': duration
-            })
-
-            i = j  # Avancer après le palier
-        else:
-            i += 1  # Avancer d'un point
+    n = len(depths)
+    if n < 2:
+        return paliers
+
+    # Pour chaque point de départ i : fin (exclue) du segment restant à
+    # ± DEPTH_TOLERANCE de la profondeur de référence depths[i]
+    ends = _tolerance_run_ends(depths, DEPTH_TOLERANCE)
+    durations = times[ends - 1] - times
+    candidates = np.flatnonzero(durations[:n - 1] >= MIN_DURATION)
+
+    # Parcours glouton : premier départ valide, puis reprise après le palier
+    stop_starts = []
+    k = 0
+    while k < len(candidates):
+        i = candidates[k]
+        stop_starts.append(i)
+        k = np.searchsorted(candidates, ends[i])
+
+    if not stop_starts:
+        return paliers
+
+    # Profondeurs moyennes de tous les paliers en une réduction : bornes
+    # [début, fin) entrelacées, une somme sur deux correspond à un palier.
+    # Les mesures manquantes (NaN) sont ignorées, comme par pandas .mean()
+    stop_starts = np.array(stop_starts)
+    stop_ends = ends[stop_starts]
+    bounds = np.column_stack((stop_starts, stop_ends)).ravel()
+    if bounds[-1] == n:
+        bounds = bounds[:-1]
+    measured = ~np.isnan(depths)
+    depth_sums = np.add.reduceat(np.where(measured, depths, 0.0), bounds)[::2]
+    depth_counts = np.add.reduceat(measured, bounds)[::2]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        mean_depths = depth_sums / depth_counts
+
+    for i, j, avg_depth in zip(stop_starts, stop_ends, mean_depths):
+        paliers.append({
+            'prof_moyenne': avg_depth,
+            'temps_debut': times[i],
+            'temps_fin': times[j - 1],
+            'duree': durations[i]
+        })
 
     return paliers
 
 
+def _tolerance_run_ends(values: np.ndarray, tolerance: float) -> np.ndarray:
+    """
+    Calcule, pour chaque indice i, la fin du segment où les valeurs restent
+    à ± tolerance de values[i].
+
+    Tables min/max par puissances de deux, puis extension de tous les
+    segments en parallèle par sauts décroissants : O(n log n), sans boucle
+    par point.
+
+    Une valeur manquante (NaN) ne sort jamais de la tolérance (la
+    comparaison avec NaN est fausse) : elle prolonge le segment, et un
+    segment partant d'un NaN va jusqu'à la fin du tableau.
+
+    Args:
+        values: Tableau des valeurs (profondeurs)
+        tolerance: Écart maximal toléré par rapport à la valeur de départ
+
+    Returns:
+        Tableau d'indices j (exclus) : values[i:j] est dans la tolérance et
+        values[j] ne l'est pas (ou j == len(values))
+    """
+    n = len(values)
+
+    # maxima[p][k] / minima[p][k] : max / min de values[k:k + 2**p], NaN
+    # exclus (-inf / +inf : une fenêtre de NaN reste dans la tolérance)
+    missing = np.isnan(values)
+    maxima = [np.where(missing, -np.inf, values)]
+    minima = [np.where(missing, np.inf, values)]
+    while 2 ** len(maxima) <= n:
+        half = 2 ** (len(maxima) - 1)
+        maxima.append(np.maximum(maxima[-1][:-half], maxima[-1][half:]))
+        minima.append(np.minimum(minima[-1][:-half], minima[-1][half:]))
+
+    ends = np.arange(1, n + 1)
+    for p in range(len(maxima) - 1, -1, -1):
+        step = 2 ** p
+        # Segments pouvant encore s'étendre de 2**p points
+        idx = np.flatnonzero(ends + step <= n)
+        pos = ends[idx]
+        ref = values[idx]
+        fits = (maxima[p][pos] - ref <= tolerance) & (ref - minima[p][pos] <= tolerance)
+        ends[idx[fits]] += step
+
+    ends[missing] = n
+    return ends
+
+
+def _gap_separated_indices(
+    starts: np.ndarray,
+    ends: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, int]:
+    """
+    Indices pour mettre bout à bout des segments [début, fin] séparés par un trou.
+
+    Args:
+        starts: Indices de début des segments
+        ends: Indices de fin des segments (inclus)
+
+    Returns:
+        Tuple (src, dst, size) : out[dst] = values[src] place chaque segment
+        dans un tableau de taille size, une case vide (NaN) entre deux segments
+    """
+    lengths = ends - starts + 1
+    # Position de chaque segment dans le tableau de sortie (+1 : le trou)
+    offsets = np.cumsum(lengths + 1) - (lengths + 1)
+    within = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+
+    src = np.repeat(starts, lengths) + within
+    dst = np.repeat(offsets, lengths) + within
+    return src, dst, int(lengths.sum() + len(lengths) - 1)
+
+
 def plot_depth_profile(df: pd.DataFrame) -> go.Figure:
     """
     Crée un graphique du profil de profondeur de la plongée avec analyse avancée.
@@ -126,78 +230,74 @@ def plot_depth_profile(df: pd.DataFrame) -> go.Figure:
     - Annotation profondeur maximale
     - Annotations des paliers de sécurité détectés
     """
+    # Profondeurs et temps extraits une seule fois pour tous les calculs
+    depths, times = _profile_arrays(df)
+
     # Convertir le temps de secondes en minutes
-    temps_minutes = df['temps_secondes'] / 60
+    temps_minutes = times / 60
 
     # Calculer les vitesses de remontée
-    speeds = calculate_ascent_speed(df)
+    speed_values = _ascent_speeds(depths, times)
 
     # Créer la figure
     fig = go.Figure()
 
-    # Tracker pour savoir si on a déjà ajouté chaque couleur à la légende
-    legend_added = {'blue': False, 'orange': False, 'red': False}
-
     # Créer des segments colorés selon la vitesse de remontée
     # Bleu: < 10 m/min, Orange: 10-15 m/min, Rouge: > 15 m/min
-    i = 0
-    while i < len(df):
-        # Déterminer la couleur et le label du segment actuel
-        speed = speeds.iloc[i]
-
-        if speed < 10:
-            color = '#1f77b4'  # Bleu
-            color_key = 'blue'
-            speed_label = '🔵 Vitesse OK (< 10 m/min)'
-        elif speed < 15:
-            color = '#ff7f0e'  # Orange
-            color_key = 'orange'
-            speed_label = '🟠 Vitesse élevée (10-15 m/min)'
-        else:
-            color = '#d62728'  # Rouge
-            color_key = 'red'
-            speed_label = '🔴 Vitesse excessive (> 15 m/min)'
-
-        # Trouver la fin du segment de même couleur
-        j = i + 1
-        while j < len(df):
-            next_speed = speeds.iloc[j]
-            if (next_speed < 10 and speed >= 10) or \
-               (next_speed >= 10 and next_speed < 15 and (speed < 10 or speed >= 15)) or \
-               (next_speed >= 15 and speed < 15):
-                break
-            j += 1
-
-        # Déterminer si on affiche cette entrée dans la légende
-        show_legend = not legend_added[color_key]
-        if show_legend:
-            legend_added[color_key] = True
-
-        # Créer la trace pour ce segment avec hover personnalisé pour chaque point
-        segment_speeds = speeds.iloc[i:j+1]
-        hover_texts = [f'Temps: {t:.1f} min | Prof: {p:.1f} m | Vitesse: {s:.1f} m/min'
-                       for t, p, s in zip(temps_minutes.iloc[i:j+1],
-                                          df['profondeur_metres'].iloc[i:j+1],
-                                          segment_speeds)]
-
+    speed_styles = (
+        ('#1f77b4', '🔵 Vitesse OK (< 10 m/min)'),
+        ('#ff7f0e', '🟠 Vitesse élevée (10-15 m/min)'),
+        ('#d62728', '🔴 Vitesse excessive (> 15 m/min)'),
+    )
+    buckets = np.digitize(speed_values, [10.0, 15.0])  # 0 / 1 / 2
+
+    # Début et fin (point partagé avec le segment suivant) de chaque
+    # segment de même couleur
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(buckets)) + 1))[:len(depths)]
+    ends = np.append(starts[1:], len(depths) - 1)
+
+    # Valeurs arrondies à la précision utile (≈ 0,1 s, 1 cm, 0,1 m/min) :
+    # la figure est sérialisée en JSON, des nombres courts l'allègent
+    x_values = np.round(temps_minutes, 3)
+    y_values = np.round(depths, 2)
+    hover_speeds = np.round(speed_values, 1)
+
+    # Survol formaté par Plotly côté navigateur : temps et profondeur sont
+    # déjà x / y, la vitesse est passée en customdata
+    hover_template = ('Temps: %{x:.1f} min | Prof: %{y:.1f} m | '
+                      'Vitesse: %{customdata:.1f} m/min<extra></extra>')
+
+    # Une trace par couleur (dans l'ordre d'apparition, pour la légende) :
+    # les segments d'une même couleur sont séparés par des NaN, que Plotly
+    # affiche comme des coupures de ligne
+    segment_buckets = buckets[starts]
+    first_seen = np.unique(segment_buckets, return_index=True)[1]
+    for bucket in segment_buckets[np.sort(first_seen)]:
+        color, speed_label = speed_styles[bucket]
+        in_bucket = segment_buckets == bucket
+        src, dst, size = _gap_separated_indices(starts[in_bucket], ends[in_bucket])
+
+        x_trace, y_trace, speed_trace = (np.full(size, np.nan) for _ in range(3))
+        x_trace[dst] = x_values[src]
+        y_trace[dst] = y_values[src]
+        speed_trace[dst] = hover_speeds[src]
+
+        # Trace de cette couleur avec hover personnalisé pour chaque point
         trace = go.Scatter(
-            x=temps_minutes.iloc[i:j+1],
-            y=df['profondeur_metres'].iloc[i:j+1],
+            x=x_trace,
+            y=y_trace,
             mode='lines',
             name=speed_label,
             line=dict(color=color, width=2),
-            showlegend=show_legend,
-            hovertext=hover_texts,
-            hovertemplate='%{hovertext}<extra></extra>'
+            customdata=speed_trace,
+            hovertemplate=hover_template
         )
         fig.add_trace(trace)
 
-        i = j
-
     # Trouver et annoter la profondeur maximale
-    max_depth_idx = df['profondeur_metres'].idxmax()
-    max_depth = df['profondeur_metres'].iloc[max_depth_idx]
-    max_depth_time = temps_minutes.iloc[max_depth_idx]
+    max_depth_idx = np.nanargmax(depths)
+    max_depth = depths[max_depth_idx]
+    max_depth_time = temps_minutes[max_depth_idx]
 
     fig.add_annotation(
         x=max_depth_time,
@@ -217,7 +317,7 @@ def plot_depth_profile(df: pd.DataFrame) -> go.Figure:
     )
 
     # Détecter et afficher les paliers de sécurité (rectangles transparents)
-    paliers = detect_safety_stops(df)
+    paliers = _safety_stops(depths, times)
 
     for palier in paliers:
         # Convertir les temps en minutes
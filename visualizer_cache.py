@@ -0,0 +1,35 @@
+"""
+Calculs du module visualizer mis en cache pour les pages Streamlit.
+
+Partagés par les pages Analyse et Journal : Streamlit hache le DataFrame du
+profil, si bien qu'un même profil n'est calculé qu'une fois entre les reruns,
+quelle que soit la page qui l'affiche.
+"""
+
+import pandas as pd
+import streamlit as st
+
+import visualizer
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def depth_profile_figure(df: pd.DataFrame):
+    """
+    Graphique du profil de plongée, mis en cache entre les reruns.
+
+    Le graphique (vitesses, paliers, segments colorés) n'est reconstruit que
+    pour un nouveau profil.
+    """
+    return visualizer.plot_depth_profile(df)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def ascent_speeds(df: pd.DataFrame) -> pd.Series:
+    """Vitesses de remontée du profil, mises en cache entre les reruns."""
+    return visualizer.calculate_ascent_speed(df)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def safety_stops(df: pd.DataFrame) -> list:
+    """Paliers de sécurité du profil, mis en cache entre les reruns."""
+    return visualizer.detect_safety_stops(df)